@@ -0,0 +1 @@
+"""e_lims_core benchmarks."""
@@ -0,0 +1,173 @@
+"""Command line interface of the benchmark suite.
+
+Run the suite and store the results:
+
+    python -m benchmarks run --trays 1 10 100 1000 --fill 0 1 --output results.json
+
+Compare a run against a stored baseline, exits with status 1 on regression:
+
+    python -m benchmarks compare baseline.json results.json --threshold 0.1
+
+Report the memory footprints:
+
+    python -m benchmarks memory --devices 10000 --trays 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from itertools import product
+from pathlib import Path
+
+from benchmarks.memory import REFERENCE_DEVICES, REFERENCE_TRAYS, memory_report
+from benchmarks.suite import (
+    BENCHMARKS,
+    DEFAULT_FILLS,
+    DEFAULT_THRESHOLD,
+    DEFAULT_TRAYS,
+    Comparison,
+    Result,
+    Scale,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def format_result(result: Result) -> str:
+    """Format a result as a table line.
+
+    Args:
+    ----
+        result (Result): The result.
+
+    Returns:
+    -------
+        str: The table line.
+
+    """
+    return (
+        f'{result.name:<36}{result.trays:>8}{result.fill:>6.2f}{result.best * 1e3:>12.3f}{result.median * 1e3:>12.3f}'
+    )
+
+
+def format_comparison(comparison: Comparison) -> str:
+    """Format a comparison as a table line.
+
+    Args:
+    ----
+        comparison (Comparison): The comparison.
+
+    Returns:
+    -------
+        str: The table line.
+
+    """
+    current = comparison.current
+    flag = 'REGRESSION' if comparison.is_regression else ''
+    return f'{current.name:<36}{current.trays:>8}{current.fill:>6.2f}{comparison.ratio:>10.2f}x  {flag}'
+
+
+def run(arguments: argparse.Namespace) -> int:
+    """Run the benchmarks and write the results.
+
+    Args:
+    ----
+        arguments (argparse.Namespace): The command line arguments.
+
+    Returns:
+    -------
+        int: The exit status.
+
+    """
+    scales = [Scale(trays, fill) for trays, fill in product(arguments.trays, arguments.fill)]
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run_benchmarks(scales, Path(workdir), arguments.benchmark, arguments.repeat)
+    sys.stdout.write(f'{"benchmark":<36}{"trays":>8}{"fill":>6}{"best [ms]":>12}{"median [ms]":>12}\n')
+    sys.stdout.writelines(f'{format_result(result)}\n' for result in results)
+    if arguments.output:
+        save_results(results, arguments.output)
+    return 0
+
+
+def compare(arguments: argparse.Namespace) -> int:
+    """Compare a run against a baseline.
+
+    Args:
+    ----
+        arguments (argparse.Namespace): The command line arguments.
+
+    Returns:
+    -------
+        int: The exit status, 1 if a regression is found.
+
+    """
+    comparisons = compare_results(
+        load_results(arguments.baseline), load_results(arguments.current), arguments.threshold
+    )
+    sys.stdout.write(f'{"benchmark":<36}{"trays":>8}{"fill":>6}{"ratio":>11}\n')
+    sys.stdout.writelines(f'{format_comparison(comparison)}\n' for comparison in comparisons)
+    return int(any(comparison.is_regression for comparison in comparisons))
+
+
+def memory(arguments: argparse.Namespace) -> int:
+    """Report the memory footprints.
+
+    Args:
+    ----
+        arguments (argparse.Namespace): The command line arguments.
+
+    Returns:
+    -------
+        int: The exit status.
+
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        report = memory_report(Path(workdir), arguments.devices, arguments.trays)
+    sys.stdout.writelines(f'{name:<24}{size:>16,.0f} B\n' for name, size in report.items())
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line and run the requested command.
+
+    Args:
+    ----
+        argv (list[str] | None): The command line arguments, sys.argv by default.
+
+    Returns:
+    -------
+        int: The exit status.
+
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='e_lims_core benchmark suite.')
+    commands = parser.add_subparsers(required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmarks.')
+    run_parser.add_argument('--trays', type=int, nargs='+', default=DEFAULT_TRAYS, help='Numbers of trays.')
+    run_parser.add_argument('--fill', type=float, nargs='+', default=DEFAULT_FILLS, help='Tray fill ratios.')
+    run_parser.add_argument('--benchmark', choices=list(BENCHMARKS), action='append', help='Benchmarks to run.')
+    run_parser.add_argument('--repeat', type=int, default=5, help='Timed runs per benchmark.')
+    run_parser.add_argument('--output', type=Path, help='JSON file to write the results to.')
+    run_parser.set_defaults(command=run)
+
+    compare_parser = commands.add_parser('compare', help='Compare results against a baseline.')
+    compare_parser.add_argument('baseline', type=Path, help='JSON file of the baseline results.')
+    compare_parser.add_argument('current', type=Path, help='JSON file of the current results.')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Tolerated slowdown.')
+    compare_parser.set_defaults(command=compare)
+
+    memory_parser = commands.add_parser('memory', help='Report the memory footprints.')
+    memory_parser.add_argument('--devices', type=int, default=REFERENCE_DEVICES, help='Number of devices.')
+    memory_parser.add_argument('--trays', type=int, default=REFERENCE_TRAYS, help='Number of full trays.')
+    memory_parser.set_defaults(command=memory)
+
+    arguments = parser.parse_args(argv)
+    return int(arguments.command(arguments))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Factories building devices and trays at benchmark scales."""
+
+from __future__ import annotations
+
+from itertools import cycle
+
+from e_lims_core.utils.dut.device import Corner, Device, Position
+from e_lims_core.utils.dut.tray import Tray
+
+MAX_COLUMN = 31
+MAX_ROW = 14
+
+
+def make_devices(count: int, tray_number: int = 1, max_column: int = MAX_COLUMN) -> list[Device]:
+    """Create devices with unique names and serials, filling the tray row by row.
+
+    Args:
+    ----
+        count (int): The number of devices.
+        tray_number (int): The tray number, used to make the serials unique across trays.
+        max_column (int): The number of columns of the tray.
+
+    Returns:
+    -------
+        list[Device]: The devices.
+
+    """
+    corners = cycle(Corner)
+    return [
+        Device(
+            number=index + 1,
+            product='ProductX',
+            die='A0',
+            package='R0',
+            serial=f'SN{tray_number}T{index}',
+            corner=next(corners),
+            position=Position(column=index % max_column, row=index // max_column),
+        )
+        for index in range(count)
+    ]
+
+
+def make_tray(number: int, fill: float, max_column: int = MAX_COLUMN, max_row: int = MAX_ROW) -> Tray:
+    """Create a tray filled up to a ratio of its size.
+
+    Args:
+    ----
+        number (int): The tray number.
+        fill (float): The ratio of the tray size holding a device, from 0 (empty) to 1 (full).
+        max_column (int): The maximum number of columns.
+        max_row (int): The maximum number of rows.
+
+    Returns:
+    -------
+        Tray: The tray.
+
+    """
+    count = round(max_column * max_row * fill)
+    return Tray(
+        name='tray',
+        number=number,
+        product='ProductX',
+        devices=make_devices(count, tray_number=number, max_column=max_column),
+        max_column=max_column,
+        max_row=max_row,
+    )
+
+
+def make_trays(count: int, fill: float, max_column: int = MAX_COLUMN, max_row: int = MAX_ROW) -> list[Tray]:
+    """Create a lot of trays filled up to a ratio of their size.
+
+    Args:
+    ----
+        count (int): The number of trays.
+        fill (float): The ratio of the tray size holding a device, from 0 (empty) to 1 (full).
+        max_column (int): The maximum number of columns.
+        max_row (int): The maximum number of rows.
+
+    Returns:
+    -------
+        list[Tray]: The trays.
+
+    """
+    return [make_tray(number, fill, max_column, max_row) for number in range(1, count + 1)]
@@ -0,0 +1,157 @@
+"""Memory footprint harness, based on tracemalloc, for devices, trays and exports."""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+from benchmarks.factories import make_devices, make_trays
+from e_lims_core.utils.dut.export.export2xlsx import Export2Excel
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+T = TypeVar('T')
+
+REFERENCE_DEVICES = 10_000
+REFERENCE_TRAYS = 100
+
+
+@dataclass
+class MemoryUsage:
+    """MemoryUsage class representing the memory allocated by a callable.
+
+    Attributes
+    ----------
+        current (int): The bytes still allocated when the callable returns, its result included.
+        peak (int): The highest number of bytes allocated while the callable ran.
+
+    """
+
+    current: int
+    peak: int
+
+
+def measure(function: Callable[[], T]) -> tuple[T, MemoryUsage]:
+    """Measure the memory allocated by a callable.
+
+    Args:
+    ----
+        function (Callable[[], T]): The callable to measure.
+
+    Returns:
+    -------
+        tuple[T, MemoryUsage]: The result of the callable, kept alive, and its memory usage.
+
+    """
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    try:
+        result = function()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, MemoryUsage(current=current - baseline, peak=peak - baseline)
+
+
+def bytes_per_device(count: int = REFERENCE_DEVICES) -> float:
+    """Measure the memory retained per `Device`, its `Position` included.
+
+    Args:
+    ----
+        count (int): The number of devices to create.
+
+    Returns:
+    -------
+        float: The bytes per device.
+
+    """
+    _, usage = measure(lambda: make_devices(count))
+    return usage.current / count
+
+
+def bytes_per_tray(count: int = REFERENCE_TRAYS, fill: float = 1.0) -> float:
+    """Measure the memory retained per `Tray`, its devices included.
+
+    Args:
+    ----
+        count (int): The number of trays to create.
+        fill (float): The ratio of each tray holding a device.
+
+    Returns:
+    -------
+        float: The bytes per tray.
+
+    """
+    _, usage = measure(lambda: make_trays(count, fill))
+    return usage.current / count
+
+
+def bytes_per_tray_frame(count: int = REFERENCE_TRAYS, fill: float = 1.0) -> float:
+    """Measure the memory retained per `Tray.get_tray` DataFrame.
+
+    Args:
+    ----
+        count (int): The number of trays to render.
+        fill (float): The ratio of each tray holding a device.
+
+    Returns:
+    -------
+        float: The bytes per DataFrame.
+
+    """
+    trays = make_trays(count, fill)
+    trays[0].get_tray()
+    _, usage = measure(lambda: [tray.get_tray() for tray in trays])
+    return usage.current / count
+
+
+def export_excel_peak(workdir: Path, count: int = REFERENCE_TRAYS, fill: float = 1.0) -> int:
+    """Measure the peak memory of `Export2Excel.generate`.
+
+    Args:
+    ----
+        workdir (Path): The directory of the export.
+        count (int): The number of trays to export.
+        fill (float): The ratio of each tray holding a device.
+
+    Returns:
+    -------
+        int: The peak bytes allocated.
+
+    """
+    export = Export2Excel(make_trays(count, fill), FileProps(path=workdir, name='benchmark', suffix=FileSuffix.XLSX))
+    Export2Excel(make_trays(1, fill), FileProps(path=workdir, name='warmup', suffix=FileSuffix.XLSX)).generate()
+    _, usage = measure(export.generate)
+    return usage.peak
+
+
+def memory_report(workdir: Path, devices: int = REFERENCE_DEVICES, trays: int = REFERENCE_TRAYS) -> dict[str, float]:
+    """Measure every memory footprint at the given scale.
+
+    Args:
+    ----
+        workdir (Path): The directory of the exports.
+        devices (int): The number of devices to create.
+        trays (int): The number of full trays to create.
+
+    Returns:
+    -------
+        dict[str, float]: The footprints, in bytes.
+
+    """
+    return {
+        'device': bytes_per_device(devices),
+        'tray': bytes_per_tray(trays),
+        'tray_frame': bytes_per_tray_frame(trays),
+        'export_excel_peak': export_excel_peak(workdir, trays),
+    }
@@ -0,0 +1,295 @@
+"""Benchmark suite for device construction, tray rendering, checks and exports."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+from benchmarks.factories import MAX_COLUMN, MAX_ROW, make_devices, make_trays
+from e_lims_core import __version__
+from e_lims_core.utils.dut.export.export2csv import Export2Csv
+from e_lims_core.utils.dut.export.export2jsonl import Export2Jsonl
+from e_lims_core.utils.dut.export.export2xlsx import Export2Excel
+from e_lims_core.utils.dut.trays import Trays
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from e_lims_core.utils.dut.tray import Tray
+
+    Setup = Callable[['Scale', list[Tray], Path], Callable[[], object]]
+
+DEFAULT_TRAYS = (1, 10, 100)
+DEFAULT_FILLS = (0.0, 0.5, 1.0)
+DEFAULT_THRESHOLD = 0.1
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Scale class representing the size of the lot a benchmark runs on.
+
+    Attributes
+    ----------
+        trays (int): The number of trays.
+        fill (float): The ratio of each tray holding a device, from 0 (empty) to 1 (full).
+
+    """
+
+    trays: int
+    fill: float
+
+
+@dataclass
+class Result:
+    """Result class representing the timings of a benchmark at a scale.
+
+    Attributes
+    ----------
+        name (str): The name of the benchmark.
+        trays (int): The number of trays.
+        fill (float): The ratio of each tray holding a device.
+        repeat (int): The number of timed runs.
+        best (float): The fastest run, in seconds.
+        median (float): The median run, in seconds.
+
+    """
+
+    name: str
+    trays: int
+    fill: float
+    repeat: int
+    best: float
+    median: float
+
+    @property
+    def key(self) -> tuple[str, int, float]:
+        """Get the key identifying the benchmark and its scale.
+
+        Returns
+        -------
+            tuple[str, int, float]: The name, number of trays and fill.
+
+        """
+        return self.name, self.trays, self.fill
+
+
+@dataclass
+class Comparison:
+    """Comparison class representing a result compared against its baseline.
+
+    Attributes
+    ----------
+        baseline (Result): The baseline result.
+        current (Result): The current result.
+        threshold (float): The tolerated slowdown ratio, 0.1 for 10%.
+
+    """
+
+    baseline: Result
+    current: Result
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        """Get the ratio between the current and baseline median timings.
+
+        Returns
+        -------
+            float: The ratio, above 1 when the current run is slower.
+
+        """
+        return self.current.median / self.baseline.median if self.baseline.median else 1.0
+
+    @property
+    def is_regression(self) -> bool:
+        """Check if the current run is slower than tolerated.
+
+        Returns
+        -------
+            bool: True if the slowdown exceeds the threshold.
+
+        """
+        return self.ratio > 1 + self.threshold
+
+
+def _device_construction(scale: Scale, trays: list[Tray], workdir: Path) -> Callable[[], object]:  # noqa: ARG001
+    count = round(MAX_COLUMN * MAX_ROW * scale.fill)
+    return lambda: [make_devices(count, tray_number=number) for number in range(1, scale.trays + 1)]
+
+
+def _get_tray(scale: Scale, trays: list[Tray], workdir: Path) -> Callable[[], object]:  # noqa: ARG001
+    return lambda: [tray.get_tray() for tray in trays]
+
+
+def _get_devices(scale: Scale, trays: list[Tray], workdir: Path) -> Callable[[], object]:  # noqa: ARG001
+    return lambda: [tray.get_devices() for tray in trays]
+
+
+def _trays_get_devices(scale: Scale, trays: list[Tray], workdir: Path) -> Callable[[], object]:  # noqa: ARG001
+    file_props = FileProps(path=workdir / 'trays', name='benchmark', suffix=FileSuffix.CSV)
+    return Trays(trays=trays, file_props=file_props).get_devices
+
+
+def _trays_pack(scale: Scale, trays: list[Tray], workdir: Path) -> Callable[[], object]:  # noqa: ARG001
+    devices = make_devices(round(MAX_COLUMN * MAX_ROW * scale.fill) * scale.trays)
+    file_props = FileProps(path=workdir / 'trays', name='benchmark', suffix=FileSuffix.CSV)
+    return lambda: Trays.pack(devices, 'ProductX', file_props, max_column=MAX_COLUMN, max_row=MAX_ROW)
+
+
+def _check(method: str) -> Setup:
+    def setup(scale: Scale, trays: list[Tray], workdir: Path) -> Callable[[], object]:  # noqa: ARG001
+        return lambda: [getattr(tray, method)() for tray in trays]
+
+    return setup
+
+
+def _export_csv(scale: Scale, trays: list[Tray], workdir: Path) -> Callable[[], object]:  # noqa: ARG001
+    file_props = FileProps(path=workdir / 'csv', name='benchmark', suffix=FileSuffix.CSV)
+    return Export2Csv(trays=trays, file_props=file_props).export
+
+
+def _export_excel(scale: Scale, trays: list[Tray], workdir: Path) -> Callable[[], object]:  # noqa: ARG001
+    file_props = FileProps(path=workdir / 'xlsx', name='benchmark', suffix=FileSuffix.XLSX)
+    return Export2Excel(trays=trays, file_props=file_props).export
+
+
+def _export_jsonl(scale: Scale, trays: list[Tray], workdir: Path) -> Callable[[], object]:  # noqa: ARG001
+    file_props = FileProps(path=workdir / 'jsonl', name='benchmark', suffix=FileSuffix.JSONL)
+    return Export2Jsonl(trays=trays, file_props=file_props).export
+
+
+BENCHMARKS: dict[str, Setup] = {
+    'device.construction': _device_construction,
+    'tray.get_tray': _get_tray,
+    'tray.get_devices': _get_devices,
+    'trays.get_devices': _trays_get_devices,
+    'trays.pack': _trays_pack,
+    'tray.check_tray_size': _check('check_tray_size'),
+    'tray.check_device_name': _check('check_device_name'),
+    'tray.check_device_product': _check('check_device_product'),
+    'tray.check_device_position': _check('check_device_position'),
+    'tray.check_device_position_in_tray': _check('check_device_position_in_tray'),
+    'export.csv': _export_csv,
+    'export.xlsx': _export_excel,
+    'export.jsonl': _export_jsonl,
+}
+
+
+def time_callable(function: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Time a callable, after one untimed warm-up run.
+
+    Args:
+    ----
+        function (Callable[[], object]): The callable to time.
+        repeat (int): The number of timed runs.
+
+    Returns:
+    -------
+        tuple[float, float]: The fastest and median runs, in seconds.
+
+    """
+    function()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), statistics.median(timings)
+
+
+def run_benchmarks(
+    scales: Iterable[Scale], workdir: Path, names: Iterable[str] | None = None, repeat: int = 5
+) -> list[Result]:
+    """Run the benchmarks at every scale.
+
+    Args:
+    ----
+        scales (Iterable[Scale]): The scales to run the benchmarks at.
+        workdir (Path): The directory the exports are written to.
+        names (Iterable[str] | None): The benchmarks to run, all of them by default.
+        repeat (int): The number of timed runs per benchmark and scale.
+
+    Returns:
+    -------
+        list[Result]: The results.
+
+    Raises:
+    ------
+        ValueError: If a benchmark name is unknown.
+
+    """
+    names = list(names) if names is not None else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        msg = f'Unknown benchmark ({", ".join(unknown)}).'
+        raise ValueError(msg)
+    results = []
+    for scale in scales:
+        trays = make_trays(scale.trays, scale.fill)
+        for name in names:
+            best, median = time_callable(BENCHMARKS[name](scale, trays, workdir), repeat)
+            results.append(Result(name, scale.trays, scale.fill, repeat, best, median))
+    return results
+
+
+def save_results(results: list[Result], path: Path) -> None:
+    """Save the results to a JSON file.
+
+    Args:
+    ----
+        results (list[Result]): The results.
+        path (Path): The JSON file.
+
+    """
+    document = {
+        'version': __version__,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(document, indent=2))
+
+
+def load_results(path: Path) -> list[Result]:
+    """Load the results from a JSON file.
+
+    Args:
+    ----
+        path (Path): The JSON file.
+
+    Returns:
+    -------
+        list[Result]: The results.
+
+    """
+    return [Result(**result) for result in json.loads(path.read_text())['results']]
+
+
+def compare_results(
+    baseline: list[Result], current: list[Result], threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """Compare the current results against the baseline results of the same benchmark and scale.
+
+    Args:
+    ----
+        baseline (list[Result]): The baseline results.
+        current (list[Result]): The current results.
+        threshold (float): The tolerated slowdown ratio, 0.1 for 10%.
+
+    Returns:
+    -------
+        list[Comparison]: The comparisons, for the results present in both runs.
+
+    """
+    baseline_per_key = {result.key: result for result in baseline}
+    return [
+        Comparison(baseline_per_key[result.key], result, threshold)
+        for result in current
+        if result.key in baseline_per_key
+    ]
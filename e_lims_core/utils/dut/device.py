@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from enum import Enum
 
+from e_lims_core.utils.validators.policy import validate
+from e_lims_core.utils.validators.registry import VALIDATORS
+
+_check_product = VALIDATORS['product']
+_check_die = VALIDATORS['die']
+_check_package = VALIDATORS['package']
+_check_serial = VALIDATORS['serial']
+
 
 class Corner(Enum):
     """Corner class representing the corner type of a device under test.
@@ -71,7 +78,8 @@ class Device:
     """Represents a device under test (dut).
 
     The device is identified by a product, die, package,
-    serial number, corner, and position.
+    serial number, corner, and position. The formats are checked
+    according to the current `ValidationPolicy`.
 
     Attributes
     ----------
@@ -105,6 +113,35 @@ class Device:
         self.position = position
         self.name = f'{self.corner.value}{self.number}'
 
+    @classmethod
+    def from_validated(
+        cls,
+        number: int,
+        product: str,
+        die: str,
+        package: str,
+        serial: str,
+        corner: Corner,
+        position: Position,
+    ) -> Device:
+        """Create a device from values already validated, skipping the format checks.
+
+        Returns
+        -------
+            Device: The device.
+
+        """
+        device = cls.__new__(cls)
+        device.number = number
+        device._product = product  # noqa: SLF001
+        device._die = die  # noqa: SLF001
+        device._package = package  # noqa: SLF001
+        device._serial = serial  # noqa: SLF001
+        device.corner = corner
+        device.position = position
+        device.name = f'{corner.value}{number}'
+        return device
+
     @property
     def product(self) -> str:
         """Gets the product identifier.
@@ -129,10 +166,7 @@ class Device:
             ValueError: If the product contains invalid characters.
 
         """
-        pattern = r'^[a-zA-Z0-9_-]+$'
-        if not bool(re.match(pattern, product)):
-            msg = f'Invalid product: {product}, authorized characters are alphabetic, numeric, and _-'
-            raise ValueError(msg)
+        validate(_check_product, product)
         self._product = product
 
     @property
@@ -159,10 +193,7 @@ class Device:
             ValueError: If the die does not follow the pattern of one alphabetic character followed by an integer.
 
         """
-        pattern = r'^[A-Z](0|[1-9][0-9]*)$'
-        if not re.match(pattern, die):
-            msg = f'Invalid die: {die}, authorized one alphabetic follow by integer'
-            raise ValueError(msg)
+        validate(_check_die, die)
         self._die = die
 
     @property
@@ -189,10 +220,7 @@ class Device:
             ValueError: If the package does not follow the pattern of 'R' followed by an integer.
 
         """
-        pattern = r'^[R](0|[1-9][0-9]*)$'
-        if not re.match(pattern, package):
-            msg = f'Invalid package: {package}, authorized R follow by one integer'
-            raise ValueError(msg)
+        validate(_check_package, package)
         self._package = package
 
     @property
@@ -219,10 +247,7 @@ class Device:
             ValueError: If the serial contains invalid characters.
 
         """
-        pattern = r'^[a-zA-Z0-9]+$'
-        if not bool(re.match(pattern, serial)):
-            msg = f'Invalid serial: {serial}, authorized characters are alphabetic and numeric'
-            raise ValueError(msg)
+        validate(_check_serial, serial)
         self._serial = serial
 
     def folder(self) -> str:
@@ -0,0 +1,150 @@
+"""Module used to compare two layouts of devices under test (DUT)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from e_lims_core.utils.dut.device import Device, Position
+
+DIFF_ATTRIBUTES = ('name', 'product', 'die', 'package', 'serial', 'corner')
+
+
+@dataclass
+class DeviceMove:
+    """DeviceMove class representing a device found at another position.
+
+    Attributes
+    ----------
+        device (Device): The device, in its new layout.
+        source (Position): The position in the previous layout.
+        target (Position): The position in the new layout.
+
+    """
+
+    device: Device
+    source: Position
+    target: Position
+
+
+@dataclass
+class DeviceChange:
+    """DeviceChange class representing a device whose attributes changed.
+
+    Attributes
+    ----------
+        before (Device): The device in the previous layout.
+        after (Device): The device in the new layout.
+        attributes (list[str]): The names of the attributes that changed.
+
+    """
+
+    before: Device
+    after: Device
+    attributes: list[str]
+
+
+@dataclass
+class TrayDiff:
+    """TrayDiff class representing the differences between two layouts of a tray.
+
+    A device both moved and changed is listed in `moved` and in `changed`.
+
+    Attributes
+    ----------
+        added (list[Device]): The devices only found in the new layout.
+        removed (list[Device]): The devices only found in the previous layout.
+        moved (list[DeviceMove]): The devices found at another position.
+        changed (list[DeviceChange]): The devices whose attributes changed.
+
+    """
+
+    added: list[Device] = field(default_factory=list)
+    removed: list[Device] = field(default_factory=list)
+    moved: list[DeviceMove] = field(default_factory=list)
+    changed: list[DeviceChange] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if both layouts are identical.
+
+        Returns
+        -------
+            bool: True if no difference was found, False otherwise.
+
+        """
+        return not (self.added or self.removed or self.moved or self.changed)
+
+
+def _match_devices(
+    before: Sequence[Device],
+    after: Sequence[Device],
+) -> tuple[list[tuple[Device, Device]], list[Device], list[Device]]:
+    """Match the devices of two layouts by name, then the remaining ones by serial number.
+
+    Args:
+    ----
+        before (Sequence[Device]): The devices of the previous layout.
+        after (Sequence[Device]): The devices of the new layout.
+
+    Returns:
+    -------
+        tuple[list, list, list]: The matched pairs, the added devices and the removed devices.
+
+    """
+    names: dict[str, Device] = {}
+    for device in before:
+        names.setdefault(device.name, device)
+    matched: dict[int, tuple[Device, Device]] = {}
+    unmatched: list[Device] = []
+    for device in after:
+        previous = names.get(device.name)
+        if previous is not None and id(previous) not in matched:
+            matched[id(previous)] = (previous, device)
+        else:
+            unmatched.append(device)
+
+    serials: dict[str, list[Device]] = {}
+    for device in reversed(before):
+        if id(device) not in matched:
+            serials.setdefault(device.serial, []).append(device)
+    added = []
+    for device in unmatched:
+        candidates = serials.get(device.serial)
+        if candidates:
+            previous = candidates.pop()
+            matched[id(previous)] = (previous, device)
+        else:
+            added.append(device)
+    removed = [device for device in before if id(device) not in matched]
+    return list(matched.values()), added, removed
+
+
+def diff_devices(before: Sequence[Device], after: Sequence[Device]) -> TrayDiff:
+    """Compare two layouts of devices in time linear in the number of devices.
+
+    The devices are matched by name first, the remaining ones by serial number, with hash joins.
+    The first device wins when several share a name or a serial number.
+
+    Args:
+    ----
+        before (Sequence[Device]): The devices of the previous layout.
+        after (Sequence[Device]): The devices of the new layout.
+
+    Returns:
+    -------
+        TrayDiff: The differences, the devices matched by name before the ones matched by serial number.
+
+    """
+    matched, added, removed = _match_devices(before, after)
+    result = TrayDiff(added=added, removed=removed)
+    for previous, device in matched:
+        if previous.position != device.position:
+            result.moved.append(DeviceMove(device, previous.position, device.position))
+        attributes = [name for name in DIFF_ATTRIBUTES if getattr(previous, name) != getattr(device, name)]
+        if attributes:
+            result.changed.append(DeviceChange(previous, device, attributes))
+    return result
@@ -1,11 +1,27 @@
-"""Device under test export module."""
+"""Device under test export module.
+
+The exports are registered per `FileSuffix`, so `Trays.export` dispatches to any of them.
+The built-in exports are imported on first use only.
+"""
 
 from __future__ import annotations
 
+import gzip
 from abc import ABC, abstractmethod
+from importlib import import_module
+from typing import TYPE_CHECKING, ClassVar
 
 from e_lims_core.utils.dut.tray import Tray
-from e_lims_core.utils.files.file_props import FileProps
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix, call_with_directory
+from e_lims_core.utils.metrics.instrumentation import span
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from typing import BinaryIO
+
+BUFFER_SIZE = 1 << 20
+COMPRESS_LEVEL = 6
 
 
 class Export(ABC):
@@ -33,3 +49,246 @@ class Export(ABC):
     @abstractmethod
     def export(self) -> None:
         """Export the trays to file/s."""
+
+
+class StreamingExport(Export):
+    """Represents abstract class for exporting each tray to its own file, chunk by chunk.
+
+    A backend only produces the chunks of a tray, the planning of the files, the buffering,
+    the compression and the parallelism are shared. The trays are generated one at a time,
+    so the memory needed does not grow with the number of trays. A backend setting
+    `single_file` writes every tray in turn to a single file named after the file properties.
+
+    Attributes
+    ----------
+        trays (list[Tray]): The trays to export.
+        file_props (FileProps): The file properties.
+        compress (bool): True to compress the files with gzip, adding `.gz` to their suffix.
+        max_workers (int | None): The number of threads writing files, None or 1 to write them in turn.
+        buffer_size (int): The number of bytes gathered before each write.
+
+    """
+
+    suffix: ClassVar[FileSuffix]
+    phase: ClassVar[str]
+    single_file: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        trays: list[Tray],
+        file_props: FileProps,
+        *,
+        compress: bool = False,
+        max_workers: int | None = None,
+        buffer_size: int = BUFFER_SIZE,
+    ) -> None:
+        """Initialize the StreamingExport object.
+
+        Args:
+        ----
+            trays (list[Tray]): The trays to export.
+            file_props (FileProps): The file properties.
+            compress (bool): True to compress the files with gzip, adding `.gz` to their suffix.
+            max_workers (int | None): The number of threads writing files, None or 1 to write them in turn.
+            buffer_size (int): The number of bytes gathered before each write.
+
+        """
+        super().__init__(trays, file_props)
+        self.compress = compress
+        self.max_workers = max_workers
+        self.buffer_size = buffer_size
+
+    @abstractmethod
+    def iter_chunks(self, tray: Tray) -> Iterator[bytes]:
+        """Produce the content of the file of a tray.
+
+        The work done before returning the iterator is timed as the generate phase, the
+        iteration as the write phase.
+
+        Args:
+        ----
+            tray (Tray): The tray.
+
+        Returns:
+        -------
+            Iterator[bytes]: The chunks of the file, in order.
+
+        """
+
+    def targets(self) -> dict[Path, list[Tray]]:
+        """Plan the file of every tray, see `FileProps.plan`.
+
+        Returns
+        -------
+            dict[Path, list[Tray]]: The trays per file path, every tray of a `single_file` backend
+                shares the file.
+
+        Raises
+        ------
+            ValueError: If several trays would be written to the same file.
+
+        """
+        if self.single_file:
+            plan = self.file_props.plan([self.file_props.name], self.suffix)
+            trays = {self.file_props.name: self.trays}
+        else:
+            plan = self.file_props.plan([tray.name for tray in self.trays], self.suffix)
+            plan.raise_for_collisions()
+            trays = {tray.name: [tray] for tray in self.trays}
+        targets: dict[Path, list[Tray]] = {}
+        for name, path in plan.targets.items():
+            target = path.with_name(f'{path.name}.gz') if self.compress else path
+            targets[target] = trays[name]
+        return targets
+
+    def export(self) -> None:
+        """Export the trays, one file per tray named after it."""
+        targets = self.targets()
+        if not self.max_workers or self.max_workers == 1 or len(targets) < 2:
+            for path, trays in targets.items():
+                self.export_trays(trays, path)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for future in [executor.submit(self.export_trays, trays, path) for path, trays in targets.items()]:
+                future.result()
+
+    def export_trays(self, trays: list[Tray], path: Path) -> None:
+        """Export trays to the same file, in turn.
+
+        Args:
+        ----
+            trays (list[Tray]): The trays.
+            path (Path): The file.
+
+        """
+        if self.single_file:
+            with span(f'{self.phase}.write', trays=len(trays)) as current:
+                with self.open(path) as file:
+                    for tray in trays:
+                        self.write_chunks(self.generate_chunks(tray), file)
+                current.record_file(path)
+            return
+        for tray in trays:
+            chunks = self.generate_chunks(tray)
+            with span(f'{self.phase}.write', tray=tray.name) as current:
+                with self.open(path) as file:
+                    self.write_chunks(chunks, file)
+                current.record_file(path)
+
+    def generate_chunks(self, tray: Tray) -> Iterator[bytes]:
+        """Start producing the content of a tray, see `iter_chunks`.
+
+        Args:
+        ----
+            tray (Tray): The tray.
+
+        Returns:
+        -------
+            Iterator[bytes]: The chunks of the tray, in order.
+
+        """
+        with span(f'{self.phase}.generate', tray=tray.name):
+            return self.iter_chunks(tray)
+
+    def open(self, path: Path) -> BinaryIO:
+        """Open a file for writing, compressed at `COMPRESS_LEVEL` if required.
+
+        The directory of the file is created again if it was removed, see `call_with_directory`.
+
+        Args:
+        ----
+            path (Path): The file.
+
+        Returns:
+        -------
+            BinaryIO: The file object.
+
+        """
+        return call_with_directory(path, self._open_file)
+
+    def _open_file(self, path: Path) -> BinaryIO:
+        """Open a file for writing, compressed at `COMPRESS_LEVEL` if required.
+
+        Args:
+        ----
+            path (Path): The file.
+
+        Returns:
+        -------
+            BinaryIO: The file object.
+
+        """
+        if self.compress:
+            return gzip.open(path, 'wb', compresslevel=COMPRESS_LEVEL)  # type: ignore[return-value]
+        return path.open('wb')
+
+    def write_chunks(self, chunks: Iterator[bytes], file: BinaryIO) -> None:
+        """Write chunks to a file, gathered in writes of about `buffer_size` bytes.
+
+        Args:
+        ----
+            chunks (Iterator[bytes]): The chunks.
+            file (BinaryIO): The file object.
+
+        """
+        buffer: list[bytes] = []
+        size = 0
+        for chunk in chunks:
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= self.buffer_size:
+                file.write(b''.join(buffer))
+                buffer.clear()
+                size = 0
+        if buffer:
+            file.write(b''.join(buffer))
+
+
+EXPORTS: dict[FileSuffix, type[Export] | str] = {
+    FileSuffix.CSV: 'e_lims_core.utils.dut.export.export2csv:Export2Csv',
+    FileSuffix.XLSX: 'e_lims_core.utils.dut.export.export2xlsx:Export2Excel',
+    FileSuffix.JSONL: 'e_lims_core.utils.dut.export.export2jsonl:Export2Jsonl',
+}
+
+
+def register_export(suffix: FileSuffix, export: type[Export] | str) -> None:
+    """Register the export of a suffix, replacing the previous one.
+
+    Args:
+    ----
+        suffix (FileSuffix): The suffix.
+        export (type[Export] | str): The export class, or its 'module:class' path to import it on first use.
+
+    """
+    EXPORTS[suffix] = export
+
+
+def get_export(suffix: FileSuffix) -> type[Export]:
+    """Get the export of a suffix, importing it on first use.
+
+    Args:
+    ----
+        suffix (FileSuffix): The suffix.
+
+    Returns:
+    -------
+        type[Export]: The export class.
+
+    Raises:
+    ------
+        ValueError: If no export is registered for the suffix.
+
+    """
+    export = EXPORTS.get(suffix)
+    if export is None:
+        msg = f'No export registered for suffix {suffix.value}'
+        raise ValueError(msg)
+    if not isinstance(export, str):
+        return export
+    module, _, name = export.partition(':')
+    export_class: type[Export] = getattr(import_module(module), name)
+    EXPORTS[suffix] = export_class
+    return export_class
@@ -4,37 +4,115 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from e_lims_core.utils.dut.export.export import Export
+from e_lims_core.utils.dut.export.export import BUFFER_SIZE, StreamingExport
 from e_lims_core.utils.dut.tray import Tray
 from e_lims_core.utils.files.file_props import FileProps, FileSuffix
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import pandas as pd
 
 
-class Export2Csv(Export):
+class Export2Csv(StreamingExport):
     """Represents a class for exporting trays of devices under test (DUT) to CSV.
 
     Attributes
     ----------
         trays (list[Tray]): The trays to export.
         file_props (FileProps): The file properties.
+        sparse (bool): True to only build the occupied cells, for large and sparsely populated trays.
 
     """
 
-    def __init__(self, trays: list[Tray], file_props: FileProps) -> None:
-        """Initialize the Trays2Csv object."""
-        self.trays = trays
-        self.file_props = file_props
+    suffix = FileSuffix.CSV
+    phase = 'export2csv'
+
+    def __init__(
+        self,
+        trays: list[Tray],
+        file_props: FileProps,
+        *,
+        sparse: bool = False,
+        compress: bool = False,
+        max_workers: int | None = None,
+        buffer_size: int = BUFFER_SIZE,
+    ) -> None:
+        """Initialize the Trays2Csv object.
+
+        Args:
+        ----
+            trays (list[Tray]): The trays to export.
+            file_props (FileProps): The file properties.
+            sparse (bool): True to only build the occupied cells, for large and sparsely populated trays.
+            compress (bool): True to compress the files with gzip, adding `.gz` to their suffix.
+            max_workers (int | None): The number of threads writing files, None or 1 to write them in turn.
+            buffer_size (int): The number of bytes gathered before each write.
+
+        """
+        super().__init__(trays, file_props, compress=compress, max_workers=max_workers, buffer_size=buffer_size)
         self.file_props.suffix = FileSuffix.CSV
+        self.sparse = sparse
 
     def generate(self) -> dict[str, pd.DataFrame]:
-        """Generate CSV file/s."""
+        """Generate CSV file/s.
+
+        Returns
+        -------
+            dict[str, pd.DataFrame]: The tray grids, or their coordinate lists when sparse, per tray name.
+
+        """
+        if self.sparse:
+            return {tray.name: tray.get_sparse_tray() for tray in self.trays}
         return {tray.name: tray.get_tray() for tray in self.trays}
 
-    def export(self) -> None:
-        """Export the trays to CSV file/s."""
-        data = self.generate()
-        for tray_name, df_tray in data.items():
-            self.file_props.name = tray_name
-            df_tray.to_csv(self.file_props.file_path(), index=True)
+    def iter_chunks(self, tray: Tray) -> Iterator[bytes]:
+        """Produce the CSV file of a tray.
+
+        Args:
+        ----
+            tray (Tray): The tray.
+
+        Returns:
+        -------
+            Iterator[bytes]: The whole grid, or its lines one by one when sparse.
+
+        """
+        if self.sparse:
+            lines = self.sparse_lines(tray, tray.get_sparse_tray())
+            return (line.encode() for line in lines)
+        return iter([tray.get_tray().to_csv(index=True).encode()])
+
+    @staticmethod
+    def sparse_lines(tray: Tray, coordinates: pd.DataFrame) -> Iterator[str]:
+        """Build the lines of the grid of a tray from its coordinate list, in the same layout as the dense export.
+
+        Empty rows are built from a single precomputed line, only the occupied rows are built cell by cell.
+
+        Args:
+        ----
+            tray (Tray): The tray.
+            coordinates (pd.DataFrame): The coordinate list of the tray, from `Tray.get_sparse_tray`.
+
+        Yields:
+        ------
+            str: The lines of the CSV file.
+
+        """
+        import numpy as np
+
+        rows = coordinates['row'].to_numpy()
+        columns = coordinates['column'].to_numpy()
+        names = coordinates['name'].to_numpy()
+        bounds = np.searchsorted(rows, np.arange(tray.max_row + 1))
+        empty = ',' * tray.max_column
+        yield f',{",".join(map(str, range(tray.max_column)))}\n'
+        for row in range(tray.max_row):
+            start, end = bounds[row], bounds[row + 1]
+            if start == end:
+                yield f'{row}{empty}\n'
+                continue
+            cells = [''] * tray.max_column
+            for column, name in zip(columns[start:end], names[start:end], strict=True):
+                cells[column] = name
+            yield f'{row},{",".join(cells)}\n'
@@ -0,0 +1,129 @@
+"""Device under test export to JSON Lines module."""
+
+from __future__ import annotations
+
+from functools import cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+from e_lims_core.utils.dut.export.export import BUFFER_SIZE, StreamingExport
+from e_lims_core.utils.files.file_props import FileSuffix
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from e_lims_core.utils.dut.device import Device
+    from e_lims_core.utils.dut.tray import Tray
+    from e_lims_core.utils.files.file_props import FileProps
+
+CHUNK_DEVICES = 10_000
+
+
+@cache
+def json_line() -> Callable[[dict[str, object]], bytes]:
+    """Get the encoder of a record as a compact JSON line.
+
+    Returns
+    -------
+        Callable[[dict[str, object]], bytes]: The encoder, based on orjson when installed, on json otherwise.
+
+    """
+    if find_spec('orjson') is not None:
+        import orjson
+
+        option = orjson.OPT_APPEND_NEWLINE
+        return lambda record: orjson.dumps(record, option=option)
+
+    import json
+
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    return lambda record: f'{encode(record)}\n'.encode()
+
+
+class Export2Jsonl(StreamingExport):
+    """Represents a class for exporting trays of devices under test (DUT) to a JSON Lines file.
+
+    The file holds one record per device, with the `LOCATION_HEADINGS` then the `Device.headings`
+    fields, and is named after the file properties.
+
+    Attributes
+    ----------
+        trays (list[Tray]): The trays to export.
+        file_props (FileProps): The file properties.
+
+    """
+
+    suffix = FileSuffix.JSONL
+    phase = 'export2jsonl'
+    single_file = True
+
+    def __init__(
+        self,
+        trays: list[Tray],
+        file_props: FileProps,
+        *,
+        compress: bool = False,
+        buffer_size: int = BUFFER_SIZE,
+    ) -> None:
+        """Initialize the Export2Jsonl object.
+
+        Args:
+        ----
+            trays (list[Tray]): The trays to export.
+            file_props (FileProps): The file properties.
+            compress (bool): True to compress the file with gzip, adding `.gz` to its suffix.
+            buffer_size (int): The number of bytes gathered before each write.
+
+        """
+        super().__init__(trays, file_props, compress=compress, buffer_size=buffer_size)
+        self.file_props.suffix = FileSuffix.JSONL
+
+    def iter_chunks(self, tray: Tray) -> Iterator[bytes]:
+        """Produce the records of the devices of a tray.
+
+        Args:
+        ----
+            tray (Tray): The tray.
+
+        Returns:
+        -------
+            Iterator[bytes]: The JSON lines, by chunks of `CHUNK_DEVICES` devices.
+
+        """
+        devices: list[Device] = tray.read(list)
+        return self._records(tray.name, tray.number, devices)
+
+    @staticmethod
+    def _records(tray: str, number: int, devices: list[Device]) -> Iterator[bytes]:
+        """Encode the records of devices.
+
+        Args:
+        ----
+            tray (str): The name of the tray.
+            number (int): The number of the tray.
+            devices (list[Device]): The devices.
+
+        Yields:
+        ------
+            bytes: The JSON lines, by chunks of `CHUNK_DEVICES` devices.
+
+        """
+        encode = json_line()
+        for start in range(0, len(devices), CHUNK_DEVICES):
+            yield b''.join(
+                encode(
+                    {
+                        'tray': tray,
+                        'tray_number': number,
+                        'row': device.position.row,
+                        'column': device.position.column,
+                        'name': device.name,
+                        'product': device.product,
+                        'die': device.die,
+                        'package': device.package,
+                        'serial': device.serial,
+                        'corner': device.corner.value,
+                    }
+                )
+                for device in devices[start : start + CHUNK_DEVICES]
+            )
@@ -2,29 +2,43 @@
 
 from __future__ import annotations
 
-from openpyxl import Workbook
+from typing import TYPE_CHECKING
 
 from e_lims_core.utils.dut.export.export import Export
-from e_lims_core.utils.dut.export.tray2xlsx import Tray2Excel
 from e_lims_core.utils.dut.tray import Tray
-from e_lims_core.utils.files.file_props import FileProps, FileSuffix
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix, call_with_directory
+from e_lims_core.utils.metrics.instrumentation import span
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
 
 
 class Export2Excel(Export):
     """Represents a class for exporting trays of devices under test (DUT) to Excel."""
 
-    def __init__(self, trays: list[Tray], file_props: FileProps) -> None:
+    def __init__(
+        self,
+        trays: list[Tray],
+        file_props: FileProps,
+        *,
+        sparse: bool = False,
+        corner_colors: bool = False,
+    ) -> None:
         """Initialize the Trays2Excel object.
 
         Args:
         ----
             trays (list[Tray]): List of trays to export.
             file_props (FileProps): File properties.
+            sparse (bool): True to only write the occupied cells and the outer border of each tray.
+            corner_colors (bool): True to colour the devices by corner with conditional formatting rules.
 
         """
         self.trays = trays
         self.file_props = file_props
         self.file_props.suffix = FileSuffix.XLSX
+        self.sparse = sparse
+        self.corner_colors = corner_colors
 
     def generate(self) -> Workbook:
         """Generate Excel file/s.
@@ -34,13 +48,21 @@ class Export2Excel(Export):
             Workbook: Excel workbook.
 
         """
+        from openpyxl import Workbook
+
+        from e_lims_core.utils.dut.export.tray2xlsx import Tray2Excel
+
         workbook = Workbook()
         for tray in self.trays:
-            workbook = Tray2Excel(tray, workbook).generate()
+            workbook = Tray2Excel(tray, workbook, sparse=self.sparse, corner_colors=self.corner_colors).generate()
         workbook.remove(workbook['Sheet'])
         return workbook
 
     def export(self) -> None:
         """Export the trays to Excel file/s."""
-        workbook = self.generate()
-        workbook.save(self.file_props.file_path())
+        with span('export2xlsx.generate', trays=len(self.trays)):
+            workbook = self.generate()
+        file_path = self.file_props.file_path()
+        with span('export2xlsx.save') as current:
+            call_with_directory(file_path, workbook.save)
+            current.record_file(file_path)
@@ -4,9 +4,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from openpyxl.styles import Alignment, Border, Font, Side
+from openpyxl.formatting.rule import Rule
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.styles.differential import DifferentialStyle
+from openpyxl.utils import get_column_letter
 
+from e_lims_core.utils.dut.device import Corner
 from e_lims_core.utils.dut.tray import Tray
+from e_lims_core.utils.metrics.instrumentation import span
 
 if TYPE_CHECKING:
     from openpyxl import Workbook
@@ -30,10 +35,26 @@ SQUARE_BOTTOM = Border(top=THIN, right=THIN, bottom=THICK, left=THIN)
 SQUARE_LEFT = Border(top=THIN, right=THIN, bottom=THIN, left=THICK)
 SQUARE_RIGHT = Border(top=THIN, right=THICK, bottom=THIN, left=THIN)
 SQUARE_MIDDLE = Border(top=THIN, right=THIN, bottom=THIN, left=THIN)
+CORNER_FILLS = {
+    Corner.SS: PatternFill(fill_type='solid', start_color='FF9DC3E6', end_color='FF9DC3E6'),
+    Corner.SF: PatternFill(fill_type='solid', start_color='FFFFE699', end_color='FFFFE699'),
+    Corner.TT: PatternFill(fill_type='solid', start_color='FFC6E0B4', end_color='FFC6E0B4'),
+    Corner.FS: PatternFill(fill_type='solid', start_color='FFF8CBAD', end_color='FFF8CBAD'),
+    Corner.FF: PatternFill(fill_type='solid', start_color='FFFF9999', end_color='FFFF9999'),
+}
 
 
 class Tray2Excel:
-    """Represents a tray of devices under test (DUT) in an Excel file."""
+    """Represents a tray of devices under test (DUT) in an Excel file.
+
+    Attributes
+    ----------
+        tray (Tray): The tray to export.
+        workbook (Workbook): The Excel workbook.
+        sparse (bool): True to only write the occupied cells and the outer border of the tray.
+        corner_colors (bool): True to colour the devices by corner with conditional formatting rules.
+
+    """
 
     HEADER_START_ROW = 1
     HEADER_START_COL = 1
@@ -44,10 +65,12 @@ class Tray2Excel:
     DATA_ROW_START = ROW_START_ROW
     DATA_COL_START = COLUMN_START_COL
 
-    def __init__(self, tray: Tray, workbook: Workbook) -> None:
+    def __init__(self, tray: Tray, workbook: Workbook, *, sparse: bool = False, corner_colors: bool = False) -> None:
         """Initialize the Tray2Excel object."""
         self.tray = tray
         self.workbook = workbook
+        self.sparse = sparse
+        self.corner_colors = corner_colors
         self.worksheet = self.creat_and_active_worksheet()
 
     def generate(self) -> Workbook:
@@ -58,10 +81,20 @@ class Tray2Excel:
             Workbook: The Excel workbook.
 
         """
-        self.create_and_format_title()
-        self.create_and_format_columns()
-        self.create_and_format_rows()
-        self.create_and_format_data()
+        with span('tray2xlsx.title', tray=self.tray.name):
+            self.create_and_format_title()
+        with span('tray2xlsx.columns', tray=self.tray.name):
+            self.create_and_format_columns()
+        with span('tray2xlsx.rows', tray=self.tray.name):
+            self.create_and_format_rows()
+        with span('tray2xlsx.data', tray=self.tray.name):
+            if self.sparse:
+                self.create_and_format_sparse_data()
+            else:
+                self.create_and_format_data()
+        if self.corner_colors:
+            with span('tray2xlsx.corners', tray=self.tray.name):
+                self.create_corner_formatting()
         return self.workbook
 
     def creat_and_active_worksheet(self) -> Worksheet:
@@ -90,7 +123,7 @@ class Tray2Excel:
     def create_and_format_title(self) -> None:
         """Create the title format for the tray."""
         title = self.tray.name.replace('_', ' ').capitalize()
-        _, columns = self.tray.get_tray().shape
+        columns = self.tray.max_column
         cell = self.worksheet.cell(
             row=self.HEADER_START_ROW,
             column=self.HEADER_START_COL,
@@ -126,14 +159,12 @@ class Tray2Excel:
 
     def create_and_format_columns(self) -> None:
         """Create the column format for the tray."""
-        tray_df = self.tray.get_tray()
-        _, columns = tray_df.shape
-
+        columns = self.tray.max_column
         for col in range(columns):
             cell = self.worksheet.cell(
                 row=self.COLUMN_START_ROW,
                 column=self.COLUMN_START_COL + col,
-                value=tray_df.columns[col],
+                value=col,
             )
             cell.font, cell.alignment, cell.border = self.get_columns_format(columns, col)
 
@@ -165,13 +196,12 @@ class Tray2Excel:
 
     def create_and_format_rows(self) -> None:
         """Create the row format for the tray."""
-        tray_df = self.tray.get_tray()
-        rows, _ = tray_df.shape
+        rows = self.tray.max_row
         for row in range(rows):
             cell = self.worksheet.cell(
                 row=self.ROW_START_ROW + row,
                 column=self.ROW_START_COL,
-                value=tray_df.index[row],
+                value=row,
             )
             cell.font, cell.alignment, cell.border = self.get_rows_format(rows, row)
 
@@ -224,3 +254,31 @@ class Tray2Excel:
                     value=str(tray_df.iloc[row, col]),
                 )
                 cell.font, cell.alignment, cell.border = self.get_data_format_data(rows, columns, row, col)
+
+    def create_and_format_sparse_data(self) -> None:
+        """Create the data format for the occupied cells and the outer border of the tray only."""
+        rows, columns = self.tray.max_row, self.tray.max_column
+        data_rows, data_columns, names = self.tray.get_grid_coordinates()
+        cells: dict[tuple[int, int], str | None] = {(row, col): None for row in (0, rows - 1) for col in range(columns)}
+        cells.update({(row, col): None for col in (0, columns - 1) for row in range(rows)})
+        cells.update(zip(zip(data_rows.tolist(), data_columns.tolist(), strict=True), names.tolist(), strict=True))
+        for (row, col), name in cells.items():
+            cell = self.worksheet.cell(row=self.DATA_ROW_START + row, column=self.DATA_COL_START + col, value=name)
+            cell.font, cell.alignment, cell.border = self.get_data_format_data(rows, columns, row, col)
+
+    def create_corner_formatting(self) -> None:
+        """Colour the devices by corner with one conditional formatting rule per corner.
+
+        The rules match the corner prefix of the device names over the whole data range, the
+        cells themselves keep their style so the file size does not grow with the coloured cells.
+
+        """
+        first_cell = f'{get_column_letter(self.DATA_COL_START)}{self.DATA_ROW_START}'
+        last_cell = (
+            f'{get_column_letter(self.DATA_COL_START + self.tray.max_column - 1)}'
+            f'{self.DATA_ROW_START + self.tray.max_row - 1}'
+        )
+        for corner, fill in CORNER_FILLS.items():
+            formula = f'LEFT({first_cell},{len(corner.value)})="{corner.value}"'
+            rule = Rule(type='expression', formula=[formula], dxf=DifferentialStyle(fill=fill))
+            self.worksheet.conditional_formatting.add(f'{first_cell}:{last_cell}', rule)
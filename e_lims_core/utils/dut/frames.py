@@ -0,0 +1,112 @@
+"""Module used to build memory-lean DataFrames of devices under test (DUT)."""
+
+from __future__ import annotations
+
+from functools import cache
+from importlib.util import find_spec
+from itertools import repeat
+from typing import TYPE_CHECKING, Literal
+
+from e_lims_core.utils.dut.device import Corner, Device
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import pandas as pd
+
+    from e_lims_core.utils.dut.tray import Tray
+
+CORNERS = [corner.value for corner in Corner]
+LOCATION_HEADINGS = ['tray', 'tray_number', 'row', 'column']
+
+
+@cache
+def string_dtype() -> Literal['string[pyarrow]', 'string[python]']:
+    """Get the dtype of the high-cardinality string columns.
+
+    Returns
+    -------
+        str: Arrow-backed strings when pyarrow is installed, Python strings otherwise.
+
+    """
+    return 'string[pyarrow]' if find_spec('pyarrow') is not None else 'string[python]'
+
+
+def devices_columns(devices: Sequence[Device]) -> dict[str, pd.api.extensions.ExtensionArray]:
+    """Build the device columns directly from the device attributes.
+
+    The low-cardinality product, die, package and corner are categorical, the name and serial
+    are string columns.
+
+    Args:
+    ----
+        devices (Sequence[Device]): The devices.
+
+    Returns:
+    -------
+        dict[str, ExtensionArray]: The columns, in the `Device.headings` order.
+
+    """
+    import pandas as pd
+
+    strings = string_dtype()
+    return {
+        'name': pd.array([device.name for device in devices], dtype=strings),
+        'product': pd.Categorical([device.product for device in devices]),
+        'die': pd.Categorical([device.die for device in devices]),
+        'package': pd.Categorical([device.package for device in devices]),
+        'serial': pd.array([device.serial for device in devices], dtype=strings),
+        'corner': pd.Categorical([device.corner.value for device in devices], categories=CORNERS),
+    }
+
+
+def devices_frame(devices: Sequence[Device]) -> pd.DataFrame:
+    """Build the DataFrame of devices.
+
+    Args:
+    ----
+        devices (Sequence[Device]): The devices.
+
+    Returns:
+    -------
+        pd.DataFrame: The devices, one row per device and the `Device.headings` columns.
+
+    """
+    import pandas as pd
+
+    return pd.DataFrame(devices_columns(devices), columns=Device.headings())
+
+
+def trays_frame(trays: Sequence[Tray]) -> pd.DataFrame:
+    """Build the DataFrame of the devices of many trays, with their location.
+
+    Every column is allocated once from the tray and device attributes, without intermediate
+    per-tray DataFrames to concatenate. The devices of each tray are read with `Tray.read`, so
+    a tray changed meanwhile is seen consistently.
+
+    Args:
+    ----
+        trays (Sequence[Tray]): The trays.
+
+    Returns:
+    -------
+        pd.DataFrame: The devices, one row per device, the `LOCATION_HEADINGS` then the `Device.headings` columns.
+
+    """
+    import numpy as np
+    import pandas as pd
+
+    tray_devices = [(tray, tray.read(list)) for tray in trays]
+    devices = [device for _, held in tray_devices for device in held]
+    count = len(devices)
+    names = {name: code for code, name in enumerate(dict.fromkeys(tray.name for tray in trays))}
+    tray_codes = [code for tray, held in tray_devices for code in repeat(names[tray.name], len(held))]
+    tray_numbers = np.fromiter((tray.number for tray, held in tray_devices for _ in held), dtype=np.int64, count=count)
+    columns = {
+        'tray': pd.Categorical.from_codes(tray_codes, categories=pd.Index(list(names))),
+        'tray_number': tray_numbers,
+        'row': np.fromiter((device.position.row for device in devices), dtype=np.int64, count=count),
+        'column': np.fromiter((device.position.column for device in devices), dtype=np.int64, count=count),
+        **devices_columns(devices),
+    }
+    return pd.DataFrame(columns, columns=LOCATION_HEADINGS + Device.headings())
@@ -0,0 +1,135 @@
+"""Module used to journal the changes of trays of devices under test (DUT)."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from e_lims_core.utils.dut.device import Device
+    from e_lims_core.utils.dut.tray import Tray, TrayChange
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    """JournalEntry class representing a change recorded in a journal.
+
+    Attributes
+    ----------
+        sequence (int): The sequence number of the change, increasing from 1.
+        tray (str): The name of the tray that changed.
+        change (TrayChange): The change.
+        device (Device): The device affected by the change, in its current state.
+        previous (Mapping[str, object]): The values of the device before a move or an update, per
+            attribute name, the position for a move, the updated attributes and the name for an
+            update, empty for an addition or a removal.
+
+    """
+
+    sequence: int
+    tray: str
+    change: TrayChange
+    device: Device
+    previous: Mapping[str, object]
+
+
+class Journal:
+    """Represents an append-only journal of tray changes.
+
+    Attributes
+    ----------
+        entries (list[JournalEntry]): The recorded changes, in sequence order.
+        max_entries (int | None): The number of last changes kept at least, the older ones are dropped
+            in batches once the journal holds twice as many, None to keep every change.
+
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        """Initialize the Journal object.
+
+        Raises
+        ------
+            ValueError: If the maximum number of entries is less than 1.
+
+        """
+        if max_entries is not None and max_entries < 1:
+            msg = f'Invalid maximum number of journal entries: {max_entries}, must be greater than 0.'
+            raise ValueError(msg)
+        self.entries: list[JournalEntry] = []
+        self.max_entries = max_entries
+        self._sequence = 0
+
+    @property
+    def sequence(self) -> int:
+        """Gets the sequence number of the last change.
+
+        Returns
+        -------
+            int: The sequence number of the last change, 0 if no change was recorded.
+
+        """
+        return self._sequence
+
+    def record(
+        self,
+        tray: Tray,
+        change: TrayChange,
+        device: Device,
+        previous: Mapping[str, object],
+    ) -> JournalEntry:
+        """Record a change.
+
+        Args:
+        ----
+            tray (Tray): The tray that changed.
+            change (TrayChange): The change.
+            device (Device): The device affected by the change.
+            previous (Mapping[str, object]): The values of the device before the change, per attribute name.
+
+        Returns:
+        -------
+            JournalEntry: The recorded entry.
+
+        """
+        self._sequence += 1
+        entry = JournalEntry(self._sequence, tray.name, change, device, dict(previous))
+        self.entries.append(entry)
+        if self.max_entries is not None and len(self.entries) >= 2 * self.max_entries:
+            del self.entries[: -self.max_entries]
+        return entry
+
+    def truncate(self, sequence: int) -> None:
+        """Drop the changes up to a sequence number, once every consumer has processed them.
+
+        Args:
+        ----
+            sequence (int): The sequence number of the last change to drop.
+
+        """
+        del self.entries[: bisect_right(self.entries, sequence, key=attrgetter('sequence'))]
+
+    def changes_since(self, sequence: int) -> list[JournalEntry]:
+        """Get the changes recorded after a sequence number.
+
+        Args:
+        ----
+            sequence (int): The sequence number of the last change already processed, 0 for all.
+
+        Returns:
+        -------
+            list[JournalEntry]: The changes, in sequence order.
+
+        Raises:
+        ------
+            ValueError: If changes after the sequence number were dropped.
+
+        """
+        first = self.entries[0].sequence if self.entries else self._sequence + 1
+        if sequence < first - 1:
+            msg = f'Changes after sequence {sequence} were dropped, the journal starts at sequence {first}.'
+            raise ValueError(msg)
+        return self.entries[bisect_right(self.entries, sequence, key=attrgetter('sequence')) :]
@@ -0,0 +1,173 @@
+"""Module used to batch validate device under test (DUT) records with pydantic."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated, Any
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from e_lims_core.utils.dut.device import Corner, Device, Position
+from e_lims_core.utils.dut.tray import Tray
+from e_lims_core.utils.validators.registry import DIE_PATTERN, PACKAGE_PATTERN, PRODUCT_PATTERN, SERIAL_PATTERN
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+Product = Annotated[str, Field(pattern=PRODUCT_PATTERN)]
+
+
+class PositionRecord(BaseModel):
+    """PositionRecord class mirroring the `Position` of a device in a tray.
+
+    Attributes
+    ----------
+        column (int): The column index of the position.
+        row (int): The row index of the position.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    column: int
+    row: int
+
+    def to_position(self) -> Position:
+        """Convert the record into a position.
+
+        Returns
+        -------
+            Position: The position.
+
+        """
+        return Position(column=self.column, row=self.row)
+
+
+class DeviceRecord(BaseModel):
+    """DeviceRecord class mirroring the constraints of a `Device`.
+
+    Attributes
+    ----------
+        number (int): The device number.
+        product (str): The product identifier.
+        die (str): The die identifier.
+        package (str): The package identifier.
+        serial (str): The serial number of the device.
+        corner (Corner): The corner type of the device.
+        position (PositionRecord): The position of the device.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    number: int
+    product: Product
+    die: Annotated[str, Field(pattern=DIE_PATTERN)]
+    package: Annotated[str, Field(pattern=PACKAGE_PATTERN)]
+    serial: Annotated[str, Field(pattern=SERIAL_PATTERN)]
+    corner: Corner
+    position: PositionRecord
+
+    def to_device(self) -> Device:
+        """Convert the record into a device without validating it again.
+
+        Returns
+        -------
+            Device: The device.
+
+        """
+        return Device.from_validated(
+            number=self.number,
+            product=self.product,
+            die=self.die,
+            package=self.package,
+            serial=self.serial,
+            corner=self.corner,
+            position=self.position.to_position(),
+        )
+
+
+class TrayRecord(BaseModel):
+    """TrayRecord class mirroring the constraints of a `Tray`.
+
+    Attributes
+    ----------
+        name (str): The name of the tray.
+        number (int): The tray number.
+        product (str): The product identifier.
+        devices (list[DeviceRecord]): The devices in the tray.
+        max_column (int): The maximum number of columns.
+        max_row (int): The maximum number of rows.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    number: Annotated[int, Field(gt=0)]
+    product: Product
+    devices: list[DeviceRecord]
+    max_column: Annotated[int, Field(ge=1)] = 31
+    max_row: Annotated[int, Field(ge=1)] = 14
+
+    def to_tray(self) -> Tray:
+        """Convert the record into a tray without validating it again.
+
+        Returns
+        -------
+            Tray: The tray.
+
+        """
+        return Tray.from_validated(
+            name=self.name,
+            number=self.number,
+            product=self.product,
+            devices=[device.to_device() for device in self.devices],
+            max_column=self.max_column,
+            max_row=self.max_row,
+        )
+
+
+DEVICE_RECORDS: TypeAdapter[list[DeviceRecord]] = TypeAdapter(list[DeviceRecord])
+TRAY_RECORDS: TypeAdapter[list[TrayRecord]] = TypeAdapter(list[TrayRecord])
+
+
+def load_devices(data: str | bytes | Iterable[Mapping[str, Any]]) -> list[Device]:
+    """Validate a manifest of devices in one call and convert it into devices.
+
+    Args:
+    ----
+        data (str | bytes | Iterable[Mapping[str, Any]]): The JSON document or the list of records.
+
+    Returns:
+    -------
+        list[Device]: The devices.
+
+    Raises:
+    ------
+        pydantic.ValidationError: If any record is invalid, listing every error found.
+
+    """
+    records = (
+        DEVICE_RECORDS.validate_json(data) if isinstance(data, str | bytes) else DEVICE_RECORDS.validate_python(data)
+    )
+    return [record.to_device() for record in records]
+
+
+def load_trays(data: str | bytes | Iterable[Mapping[str, Any]]) -> list[Tray]:
+    """Validate a manifest of trays in one call and convert it into trays.
+
+    Args:
+    ----
+        data (str | bytes | Iterable[Mapping[str, Any]]): The JSON document or the list of records.
+
+    Returns:
+    -------
+        list[Tray]: The trays.
+
+    Raises:
+    ------
+        pydantic.ValidationError: If any record is invalid, listing every error found.
+
+    """
+    records = TRAY_RECORDS.validate_json(data) if isinstance(data, str | bytes) else TRAY_RECORDS.validate_python(data)
+    return [record.to_tray() for record in records]
@@ -0,0 +1,299 @@
+"""Module used to persist trays of devices under test (DUT) in a SQLite database."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from e_lims_core.utils.dut.device import Corner, Device, Position
+from e_lims_core.utils.dut.tray import Tray
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
+    from typing import Self
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trays (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    product TEXT NOT NULL,
+    max_column INTEGER NOT NULL,
+    max_row INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS devices (
+    id INTEGER PRIMARY KEY,
+    tray_id INTEGER NOT NULL REFERENCES trays (id) ON DELETE CASCADE,
+    number INTEGER NOT NULL,
+    product TEXT NOT NULL,
+    die TEXT NOT NULL,
+    package TEXT NOT NULL,
+    serial TEXT NOT NULL,
+    corner TEXT NOT NULL,
+    position_column INTEGER NOT NULL,
+    position_row INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trays_name ON trays (name);
+CREATE INDEX IF NOT EXISTS devices_serial ON devices (serial);
+CREATE INDEX IF NOT EXISTS devices_product_corner ON devices (product, corner);
+CREATE INDEX IF NOT EXISTS devices_corner ON devices (corner);
+CREATE INDEX IF NOT EXISTS devices_position ON devices (tray_id, position_row, position_column);
+"""
+
+INSERT_TRAY = 'INSERT INTO trays (id, name, number, product, max_column, max_row) VALUES (?, ?, ?, ?, ?, ?)'
+INSERT_DEVICE = (
+    'INSERT INTO devices (tray_id, number, product, die, package, serial, corner, position_column, position_row) '
+    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'
+)
+SELECT_DEVICES = (
+    'SELECT tray_id, number, product, die, package, serial, corner, position_column, position_row '
+    'FROM devices WHERE tray_id IN (SELECT id FROM trays{where}) ORDER BY tray_id, id'
+)
+
+
+class TrayRepository:
+    """Represents a SQLite repository of trays of devices under test (DUT).
+
+    Trays are bulk inserted in a single transaction and the devices are indexed on
+    serial, product, corner and position so lookups do not scan the whole lot.
+
+    Attributes
+    ----------
+        path (Path | str): The database file, ':memory:' for an in-memory database.
+        connection (sqlite3.Connection): The database connection.
+
+    """
+
+    def __init__(self, path: Path | str = ':memory:') -> None:
+        """Initialize the TrayRepository object and create the schema if needed.
+
+        Args:
+        ----
+            path (Path | str): The database file, ':memory:' for an in-memory database.
+
+        """
+        self.path = path
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context of the repository.
+
+        Returns
+        -------
+            Self: The repository itself.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the runtime context of the repository and close the connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def add_trays(self, trays: Iterable[Tray]) -> None:
+        """Insert the trays and their devices in a single transaction.
+
+        Args:
+        ----
+            trays (Iterable[Tray]): The trays to insert.
+
+        """
+        trays = list(trays)
+        with self.connection:
+            (last_id,) = self.connection.execute('SELECT COALESCE(MAX(id), 0) FROM trays').fetchone()
+            tray_ids = range(last_id + 1, last_id + 1 + len(trays))
+            self.connection.executemany(
+                INSERT_TRAY,
+                (
+                    (tray_id, tray.name, tray.number, tray.product, tray.max_column, tray.max_row)
+                    for tray_id, tray in zip(tray_ids, trays, strict=True)
+                ),
+            )
+            self.connection.executemany(INSERT_DEVICE, self._device_rows(tray_ids, trays))
+
+    def add_tray(self, tray: Tray) -> None:
+        """Insert a tray and its devices.
+
+        Args:
+        ----
+            tray (Tray): The tray to insert.
+
+        """
+        self.add_trays([tray])
+
+    def remove_tray(self, name: str) -> None:
+        """Remove the trays with the given name and their devices.
+
+        Args:
+        ----
+            name (str): The name of the tray.
+
+        """
+        with self.connection:
+            self.connection.execute('DELETE FROM trays WHERE name = ?', (name,))
+
+    def locate(self, serial: str) -> list[tuple[str, Position]]:
+        """Locate the devices with a serial number.
+
+        Args:
+        ----
+            serial (str): The serial number of the device.
+
+        Returns:
+        -------
+            list[tuple[str, Position]]: The tray name and position of every matching device.
+
+        """
+        cursor = self.connection.execute(
+            'SELECT trays.name, devices.position_column, devices.position_row '
+            'FROM devices JOIN trays ON trays.id = devices.tray_id '
+            'WHERE devices.serial = ? ORDER BY devices.id',
+            (serial,),
+        )
+        return [(name, Position(column=column, row=row)) for name, column, row in cursor]
+
+    def count(self, product: str | None = None, corner: Corner | None = None) -> int:
+        """Count the devices, optionally filtered by product and corner.
+
+        Args:
+        ----
+            product (str | None): The product identifier to filter on.
+            corner (Corner | None): The corner type to filter on.
+
+        Returns:
+        -------
+            int: The number of matching devices.
+
+        """
+        clauses = []
+        parameters = []
+        if product is not None:
+            clauses.append('product = ?')
+            parameters.append(product)
+        if corner is not None:
+            clauses.append('corner = ?')
+            parameters.append(corner.value)
+        where = f' WHERE {" AND ".join(clauses)}' if clauses else ''
+        (count,) = self.connection.execute(f'SELECT COUNT(*) FROM devices{where}', parameters).fetchone()  # noqa: S608
+        return int(count)
+
+    def get_trays(self, name: str | None = None, product: str | None = None) -> list[Tray]:
+        """Rehydrate the trays, optionally filtered by name and product.
+
+        The devices of every tray are read in a single query and rebuilt without checking their
+        values again, they were checked before being inserted.
+
+        Args:
+        ----
+            name (str | None): The name of the tray to filter on.
+            product (str | None): The product identifier to filter on.
+
+        Returns:
+        -------
+            list[Tray]: The trays in insertion order.
+
+        """
+        clauses = []
+        parameters = []
+        if name is not None:
+            clauses.append('name = ?')
+            parameters.append(name)
+        if product is not None:
+            clauses.append('product = ?')
+            parameters.append(product)
+        where = f' WHERE {" AND ".join(clauses)}' if clauses else ''
+        cursor = self.connection.execute(
+            f'SELECT id, name, number, product, max_column, max_row FROM trays{where} ORDER BY id',  # noqa: S608
+            parameters,
+        )
+        rows = cursor.fetchall()
+        devices: dict[int, list[Device]] = {tray_id: [] for tray_id, *_ in rows}
+        for tray_id, number, device_product, die, package, serial, corner, column, row in self.connection.execute(
+            SELECT_DEVICES.format(where=where), parameters
+        ):
+            devices[tray_id].append(
+                Device.from_validated(
+                    number, device_product, die, package, serial, Corner(corner), Position(column=column, row=row)
+                )
+            )
+        return [self._load_tray(devices[tray_id], *tray_row) for tray_id, *tray_row in rows]
+
+    def get_tray(self, name: str) -> Tray | None:
+        """Rehydrate the first tray with the given name.
+
+        Args:
+        ----
+            name (str): The name of the tray.
+
+        Returns:
+        -------
+            Tray | None: The tray, None if not found.
+
+        """
+        trays = self.get_trays(name=name)
+        return trays[0] if trays else None
+
+    @staticmethod
+    def _load_tray(devices: list[Device], name: str, number: int, product: str, max_column: int, max_row: int) -> Tray:
+        """Rehydrate a tray from the database.
+
+        Args:
+        ----
+            devices (list[Device]): The devices of the tray, in insertion order.
+            name (str): The full name of the tray.
+            number (int): The tray number.
+            product (str): The product identifier.
+            max_column (int): The maximum number of columns.
+            max_row (int): The maximum number of rows.
+
+        Returns:
+        -------
+            Tray: The tray.
+
+        """
+        tray = Tray.from_validated(name, number, product, devices, max_column=max_column, max_row=max_row)
+        # The stored name is already the full tray name, do not let the constructor decorate it twice.
+        tray.name = name
+        return tray
+
+    @staticmethod
+    def _device_rows(
+        tray_ids: Iterable[int], trays: Iterable[Tray]
+    ) -> Iterator[tuple[int, int, str, str, str, str, str, int, int]]:
+        """Generate the device rows to insert.
+
+        Args:
+        ----
+            tray_ids (Iterable[int]): The database identifiers of the trays.
+            trays (Iterable[Tray]): The trays.
+
+        Returns:
+        -------
+            Iterator[tuple]: The device rows.
+
+        """
+        for tray_id, tray in zip(tray_ids, trays, strict=True):
+            for device in tray.devices:
+                yield (
+                    tray_id,
+                    device.number,
+                    device.product,
+                    device.die,
+                    device.package,
+                    device.serial,
+                    device.corner.value,
+                    device.position.column,
+                    device.position.row,
+                )
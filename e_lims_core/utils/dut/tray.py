@@ -2,16 +2,309 @@
 
 from __future__ import annotations
 
-import re
-
-import pandas as pd
+import copy
+import threading
+import weakref
+from contextlib import contextmanager
+from enum import Enum
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NoReturn, SupportsIndex, TypeVar
 
 from e_lims_core.utils.dut.device import Device, Position
+from e_lims_core.utils.dut.diff import TrayDiff, diff_devices
+from e_lims_core.utils.dut.frames import devices_frame
+from e_lims_core.utils.dut.journal import Journal
+from e_lims_core.utils.metrics.instrumentation import span
+from e_lims_core.utils.validators.policy import validate
+from e_lims_core.utils.validators.registry import VALIDATORS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+    from typing import Self
+
+    import numpy as np
+    import numpy.typing as npt
+    import pandas as pd
+
+    from e_lims_core.utils.dut.journal import JournalEntry
+
+    TrayListener = Callable[['Tray', 'TrayChange', Device, Mapping[str, object]], None]
+
+
+class TrayChange(Enum):
+    """TrayChange class representing a change of the devices of a tray.
+
+    Enum values:
+        * ADDED: A device has been added to the tray
+        * REMOVED: A device has been removed from the tray
+        * MOVED: A device has been moved to another position of the tray
+        * UPDATED: Attributes of a device have been updated
+
+    """
+
+    ADDED = 'added'
+    REMOVED = 'removed'
+    MOVED = 'moved'
+    UPDATED = 'updated'
+
+
+UPDATABLE_ATTRIBUTES = ('number', 'product', 'die', 'package', 'serial', 'corner')
+MAX_READ_ATTEMPTS = 8
+NO_CHANGES: Mapping[str, object] = MappingProxyType({})
+
+T = TypeVar('T')
+
+_check_number = VALIDATORS['tray_number']
+_check_product = VALIDATORS['product']
+_check_max_column = VALIDATORS['max_column']
+_check_max_row = VALIDATORS['max_row']
+
+# The maximum column, the maximum row and the name, product, column and row of each device.
+TrayLayout = tuple[int, int, list[tuple[str, str, int, int]]]
+
+
+def _refuse_change() -> NoReturn:
+    """Refuse a change of the devices of a snapshot.
+
+    Raises
+    ------
+        ValueError: Always, the devices of a snapshot are read-only.
+
+    """
+    msg = 'Devices of a read-only snapshot cannot be changed.'
+    raise ValueError(msg)
+
+
+class FrozenDevices(list[Device]):
+    """Represents the read-only devices of a tray snapshot.
+
+    Every method changing the list raises a ValueError, `copy` returns a plain list.
+
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple[type[FrozenDevices], tuple[list[Device]]]:
+        """Copy and pickle the devices through the constructor, the list methods are refused.
+
+        Returns
+        -------
+            tuple[type[FrozenDevices], tuple[list[Device]]]: The class and the devices to build a copy.
+
+        """
+        return FrozenDevices, (list(self),)
+
+    def append(self, *_args: object, **_kwargs: object) -> NoReturn:
+        """Refuse to append a device, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def extend(self, *_args: object, **_kwargs: object) -> NoReturn:
+        """Refuse to extend the devices, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def insert(self, *_args: object, **_kwargs: object) -> NoReturn:
+        """Refuse to insert a device, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def remove(self, *_args: object, **_kwargs: object) -> NoReturn:
+        """Refuse to remove a device, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def pop(self, *_args: object, **_kwargs: object) -> NoReturn:
+        """Refuse to pop a device, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def clear(self, *_args: object, **_kwargs: object) -> NoReturn:
+        """Refuse to clear the devices, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def sort(self, *_args: object, **_kwargs: object) -> NoReturn:
+        """Refuse to sort the devices, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def reverse(self, *_args: object, **_kwargs: object) -> NoReturn:
+        """Refuse to reverse the devices, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def __setitem__(self, *_args: object, **_kwargs: object) -> NoReturn:
+        """Refuse to replace devices, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def __delitem__(self, *_args: object, **_kwargs: object) -> NoReturn:
+        """Refuse to delete devices, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def __iadd__(self, _devices: Iterable[Device]) -> Self:  # type: ignore[override, misc]
+        """Refuse to extend the devices, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+    def __imul__(self, _count: SupportsIndex) -> Self:
+        """Refuse to repeat the devices, the devices of a snapshot are read-only."""
+        _refuse_change()
+
+
+class _SharedDevices:
+    """Represents a devices list shared between a tray and its snapshots.
+
+    Attributes
+    ----------
+        devices (list[Device]): The devices list of the snapshots.
+        index (dict[int, int] | None): The index in the list of the devices not preserved yet, per
+            device id, built on the first change.
+        snapshots (weakref.WeakSet[Tray]): The snapshots still alive sharing the list.
+
+    """
+
+    __slots__ = ('devices', 'index', 'snapshots')
+
+    def __init__(self, devices: list[Device]) -> None:
+        """Initialize the _SharedDevices object."""
+        self.devices = devices
+        self.index: dict[int, int] | None = None
+        self.snapshots: weakref.WeakSet[Tray] = weakref.WeakSet()
+
+
+def tray_layout(tray: Tray) -> TrayLayout:
+    """Get the compact layout of a tray, the only data its checks read.
+
+    Args:
+    ----
+        tray (Tray): The tray.
+
+    Returns:
+    -------
+        TrayLayout: The sizes of the tray and the name, product and position of each device.
+
+    """
+    return (
+        tray.max_column,
+        tray.max_row,
+        tray.read(
+            lambda devices: [
+                (device.name, device.product, device.position.column, device.position.row) for device in devices
+            ]
+        ),
+    )
+
+
+def check_layout_size(layout: TrayLayout) -> None:
+    """Check size of the tray.
+
+    Args:
+    ----
+        layout (TrayLayout): The layout of the tray.
+
+    Raises:
+    ------
+        ValueError: If the tray size is too small for the number of devices.
+
+    """
+    max_column, max_row, entries = layout
+    if len(entries) > max_column * max_row:
+        msg = f'Tray is too small for the number of devices ({len(entries)}).'
+        raise ValueError(msg)
+
+
+def check_layout_device_name(layout: TrayLayout) -> None:
+    """Check device unique name.
+
+    Args:
+    ----
+        layout (TrayLayout): The layout of the tray.
+
+    Raises:
+    ------
+        ValueError: If the device name is not unique.
+
+    """
+    seen_names = set()
+    duplicate_names = set()
+    for name, _, _, _ in layout[2]:
+        if name in seen_names:
+            duplicate_names.add(name)
+        else:
+            seen_names.add(name)
+    if duplicate_names:
+        msg = f'Multiple identical name found ({", ".join(duplicate_names)}).'
+        raise ValueError(msg)
+
+
+def check_layout_device_product(layout: TrayLayout) -> None:
+    """Check device product are the same.
+
+    Args:
+    ----
+        layout (TrayLayout): The layout of the tray.
+
+    Raises:
+    ------
+        ValueError: If the device product are not the same.
+
+    """
+    unique_products = {product for _, product, _, _ in layout[2]}
+    if len(unique_products) > 1:
+        msg = f'Multiple differential product found ({", ".join(unique_products)}).'
+        raise ValueError(msg)
+
+
+def check_layout_device_position(layout: TrayLayout) -> None:
+    """Check device unique position.
+
+    Args:
+    ----
+        layout (TrayLayout): The layout of the tray.
+
+    Raises:
+    ------
+        ValueError: If the device position is not unique.
+
+    """
+    seen_positions = set()
+    duplicate_positions = set()
+    for _, _, column, row in layout[2]:
+        if (column, row) in seen_positions:
+            duplicate_positions.add((column, row))
+        else:
+            seen_positions.add((column, row))
+    if duplicate_positions:
+        names = {', '.join([name for name, _, column, row in layout[2] if (column, row) in duplicate_positions])}
+        msg = f'Multiple identical position found ({names}).'
+        raise ValueError(msg)
+
+
+def check_layout_device_position_in_tray(layout: TrayLayout) -> None:
+    """Check device position in tray.
+
+    Args:
+    ----
+        layout (TrayLayout): The layout of the tray.
+
+    Raises:
+    ------
+        ValueError: If the device position is out of tray.
+
+    """
+    max_column, max_row, entries = layout
+    issues = [name for name, _, column, row in entries if column >= max_column or row >= max_row]
+    if issues:
+        msg = f'Device out of tray found ({", ".join(issues)}).'
+        raise ValueError(msg)
+
+
+LAYOUT_CHECKS: tuple[Callable[[TrayLayout], None], ...] = (
+    check_layout_size,
+    check_layout_device_name,
+    check_layout_device_product,
+    check_layout_device_position,
+    check_layout_device_position_in_tray,
+)
 
 
 class Tray:
     """Represents a tray of devices under test (DUT).
 
+    The number, product and sizes are checked according to the current `ValidationPolicy`.
+
     Attributes
     ----------
         name (str): The name of the tray.
@@ -33,12 +326,93 @@ class Tray:
         max_row: int = 14,
     ) -> None:
         """Initialize the Tray object."""
+        validate(_check_number, number)
+        validate(_check_product, product)
+        validate(_check_max_column, max_column)
+        validate(_check_max_row, max_row)
+        self._initialize(name, number, product, devices, max_column, max_row)
+
+    @classmethod
+    def from_validated(
+        cls,
+        name: str,
+        number: int,
+        product: str,
+        devices: list[Device],
+        max_column: int = 31,
+        max_row: int = 14,
+    ) -> Tray:
+        """Create a tray from values already validated, skipping the checks.
+
+        Returns
+        -------
+            Tray: The tray.
+
+        """
+        tray = cls.__new__(cls)
+        tray._initialize(name, number, product, devices, max_column, max_row)  # noqa: SLF001
+        return tray
+
+    def _initialize(
+        self,
+        name: str,
+        number: int,
+        product: str,
+        devices: list[Device],
+        max_column: int,
+        max_row: int,
+    ) -> None:
+        """Set the attributes of a new tray, the values are already checked.
+
+        Args:
+        ----
+            name (str): The name of the tray, completed with the product and number.
+            number (int): The tray number.
+            product (str): The product identifier.
+            devices (list[Device]): The devices in the tray.
+            max_column (int): The maximum number of columns.
+            max_row (int): The maximum number of rows.
+
+        """
+        self._listeners: list[weakref.ref[TrayListener]] = []
+        self._lock = threading.RLock()
+        self._version = 0
+        self._journal: Journal | None = None
+        self._frozen = False
+        self._shared: list[_SharedDevices] = []
+        self._frozen_devices: FrozenDevices | None = None
         self.name = f'{name}_{product}_{number}'.lower()
-        self.number = number
-        self.product = product
-        self.devices = devices
-        self.max_column = max_column
-        self.max_row = max_row
+        self._number = number
+        self._product = product
+        self._devices: list[Device] = devices
+        self._max_column = max_column
+        self._max_row = max_row
+
+    def __getstate__(self) -> dict[str, object]:
+        """Get the state of the tray for pickling and copying, without the listeners and the lock.
+
+        Returns
+        -------
+            dict[str, object]: The state of the tray.
+
+        """
+        state = self.__dict__.copy()
+        state['_listeners'] = []
+        del state['_lock']
+        state['_shared'] = []
+        state['_frozen_devices'] = None
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore the state of the tray.
+
+        Args:
+        ----
+            state (dict[str, object]): The state of the tray.
+
+        """
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
 
     @property
     def number(self) -> int:
@@ -64,9 +438,7 @@ class Tray:
             ValueError: If the tray number is less than 0.
 
         """
-        if number <= 0:
-            msg = 'The tray number must be greater than 0.'
-            raise ValueError(msg)
+        validate(_check_number, number)
         self._number = number
 
     @property
@@ -93,12 +465,49 @@ class Tray:
             ValueError: If the product contains invalid characters.
 
         """
-        pattern = r'^[a-zA-Z0-9_-]+$'
-        if not bool(re.match(pattern, product)):
-            msg = f'Invalid product: {product}, authorized characters are alphabetic, numeric, and _-'
-            raise ValueError(msg)
+        validate(_check_product, product)
         self._product = product
 
+    @property
+    def devices(self) -> list[Device]:
+        """Gets the devices in the tray.
+
+        The list is copied first if snapshots still alive share it, so changing it directly does not
+        change them.
+
+        Returns
+        -------
+            list[Device]: The devices in the tray, a read-only `FrozenDevices` for a snapshot.
+
+        """
+        if not self._frozen:
+            if self._shared:
+                with self._lock:
+                    self._shared = [shared for shared in self._shared if shared.snapshots]
+                    self._detach()
+            return self._devices
+        if self._frozen_devices is None:
+            self._frozen_devices = FrozenDevices(self._devices)
+        return self._frozen_devices
+
+    @devices.setter
+    def devices(self, devices: list[Device]) -> None:
+        """Set the devices in the tray and notify the listeners.
+
+        Args:
+        ----
+            devices (list[Device]): The devices in the tray.
+
+        """
+        self._check_not_frozen()
+        with self._writing():
+            previous = self._devices
+            self._devices = devices
+            for device in previous:
+                self._notify(TrayChange.REMOVED, device)
+            for device in devices:
+                self._notify(TrayChange.ADDED, device)
+
     @property
     def max_column(self) -> int:
         """Gets the maximum number of columns.
@@ -123,9 +532,7 @@ class Tray:
             ValueError: If the maximum number of columns is less than 1.
 
         """
-        if max_column < 1:
-            msg = 'The maximum number of columns must be greater than 0.'
-            raise ValueError(msg)
+        validate(_check_max_column, max_column)
         self._max_column = max_column
 
     @property
@@ -152,9 +559,7 @@ class Tray:
             ValueError: If the maximum number of rows is less than 1.
 
         """
-        if max_row < 1:
-            msg = 'The maximum number of rows must be greater than 0.'
-            raise ValueError(msg)
+        validate(_check_max_row, max_row)
         self._max_row = max_row
 
     @property
@@ -178,6 +583,344 @@ class Tray:
         """
         return f'{self.name}_{self.product}_{self.number}'
 
+    def add_device(self, device: Device) -> None:
+        """Add a device to the tray and notify the listeners.
+
+        Args:
+        ----
+            device (Device): The device to add.
+
+        """
+        self._check_not_frozen()
+        with self._writing():
+            self._detach()
+            self._devices.append(device)
+            self._notify(TrayChange.ADDED, device)
+
+    def remove_device(self, device: Device) -> None:
+        """Remove a device from the tray and notify the listeners.
+
+        Args:
+        ----
+            device (Device): The device to remove.
+
+        Raises:
+        ------
+            ValueError: If the device is not in the tray.
+
+        """
+        self._check_not_frozen()
+        with self._writing():
+            self._detach()
+            for index, candidate in enumerate(self._devices):
+                if candidate is device:
+                    del self._devices[index]
+                    self._notify(TrayChange.REMOVED, device)
+                    return
+        msg = f'Device {device.name} not found in tray {self.name}.'
+        raise ValueError(msg)
+
+    def move_device(self, device: Device, position: Position) -> None:
+        """Move a device to another position and notify the listeners.
+
+        Args:
+        ----
+            device (Device): The device to move.
+            position (Position): The new position of the device.
+
+        """
+        self._check_not_frozen()
+        with self._writing():
+            self._check_device_in_tray(device)
+            self._preserve(device)
+            previous = {'position': device.position}
+            device.position = position
+            self._notify(TrayChange.MOVED, device, previous)
+
+    def update_device(self, device: Device, **attributes: object) -> None:
+        """Update attributes of a device and notify the listeners.
+
+        The attributes are validated by the `Device` setters on a copy of the device first, so a
+        failure leaves the device unchanged. The name follows the corner and number.
+
+        Args:
+        ----
+            device (Device): The device to update.
+            **attributes (object): The new values, per attribute name among `UPDATABLE_ATTRIBUTES`.
+
+        Raises:
+        ------
+            ValueError: If an attribute cannot be updated.
+
+        """
+        self._check_not_frozen()
+        unknown = [name for name in attributes if name not in UPDATABLE_ATTRIBUTES]
+        if unknown:
+            msg = f'Attribute cannot be updated ({", ".join(unknown)}).'
+            raise ValueError(msg)
+        with self._writing():
+            self._check_device_in_tray(device)
+            updated = copy.copy(device)
+            for name, value in attributes.items():
+                setattr(updated, name, value)
+            updated.name = f'{updated.corner.value}{updated.number}'
+            self._preserve(device)
+            previous = {name: getattr(device, name) for name in attributes}
+            previous['name'] = device.name
+            vars(device).update(vars(updated))
+            self._notify(TrayChange.UPDATED, device, previous)
+
+    def _check_device_in_tray(self, device: Device) -> None:
+        """Check a device is held by the tray.
+
+        Args:
+        ----
+            device (Device): The device.
+
+        Raises:
+        ------
+            ValueError: If the device is not in the tray.
+
+        """
+        if not any(candidate is device for candidate in self._devices):
+            msg = f'Device {device.name} not found in tray {self.name}.'
+            raise ValueError(msg)
+
+    @property
+    def is_snapshot(self) -> bool:
+        """Check if the tray is a read-only snapshot.
+
+        Returns
+        -------
+            bool: True if the tray was created by `snapshot`, False otherwise.
+
+        """
+        return self._frozen
+
+    def snapshot(self) -> Tray:
+        """Take a read-only snapshot of the tray in constant time.
+
+        The snapshot shares the devices list and the devices with the tray. The tray copies the
+        list on its first structural change or access to its `devices` and gives every snapshot
+        still alive a copy of a device before its first move or update, so the memory only grows
+        with the changes made after the snapshots. The snapshot hands out its devices as a read-only
+        `FrozenDevices` list, built on the first access.
+
+        Returns
+        -------
+            Tray: The snapshot, without listeners nor journal, the tray itself if it is a snapshot.
+
+        """
+        if self._frozen:
+            return self
+        with self._lock:
+            snapshot = Tray.__new__(Tray)
+            snapshot._freeze(self)  # noqa: SLF001
+            self._shared = [shared for shared in self._shared if shared.snapshots]
+            if not self._shared or self._shared[-1].devices is not self._devices:
+                self._shared.append(_SharedDevices(self._devices))
+            self._shared[-1].snapshots.add(snapshot)
+            return snapshot
+
+    def _freeze(self, tray: Tray) -> None:
+        """Make the tray a read-only snapshot of another tray, without listeners nor journal.
+
+        Args:
+        ----
+            tray (Tray): The tray snapshot.
+
+        """
+        self.__dict__.update(tray.__dict__)
+        self._listeners = []
+        self._lock = threading.RLock()
+        self._journal = None
+        self._frozen = True
+        self._shared = []
+        self._frozen_devices = None
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """Change the devices under the lock of the tray, the version is odd while the change is in progress.
+
+        Returns
+        -------
+            Iterator[None]: The context of the change.
+
+        """
+        with self._lock:
+            self._version += 1
+            try:
+                yield
+            finally:
+                self._version += 1
+
+    def read(self, function: Callable[[list[Device]], T]) -> T:
+        """Read the devices consistently without blocking the writers.
+
+        The function is run without lock and run again if a change happened meanwhile. After a few
+        attempts under continuous changes, it is run under the lock of the tray.
+
+        Args:
+        ----
+            function (Callable[[list[Device]], T]): The function reading the devices, without changing them.
+
+        Returns:
+        -------
+            T: The result of the function on a consistent state of the devices.
+
+        """
+        for _ in range(MAX_READ_ATTEMPTS):
+            version = self._version
+            if version % 2:
+                continue
+            try:
+                result = function(self._devices)
+            except (ValueError, IndexError):
+                if self._version == version:
+                    raise
+                continue
+            if self._version == version:
+                return result
+        with self._lock:
+            return function(self._devices)
+
+    def _check_not_frozen(self) -> None:
+        """Check the devices of the tray can be changed.
+
+        Raises
+        ------
+            ValueError: If the tray is a snapshot.
+
+        """
+        if self._frozen:
+            msg = f'Tray {self.name} is a read-only snapshot.'
+            raise ValueError(msg)
+
+    def _detach(self) -> None:
+        """Copy the devices list if it is still shared with the last snapshot."""
+        if self._shared and self._devices is self._shared[-1].devices:
+            self._devices = list(self._devices)
+
+    def _preserve(self, device: Device) -> None:
+        """Give every snapshot still alive holding a device its own copy before the device changes.
+
+        The snapshots holding the device have seen it in the same state, so they share one copy.
+
+        Args:
+        ----
+            device (Device): The device about to change.
+
+        """
+        if not self._shared:
+            return
+        self._detach()
+        self._shared = [shared for shared in self._shared if shared.snapshots]
+        preserved = None
+        for shared in self._shared:
+            if shared.index is None:
+                shared.index = {id(candidate): index for index, candidate in enumerate(shared.devices)}
+            index = shared.index.pop(id(device), None)
+            if index is None:
+                continue
+            if preserved is None:
+                preserved = copy.copy(device)
+                preserved.position = Position(column=device.position.column, row=device.position.row)
+            shared.devices[index] = preserved
+            for snapshot in shared.snapshots:
+                snapshot._frozen_devices = None  # noqa: SLF001
+
+    @property
+    def journal(self) -> Journal | None:
+        """Gets the journal of the changes of the tray.
+
+        Returns
+        -------
+            Journal | None: The journal, None until `enable_journal` is called.
+
+        """
+        return self._journal
+
+    def enable_journal(self, max_entries: int | None = None) -> Journal:
+        """Start recording the changes of the tray in a journal.
+
+        Args:
+        ----
+            max_entries (int | None): The number of last changes kept at least, None to keep every change.
+                Ignored if the journal is already enabled.
+
+        Returns:
+        -------
+            Journal: The journal, recording the changes made from now on.
+
+        """
+        if self._journal is None:
+            self._journal = Journal(max_entries)
+        return self._journal
+
+    def changes_since(self, sequence: int) -> list[JournalEntry]:
+        """Get the changes of the tray recorded after a sequence number.
+
+        Args:
+        ----
+            sequence (int): The sequence number of the last change already processed, 0 for all.
+
+        Returns:
+        -------
+            list[JournalEntry]: The changes, in sequence order.
+
+        Raises:
+        ------
+            ValueError: If the journal is not enabled or changes after the sequence number were dropped.
+
+        """
+        if self._journal is None:
+            msg = f'Journal not enabled for tray {self.name}.'
+            raise ValueError(msg)
+        return self._journal.changes_since(sequence)
+
+    def subscribe(self, listener: TrayListener) -> None:
+        """Subscribe a listener to the changes of the tray.
+
+        The listener is weakly referenced, subscribing does not keep its owner alive.
+
+        Args:
+        ----
+            listener (TrayListener): The callable notified with the tray, the change, the device and the
+                previous values of the attributes changed by a move or an update.
+
+        """
+        reference = weakref.WeakMethod(listener) if hasattr(listener, '__self__') else weakref.ref(listener)
+        self._listeners.append(reference)
+
+    def unsubscribe(self, listener: TrayListener) -> None:
+        """Unsubscribe a listener from the changes of the tray.
+
+        Args:
+        ----
+            listener (TrayListener): The listener to unsubscribe.
+
+        """
+        self._listeners = [reference for reference in self._listeners if reference() not in (None, listener)]
+
+    def _notify(self, change: TrayChange, device: Device, previous: Mapping[str, object] = NO_CHANGES) -> None:
+        """Notify the listeners of a change.
+
+        Args:
+        ----
+            change (TrayChange): The change.
+            device (Device): The device affected by the change.
+            previous (Mapping[str, object]): The previous values of the changed attributes, per name.
+
+        """
+        if self._journal is not None:
+            self._journal.record(self, change, device, previous)
+        for reference in list(self._listeners):
+            listener = reference()
+            if listener is None:
+                self._listeners.remove(reference)
+            else:
+                listener(self, change, device, previous)
+
     def check_tray_size(self) -> None:
         """Check size of the tray.
 
@@ -186,9 +929,7 @@ class Tray:
             ValueError: If the tray size is too small for the number of devices.
 
         """
-        if len(self.devices) > self.tray_size:
-            msg = f'Tray is too small for the number of devices ({len(self.devices)}).'
-            raise ValueError(msg)
+        check_layout_size(tray_layout(self))
 
     def check_device_name(self) -> None:
         """Check device unique name.
@@ -198,16 +939,7 @@ class Tray:
             ValueError: If the device name is not unique.
 
         """
-        seen_names = set()
-        duplicate_names = set()
-        for device in self.devices:
-            if device.name in seen_names:
-                duplicate_names.add(device.name)
-            else:
-                seen_names.add(device.name)
-        if duplicate_names:
-            msg = f'Multiple identical name found ({", ".join(duplicate_names)}).'
-            raise ValueError(msg)
+        check_layout_device_name(tray_layout(self))
 
     def check_device_product(self) -> None:
         """Check device product are the same.
@@ -217,10 +949,7 @@ class Tray:
             ValueError: If the device product are not the same.
 
         """
-        unique_products = {device.product for device in self.devices}
-        if len(unique_products) > 1:
-            msg = f'Multiple differential product found ({", ".join(unique_products)}).'
-            raise ValueError(msg)
+        check_layout_device_product(tray_layout(self))
 
     def check_device_position(self) -> None:
         """Check device unique position.
@@ -230,17 +959,7 @@ class Tray:
             ValueError: If the device position is not unique.
 
         """
-        seen_positions = set()
-        duplicate_positions = set()
-        for device in self.devices:
-            if device.position in seen_positions:
-                duplicate_positions.add(device.position)
-            else:
-                seen_positions.add(device.position)
-        if duplicate_positions:
-            names = {', '.join([device.name for device in self.devices if device.position in duplicate_positions])}
-            msg = f'Multiple identical position found ({names}).'
-            raise ValueError(msg)
+        check_layout_device_position(tray_layout(self))
 
     def check_device_position_in_tray(self) -> None:
         """Check device position in tray.
@@ -250,28 +969,17 @@ class Tray:
             ValueError: If the device position is out of tray.
 
         """
-        issues = []
-        for device in self.devices:
-            if device.position.column >= self.max_column or device.position.row >= self.max_row:
-                issues = [
-                    device
-                    for device in self.devices
-                    if device.position.column >= self.max_column or device.position.row >= self.max_row
-                ]
-        if issues:
-            msg = f'Device out of tray found ({", ".join([device.name for device in issues])}).'
-            raise ValueError(msg)
+        check_layout_device_position_in_tray(tray_layout(self))
 
     def get_devices(self) -> pd.DataFrame:
         """Get the devices.
 
         Returns
         -------
-            pd.DataFrame: The devices
+            pd.DataFrame: The devices, with categorical product, die, package and corner columns.
 
         """
-        data = [device.values() for device in self.devices]
-        return pd.DataFrame(data, columns=Device.headings())
+        return self.read(devices_frame)
 
     def get_tray(self) -> pd.DataFrame:
         """Get the tray.
@@ -281,15 +989,71 @@ class Tray:
             pd.DataFrame: The tray
 
         """
-        data = []
-        for row in range(self.max_row):
-            col_data = []
-            for column in range(self.max_column):
-                position = Position(column, row)
-                device = self.found_device_per_position(position)
-                col_data.append(device.name if device is not None else '')
-            data.append(col_data)
-        return pd.DataFrame(data, columns=range(self.max_column))
+        import numpy as np
+        import pandas as pd
+
+        with span('tray.get_tray', tray=self.name):
+            grid = np.full((self.max_row, self.max_column), '', dtype=object)
+            rows, columns, names = self.get_grid_coordinates()
+            grid[rows, columns] = names
+            return pd.DataFrame(grid, columns=range(self.max_column), copy=False)
+
+    def get_sparse_tray(self) -> pd.DataFrame:
+        """Get the occupied cells of the tray as a coordinate list.
+
+        The memory scales with the number of devices instead of the area of the tray.
+
+        Returns
+        -------
+            pd.DataFrame: The row, column and device name of each occupied cell, in row major order.
+
+        """
+        import pandas as pd
+
+        with span('tray.get_sparse_tray', tray=self.name):
+            rows, columns, names = self.get_grid_coordinates()
+            return pd.DataFrame({'row': rows, 'column': columns, 'name': names})
+
+    def get_grid_coordinates(self) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.object_]]:
+        """Get the coordinates of the devices in the tray grid.
+
+        Devices out of the tray are left out, the first device found wins when several share a position.
+
+        Returns
+        -------
+            tuple[NDArray, NDArray, NDArray]: The rows, the columns and the names of the devices, in row major order.
+
+        """
+        import numpy as np
+
+        def coordinates(
+            devices: list[Device],
+        ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.object_]]:
+            count = len(devices)
+            rows = np.fromiter((device.position.row for device in devices), dtype=np.intp, count=count)
+            columns = np.fromiter((device.position.column for device in devices), dtype=np.intp, count=count)
+            names = np.fromiter((device.name for device in devices), dtype=object, count=count)
+            return rows, columns, names
+
+        rows, columns, names = self.read(coordinates)
+        inside = (rows >= 0) & (rows < self.max_row) & (columns >= 0) & (columns < self.max_column)
+        cells = rows[inside] * self.max_column + columns[inside]
+        cells, first = np.unique(cells, return_index=True)
+        return cells // self.max_column, cells % self.max_column, names[inside][first]
+
+    def diff(self, other: Tray) -> TrayDiff:
+        """Compare the tray with a newer layout of it, in time linear in the number of devices.
+
+        Args:
+        ----
+            other (Tray): The newer layout of the tray.
+
+        Returns:
+        -------
+            TrayDiff: The added, removed, moved and changed devices.
+
+        """
+        return diff_devices(self.devices, other.devices)
 
     def found_device_per_name(self, name: str) -> Device | None:
         """Get devices by name.
@@ -2,10 +2,29 @@
 
 from __future__ import annotations
 
-from e_lims_core.utils.dut.export.export2csv import Export2Csv
-from e_lims_core.utils.dut.export.export2xlsx import Export2Excel
-from e_lims_core.utils.dut.tray import Tray
-from e_lims_core.utils.files.file_props import FileProps
+import copy
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+from e_lims_core.utils.dut.device import Position
+from e_lims_core.utils.dut.diff import TrayDiff, diff_devices
+from e_lims_core.utils.dut.frames import trays_frame
+from e_lims_core.utils.dut.journal import Journal
+from e_lims_core.utils.dut.tray import NO_CHANGES, Tray, TrayChange
+from e_lims_core.utils.dut.validation import ValidationReport, validate_trays
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Mapping
+
+    import pandas as pd
+
+    from e_lims_core.utils.dut.device import Corner, Device
+    from e_lims_core.utils.dut.journal import JournalEntry
+    from e_lims_core.utils.files.file_props import FilePlan
+
+QUERY_ATTRIBUTES = ('corner', 'die', 'package', 'product')
 
 
 class Trays:
@@ -20,13 +39,734 @@ class Trays:
 
     def __init__(self, trays: list[Tray], file_props: FileProps) -> None:
         """Initialize the Trays object."""
-        self.trays = trays
+        self._trays: list[Tray] = trays
+        self._entries: list[tuple[Tray, Device] | None] = []
+        self._entry_ids: dict[tuple[int, int], list[int]] = {}
+        self._removed_entries = 0
+        self._query_index: dict[str, dict[Hashable, set[int]]] | None = None
+        self._indexed_sizes: dict[int, int] | None = None
+        self._serial_index: dict[str, list[tuple[Tray, Device]]] | None = None
+        self._name_index: dict[str, list[tuple[Tray, Device]]] | None = None
+        self._devices_view: pd.DataFrame | None = None
+        self._generation = 0
+        self._journal: Journal | None = None
+        self._pending: deque[tuple[Tray, TrayChange, Device, Mapping[str, object]]] = deque()
+        self._lock = threading.RLock()
+        for tray in trays:
+            tray.subscribe(self._on_tray_change)
         self.file_props = file_props
 
-    def export_csv(self) -> None:
-        """Export the trays to a CSV file."""
-        Export2Csv(trays=self.trays, file_props=self.file_props).export()
+    def __getstate__(self) -> dict[str, object]:
+        """Get the state of the trays for pickling and copying, without the lock.
+
+        The query indexes are keyed on the identity of the trays and devices, they are left out and
+        rebuilt on the next query.
+
+        Returns
+        -------
+            dict[str, object]: The state of the trays.
+
+        """
+        with self._lock:
+            self._apply_pending_changes()
+            state = self.__dict__.copy()
+        del state['_lock']
+        state['_pending'] = deque()
+        state['_entries'] = []
+        state['_entry_ids'] = {}
+        state['_removed_entries'] = 0
+        state['_query_index'] = None
+        state['_indexed_sizes'] = None
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore the state of the trays and subscribe again to the changes of the trays.
+
+        Args:
+        ----
+            state (dict[str, object]): The state of the trays.
+
+        """
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        for tray in self._trays:
+            tray.subscribe(self._on_tray_change)
+
+    @classmethod
+    def pack(
+        cls,
+        devices: Iterable[Device],
+        product: str,
+        file_props: FileProps,
+        name: str = 'tray',
+        max_column: int = 31,
+        max_row: int = 14,
+        group_by: str | None = None,
+    ) -> Trays:
+        """Pack devices into the minimum number of trays in a single pass.
+
+        The devices are placed row by row in the order they come, their position is assigned
+        and a new tray is opened whenever the current one is full. When grouping, each group
+        value gets its own trays. Trays are numbered from 1 in the order they are opened.
+
+        Args:
+        ----
+            devices (Iterable[Device]): The devices to pack, their position is overwritten.
+            product (str): The product identifier of the devices.
+            file_props (FileProps): The file properties.
+            name (str): The name of the trays.
+            max_column (int): The maximum number of columns of each tray.
+            max_row (int): The maximum number of rows of each tray.
+            group_by (str | None): The device attribute the trays are not mixed on, one of `QUERY_ATTRIBUTES`.
+
+        Returns:
+        -------
+            Trays: The packed trays.
+
+        Raises:
+        ------
+            ValueError: If the grouping attribute is unknown or a device is of another product.
+
+        """
+        if group_by is not None and group_by not in QUERY_ATTRIBUTES:
+            msg = f'Unknown group attribute: {group_by}, expected one of {", ".join(QUERY_ATTRIBUTES)}.'
+            raise ValueError(msg)
+        tray_size = max_column * max_row
+        trays: list[Tray] = []
+        open_trays: dict[Hashable, Tray] = {}
+        for device in devices:
+            if device.product != product:
+                msg = f'Device {device.name} of product {device.product} cannot be packed with product {product}.'
+                raise ValueError(msg)
+            key = getattr(device, group_by) if group_by is not None else None
+            tray = open_trays.get(key)
+            if tray is None or len(tray.devices) == tray_size:
+                tray = Tray(name, len(trays) + 1, product, [], max_column=max_column, max_row=max_row)
+                trays.append(tray)
+                open_trays[key] = tray
+            index = len(tray.devices)
+            device.position = Position(column=index % max_column, row=index // max_column)
+            tray.devices.append(device)
+        return cls(trays, file_props)
+
+    @property
+    def trays(self) -> list[Tray]:
+        """Gets the trays of devices.
+
+        Returns
+        -------
+            list[Tray]: The trays of devices.
+
+        """
+        return self._trays
+
+    @trays.setter
+    def trays(self, trays: list[Tray]) -> None:
+        """Set the trays of devices and subscribe to their changes.
+
+        Args:
+        ----
+            trays (list[Tray]): The trays of devices.
+
+        """
+        with self._lock:
+            self._apply_pending_changes()
+            for tray in self._trays:
+                tray.unsubscribe(self._on_tray_change)
+                self._record_tray(tray, TrayChange.REMOVED)
+            self._trays = trays
+            for tray in trays:
+                tray.subscribe(self._on_tray_change)
+                self._record_tray(tray, TrayChange.ADDED)
+            self.invalidate()
+
+    def add_tray(self, tray: Tray) -> None:
+        """Add a tray and subscribe to its changes.
+
+        Args:
+        ----
+            tray (Tray): The tray to add.
+
+        """
+        with self._lock:
+            self._apply_pending_changes()
+            self._trays.append(tray)
+            tray.subscribe(self._on_tray_change)
+            self._record_tray(tray, TrayChange.ADDED)
+            self._invalidate_views()
+            if self._indexed_sizes is not None:
+                self._indexed_sizes[id(tray)] = len(tray.devices)
+            for device in tray.devices.copy():
+                self._index_device(tray, device)
+                self._query_device(tray, device)
+
+    def remove_tray(self, tray: Tray) -> None:
+        """Remove a tray and unsubscribe from its changes.
+
+        Args:
+        ----
+            tray (Tray): The tray to remove.
+
+        """
+        with self._lock:
+            self._apply_pending_changes()
+            self._trays.remove(tray)
+            tray.unsubscribe(self._on_tray_change)
+            self._record_tray(tray, TrayChange.REMOVED)
+            self._invalidate_views()
+            if self._indexed_sizes is not None:
+                self._indexed_sizes.pop(id(tray), None)
+            for device in tray.devices.copy():
+                self._unindex_device(tray, device)
+                self._unquery_device(tray, device)
+
+    @property
+    def journal(self) -> Journal | None:
+        """Gets the journal of the changes of the trays.
+
+        Returns
+        -------
+            Journal | None: The journal, None until `enable_journal` is called.
+
+        """
+        with self._lock:
+            self._apply_pending_changes()
+            return self._journal
+
+    def enable_journal(self, max_entries: int | None = None) -> Journal:
+        """Start recording the changes of the trays in a journal.
+
+        Args:
+        ----
+            max_entries (int | None): The number of last changes kept at least, None to keep every change.
+                Ignored if the journal is already enabled.
+
+        Returns:
+        -------
+            Journal: The journal, recording the changes made from now on.
+
+        """
+        with self._lock:
+            self._apply_pending_changes()
+            if self._journal is None:
+                self._journal = Journal(max_entries)
+            return self._journal
+
+    def changes_since(self, sequence: int) -> list[JournalEntry]:
+        """Get the changes of the trays recorded after a sequence number.
+
+        Args:
+        ----
+            sequence (int): The sequence number of the last change already processed, 0 for all.
+
+        Returns:
+        -------
+            list[JournalEntry]: The changes, in sequence order.
+
+        Raises:
+        ------
+            ValueError: If the journal is not enabled or changes after the sequence number were dropped.
+
+        """
+        with self._lock:
+            self._apply_pending_changes()
+            if self._journal is None:
+                msg = 'Journal not enabled for the trays.'
+                raise ValueError(msg)
+            return self._journal.changes_since(sequence)
+
+    def _record_tray(self, tray: Tray, change: TrayChange) -> None:
+        """Record a change for every device of a tray.
+
+        Args:
+        ----
+            tray (Tray): The tray added or removed.
+            change (TrayChange): The change.
+
+        """
+        if self._journal is None:
+            return
+        for device in tray.devices.copy():
+            self._journal.record(tray, change, device, NO_CHANGES)
+
+    def invalidate(self) -> None:
+        """Invalidate the indexes, they are rebuilt on the next query.
+
+        Changes made through the `Tray` and `Trays` methods update the indexes automatically.
+        A query or a lookup also rebuilds them when the number of trays or the number of devices of a tray
+        changed without notification, by mutating the `trays` or `Tray.devices` lists directly.
+        Call it after any other direct change: mutating a device attribute in place, or replacing
+        a tray or a device in these lists.
+
+        """
+        with self._lock:
+            self._apply_pending_changes()
+            self._invalidate_views()
+            self._indexed_sizes = None
+            self._query_index = None
+            self._serial_index = None
+            self._name_index = None
+
+    def _check_indexes(self) -> None:
+        """Apply the pending changes and invalidate the indexes if devices or trays were added or removed directly.
+
+        The indexes keep the number of devices they hold per tray, compared with the trays in
+        time linear in the number of trays.
+
+        """
+        self._apply_pending_changes()
+        sizes = self._indexed_sizes
+        if sizes is not None and (
+            len(sizes) != len(self._trays) or any(sizes.get(id(tray)) != len(tray.devices) for tray in self._trays)
+        ):
+            self.invalidate()
+        if self._indexed_sizes is None:
+            self._indexed_sizes = {id(tray): len(tray.devices) for tray in self._trays}
+
+    def _invalidate_views(self) -> None:
+        """Drop the devices view, it is rebuilt on the next use."""
+        self._devices_view = None
+        self._generation += 1
+
+    def locate(self, serial: str) -> list[tuple[Tray, Position]]:
+        """Locate the devices with a serial number across all trays.
+
+        Args:
+        ----
+            serial (str): The serial number of the device.
+
+        Returns:
+        -------
+            list[tuple[Tray, Position]]: The tray and position of every matching device.
+
+        """
+        with self._lock:
+            self._check_indexes()
+            serial_index, _ = self._build_lookup_indexes()
+            return [(tray, device.position) for tray, device in serial_index.get(serial, [])]
+
+    def found_devices_per_name(self, name: str) -> list[tuple[Tray, Device]]:
+        """Get the devices by name across all trays.
+
+        Args:
+        ----
+            name (str): The name of the device.
+
+        Returns:
+        -------
+            list[tuple[Tray, Device]]: The tray and device of every matching device.
+
+        """
+        with self._lock:
+            self._check_indexes()
+            _, name_index = self._build_lookup_indexes()
+            return list(name_index.get(name, []))
+
+    def query(
+        self,
+        corner: Corner | None = None,
+        die: str | None = None,
+        package: str | None = None,
+        product: str | None = None,
+    ) -> list[Device]:
+        """Query the devices of all trays matching every given criteria.
+
+        Args:
+        ----
+            corner (Corner | None): The corner type to filter on.
+            die (str | None): The die identifier to filter on.
+            package (str | None): The package identifier to filter on.
+            product (str | None): The product identifier to filter on.
+
+        Returns:
+        -------
+            list[Device]: The matching devices, in tray order.
+
+        """
+        with self._lock:
+            self._check_indexes()
+            index = self._build_query_index()
+            criteria = {'corner': corner, 'die': die, 'package': package, 'product': product}
+            matches = [index[attribute].get(value, set()) for attribute, value in criteria.items() if value is not None]
+            if matches:
+                matches.sort(key=len)
+                device_ids = sorted(matches[0].intersection(*matches[1:]))
+            else:
+                device_ids = [device_id for device_id, entry in enumerate(self._entries) if entry is not None]
+            entries = [entry for entry in (self._entries[device_id] for device_id in device_ids) if entry is not None]
+            ranks = {id(tray): rank for rank, tray in enumerate(self._trays)}
+            # The ids follow the device order within a tray, a stable sort restores the tray order.
+            entries.sort(key=lambda entry: ranks.get(id(entry[0]), len(ranks)))
+            return [device for _, device in entries]
+
+    def _build_query_index(self) -> dict[str, dict[Hashable, set[int]]]:
+        """Build the inverted indexes attribute value to device ids if needed.
+
+        Returns
+        -------
+            dict[str, dict[Hashable, set[int]]]: The inverted indexes per attribute.
+
+        """
+        if self._query_index is None:
+            self._entries = []
+            self._entry_ids = {}
+            self._removed_entries = 0
+            self._query_index = {attribute: {} for attribute in QUERY_ATTRIBUTES}
+            for tray in self._trays:
+                for device in tray.devices.copy():
+                    self._query_device(tray, device)
+        return self._query_index
+
+    def _query_device(self, tray: Tray, device: Device) -> None:
+        """Add a device to the query indexes, if built.
+
+        Args:
+        ----
+            tray (Tray): The tray holding the device.
+            device (Device): The device to index.
+
+        """
+        index = self._query_index
+        if index is None:
+            return
+        device_id = len(self._entries)
+        self._entries.append((tray, device))
+        self._entry_ids.setdefault((id(tray), id(device)), []).append(device_id)
+        index['corner'].setdefault(device.corner, set()).add(device_id)
+        index['die'].setdefault(device.die, set()).add(device_id)
+        index['package'].setdefault(device.package, set()).add(device_id)
+        index['product'].setdefault(device.product, set()).add(device_id)
+
+    def _unquery_device(self, tray: Tray, device: Device) -> None:
+        """Remove a device from the query indexes, if built.
+
+        The ids are not reused, the indexes are dropped once most of them are removed.
+
+        Args:
+        ----
+            tray (Tray): The tray holding the device.
+            device (Device): The device to remove from the indexes.
+
+        """
+        index = self._query_index
+        if index is None:
+            return
+        key = (id(tray), id(device))
+        device_ids = self._entry_ids.get(key)
+        if not device_ids:
+            return
+        device_id = device_ids.pop()
+        if not device_ids:
+            del self._entry_ids[key]
+        self._entries[device_id] = None
+        for attribute in QUERY_ATTRIBUTES:
+            self._discard_id(index[attribute], getattr(device, attribute), device_id)
+        self._removed_entries += 1
+        if self._removed_entries * 2 > len(self._entries):
+            self._query_index = None
+
+    def _requery_device(self, tray: Tray, device: Device, previous: Mapping[str, object]) -> None:
+        """Move a device to the values of its updated attributes in the query indexes, if built.
+
+        Args:
+        ----
+            tray (Tray): The tray holding the device.
+            device (Device): The updated device.
+            previous (Mapping[str, object]): The previous values of the updated attributes, per name.
+
+        """
+        index = self._query_index
+        if index is None:
+            return
+        for device_id in self._entry_ids.get((id(tray), id(device)), []):
+            for attribute in QUERY_ATTRIBUTES:
+                if attribute in previous:
+                    self._discard_id(index[attribute], previous[attribute], device_id)
+                    index[attribute].setdefault(getattr(device, attribute), set()).add(device_id)
+
+    @staticmethod
+    def _discard_id(index: dict[Hashable, set[int]], value: object, device_id: int) -> None:
+        """Remove a device id from the ids of a value, and the value once it has no ids.
+
+        Args:
+        ----
+            index (dict[Hashable, set[int]]): The inverted index of an attribute.
+            value (object): The attribute value.
+            device_id (int): The device id.
+
+        """
+        device_ids = index.get(value)
+        if device_ids is not None:
+            device_ids.discard(device_id)
+            if not device_ids:
+                del index[value]
+
+    def _build_lookup_indexes(
+        self,
+    ) -> tuple[dict[str, list[tuple[Tray, Device]]], dict[str, list[tuple[Tray, Device]]]]:
+        """Build the serial and name hash indexes in one pass if needed.
+
+        Returns
+        -------
+            tuple[dict, dict]: The serial and name indexes.
+
+        """
+        if self._serial_index is None or self._name_index is None:
+            serial_index: dict[str, list[tuple[Tray, Device]]] = {}
+            name_index: dict[str, list[tuple[Tray, Device]]] = {}
+            for tray in self._trays:
+                for device in tray.devices.copy():
+                    serial_index.setdefault(device.serial, []).append((tray, device))
+                    name_index.setdefault(device.name, []).append((tray, device))
+            self._serial_index, self._name_index = serial_index, name_index
+        return self._serial_index, self._name_index
+
+    def _index_device(self, tray: Tray, device: Device) -> None:
+        """Add a device to the serial and name indexes, if built and not already indexed.
+
+        Args:
+        ----
+            tray (Tray): The tray holding the device.
+            device (Device): The device to index.
+
+        """
+        for index, key in ((self._serial_index, device.serial), (self._name_index, device.name)):
+            if index is None:
+                continue
+            entries = index.setdefault(key, [])
+            if not any(entry[0] is tray and entry[1] is device for entry in entries):
+                entries.append((tray, device))
+
+    def _unindex_device(self, tray: Tray, device: Device, previous: Mapping[str, object] | None = None) -> None:
+        """Remove a device from the serial and name indexes, if built.
+
+        Args:
+        ----
+            tray (Tray): The tray holding the device.
+            device (Device): The device to remove from the indexes.
+            previous (Mapping[str, object] | None): The previous values of the updated attributes, per name,
+                to remove the device from its previous serial and name.
+
+        """
+        previous = previous or {}
+        serial = str(previous.get('serial', device.serial))
+        name = str(previous.get('name', device.name))
+        for index, key in ((self._serial_index, serial), (self._name_index, name)):
+            if index is None:
+                continue
+            entries = [entry for entry in index.get(key, []) if entry[0] is not tray or entry[1] is not device]
+            if entries:
+                index[key] = entries
+            else:
+                index.pop(key, None)
+
+    def _on_tray_change(self, tray: Tray, change: TrayChange, device: Device, previous: Mapping[str, object]) -> None:
+        """Queue a change of a tray, it is applied to the indexes and the journal before the next read.
+
+        The listener is called under the lock of the tray, it never waits for the lock of the trays:
+        the pending changes are applied right away only if the lock is free, otherwise by the reader
+        or the writer holding it.
+
+        Args:
+        ----
+            tray (Tray): The tray that changed.
+            change (TrayChange): The change.
+            device (Device): The device affected by the change.
+            previous (Mapping[str, object]): The previous values of the changed attributes, per name.
+
+        """
+        self._pending.append((tray, change, device, previous))
+        if self._lock.acquire(blocking=False):
+            try:
+                self._apply_pending_changes()
+            finally:
+                self._lock.release()
+
+    def _apply_pending_changes(self) -> None:
+        """Apply the pending changes of the trays in order, under the lock of the trays.
+
+        The serial, name and query indexes are updated incrementally, an update only re-keys the
+        updated device. The devices view is rebuilt on the next use. The changes are recorded in the
+        journal, if enabled.
+
+        """
+        if not self._pending:
+            return
+        self._invalidate_views()
+        while self._pending:
+            tray, change, device, previous = self._pending.popleft()
+            if self._journal is not None:
+                self._journal.record(tray, change, device, previous)
+            if self._indexed_sizes is not None and change in (TrayChange.ADDED, TrayChange.REMOVED):
+                count = 1 if change is TrayChange.ADDED else -1
+                self._indexed_sizes[id(tray)] = self._indexed_sizes.get(id(tray), 0) + count
+            if change is TrayChange.ADDED:
+                self._index_device(tray, device)
+                self._query_device(tray, device)
+            elif change is TrayChange.REMOVED:
+                self._unindex_device(tray, device)
+                self._unquery_device(tray, device)
+            elif change is TrayChange.UPDATED:
+                if 'serial' in previous or 'name' in previous:
+                    self._unindex_device(tray, device, previous)
+                    self._index_device(tray, device)
+                self._requery_device(tray, device, previous)
+
+    def get_devices(self) -> pd.DataFrame:
+        """Get the devices of all trays in a single DataFrame.
+
+        Returns
+        -------
+            pd.DataFrame: The devices, with the tray name, tray number, row and column of each device.
+
+        """
+        with self._lock:
+            trays = list(self._trays)
+        return trays_frame(trays)
+
+    def get_devices_view(self) -> pd.DataFrame:
+        """Get the devices of all trays indexed by tray, row and column.
+
+        The view is cached until the trays change, do not modify it in place.
+
+        Returns
+        -------
+            pd.DataFrame: The devices, with a (tray, row, column) MultiIndex.
+
+        """
+        with self._lock:
+            self._apply_pending_changes()
+            view, generation = self._devices_view, self._generation
+        if view is None:
+            view = self.get_devices().set_index(['tray', 'row', 'column'])
+            with self._lock:
+                self._apply_pending_changes()
+                if self._generation == generation:
+                    self._devices_view = view
+        return view
+
+    def snapshot(self) -> Trays:
+        """Take a read-only snapshot of the trays.
+
+        Each tray is snapshot in constant time, see `Tray.snapshot`, so the snapshot costs one
+        small object per tray and shares every device with the trays.
+
+        Returns
+        -------
+            Trays: The snapshot, with a copy of the file properties.
+
+        """
+        return Trays([tray.snapshot() for tray in self._trays], copy.copy(self.file_props))
+
+    def diff(self, other: Trays) -> dict[str, TrayDiff]:
+        """Compare the trays with a newer layout of them, matching the trays by name.
+
+        A tray only found in one of the layouts has all its devices added or removed, a device
+        changing tray is removed from one tray and added to the other.
+
+        Args:
+        ----
+            other (Trays): The newer layout of the trays.
+
+        Returns:
+        -------
+            dict[str, TrayDiff]: The differences per tray name, for the trays that changed.
+
+        """
+        before = {tray.name: tray for tray in self._trays}
+        after = {tray.name: tray for tray in other.trays}
+        diffs = {}
+        for name in {**before, **after}:
+            previous, current = before.get(name), after.get(name)
+            result = diff_devices(
+                previous.devices if previous is not None else [],
+                current.devices if current is not None else [],
+            )
+            if not result.is_empty:
+                diffs[name] = result
+        return diffs
+
+    def validate(self, max_workers: int | None = None) -> ValidationReport:
+        """Validate every tray and the consistency between trays.
+
+        Args:
+        ----
+            max_workers (int | None): The number of worker processes, None or 1 to check the trays in the
+                current process.
+
+        Returns:
+        -------
+            ValidationReport: The consolidated report.
+
+        """
+        return validate_trays(self._trays, max_workers=max_workers)
+
+    def plan_files(self, suffix: FileSuffix | None = None) -> FilePlan:
+        """Plan the paths of one file per tray, in one pass, see `FileProps.plan`.
+
+        Args:
+        ----
+            suffix (FileSuffix | None): The suffix of the files, defaults to the suffix of the file properties.
+
+        Returns:
+        -------
+            FilePlan: The file path per tray name and the collisions.
+
+        """
+        with self._lock:
+            names = [tray.name for tray in self._trays]
+        return self.file_props.plan(names, suffix)
+
+    def export(self, suffix: FileSuffix | str, **options: object) -> None:
+        """Export the trays with the export registered for a suffix, see `register_export`.
+
+        Args:
+        ----
+            suffix (FileSuffix | str): The suffix, or its value such as '.csv'.
+            **options (object): The options of the export, such as `sparse` or `compress`.
+
+        Raises:
+        ------
+            ValueError: If the export writes one file per tray and several trays would be written
+                to the same file, see `plan_files`.
+
+        """
+        from e_lims_core.utils.dut.export.export import get_export
+
+        export = get_export(FileSuffix(suffix))
+        export(trays=self.trays, file_props=self.file_props, **options).export()
+
+    def export_csv(self, *, sparse: bool = False) -> None:
+        """Export the trays to CSV files, one file per tray named after it.
+
+        Args:
+        ----
+            sparse (bool): True to only build the occupied cells, for large and sparsely populated trays.
+
+        Raises:
+        ------
+            ValueError: If several trays would be written to the same file, nothing is written then.
+
+        """
+        self.export(FileSuffix.CSV, sparse=sparse)
+
+    def export_excel(self, *, sparse: bool = False, corner_colors: bool = False) -> None:
+        """Export the trays to an Excel file.
+
+        Args:
+        ----
+            sparse (bool): True to only write the occupied cells and the outer border of each tray.
+            corner_colors (bool): True to colour the devices by corner with conditional formatting rules.
+
+        """
+        self.export(FileSuffix.XLSX, sparse=sparse, corner_colors=corner_colors)
+
+    def export_jsonl(self, *, compress: bool = False) -> None:
+        """Export the devices to a JSON Lines file, one record per device.
+
+        Args:
+        ----
+            compress (bool): True to compress the file with gzip.
 
-    def export_excel(self) -> None:
-        """Export the trays to an Excel file."""
-        Export2Excel(trays=self.trays, file_props=self.file_props).export()
+        """
+        self.export(FileSuffix.JSONL, compress=compress)
@@ -0,0 +1,205 @@
+"""Module used to validate trays of devices under test (DUT) as a whole lot."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from e_lims_core.utils.dut.tray import LAYOUT_CHECKS, TrayLayout, tray_layout
+from e_lims_core.utils.metrics.instrumentation import span
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from e_lims_core.utils.dut.tray import Tray
+
+SHEET_NAME_MAX_LENGTH = 31
+SHEET_NAME_INVALID_CHARACTERS = frozenset('[]:*?/\\')
+
+
+@dataclass
+class ValidationIssue:
+    """ValidationIssue class representing a consistency issue found in a lot.
+
+    Attributes
+    ----------
+        trays (list[str]): The names of the trays involved.
+        message (str): The description of the issue.
+
+    """
+
+    trays: list[str]
+    message: str
+
+
+@dataclass
+class ValidationReport:
+    """ValidationReport class representing the consolidated result of a lot validation.
+
+    Attributes
+    ----------
+        issues (list[ValidationIssue]): The issues found.
+
+    """
+
+    issues: list[ValidationIssue] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if no issue was found.
+
+        Returns
+        -------
+            bool: True if the lot is valid, False otherwise.
+
+        """
+        return not self.issues
+
+    def raise_for_issues(self) -> None:
+        """Raise an error listing every issue found.
+
+        Raises
+        ------
+            ValueError: If at least one issue was found.
+
+        """
+        if self.issues:
+            msg = '\n'.join(f'{", ".join(issue.trays)}: {issue.message}' for issue in self.issues)
+            raise ValueError(msg)
+
+
+def check_tray(tray: Tray) -> list[str]:
+    """Run every check of a tray and collect the failures.
+
+    Args:
+    ----
+        tray (Tray): The tray to check.
+
+    Returns:
+    -------
+        list[str]: The messages of the failed checks.
+
+    """
+    return check_tray_layout(tray_layout(tray))
+
+
+def check_tray_layout(layout: TrayLayout) -> list[str]:
+    """Run every check of a tray on its compact layout and collect the failures.
+
+    Args:
+    ----
+        layout (TrayLayout): The layout of the tray, from `tray_layout`.
+
+    Returns:
+    -------
+        list[str]: The messages of the failed checks.
+
+    """
+    return [message for message in (_run_check(check, layout) for check in LAYOUT_CHECKS) if message is not None]
+
+
+def _run_check(check: Callable[[TrayLayout], None], layout: TrayLayout) -> str | None:
+    """Run a check of a tray.
+
+    Args:
+    ----
+        check (Callable[[TrayLayout], None]): The check, raising a ValueError when it fails.
+        layout (TrayLayout): The layout of the tray.
+
+    Returns:
+    -------
+        str | None: The message of the failure, None if the check passed.
+
+    """
+    try:
+        check(layout)
+    except ValueError as error:
+        return str(error)
+    return None
+
+
+def check_trays(trays: Iterable[Tray]) -> list[ValidationIssue]:
+    """Check the consistency between trays in a single pass.
+
+    Detects serials and device names used in several trays, tray numbers reused within
+    a product and tray names that are not usable or collide as Excel sheet names.
+
+    Args:
+    ----
+        trays (Iterable[Tray]): The trays to check.
+
+    Returns:
+    -------
+        list[ValidationIssue]: The issues found.
+
+    """
+    serials: dict[str, dict[int, str]] = {}
+    names: dict[str, dict[int, str]] = {}
+    numbers: dict[tuple[str, int], list[str]] = {}
+    sheets: dict[str, list[str]] = {}
+    issues = []
+    for tray in trays:
+        for device in tray.devices:
+            serials.setdefault(device.serial, {})[id(tray)] = tray.name
+            names.setdefault(device.name, {})[id(tray)] = tray.name
+        numbers.setdefault((tray.product, tray.number), []).append(tray.name)
+        sheets.setdefault(tray.name[:SHEET_NAME_MAX_LENGTH].lower(), []).append(tray.name)
+        if SHEET_NAME_INVALID_CHARACTERS.intersection(tray.name):
+            issues.append(ValidationIssue([tray.name], 'Tray name contains characters invalid in a sheet name.'))
+    issues.extend(
+        ValidationIssue(list(tray_names.values()), f'Serial {serial} found in multiple trays.')
+        for serial, tray_names in serials.items()
+        if len(tray_names) > 1
+    )
+    issues.extend(
+        ValidationIssue(list(tray_names.values()), f'Device name {name} found in multiple trays.')
+        for name, tray_names in names.items()
+        if len(tray_names) > 1
+    )
+    issues.extend(
+        ValidationIssue(tray_names, f'Tray number {number} reused for product {product}.')
+        for (product, number), tray_names in numbers.items()
+        if len(tray_names) > 1
+    )
+    issues.extend(
+        ValidationIssue(tray_names, f'Tray names collide as sheet name {sheet}.')
+        for sheet, tray_names in sheets.items()
+        if len(tray_names) > 1
+    )
+    return issues
+
+
+def validate_trays(trays: list[Tray], max_workers: int | None = None) -> ValidationReport:
+    """Validate every tray and the consistency between trays.
+
+    The checks are linear in the number of devices, the trays are checked in the current process
+    unless several workers are requested. The workers only receive the compact layout of each tray.
+
+    Args:
+    ----
+        trays (list[Tray]): The trays to validate.
+        max_workers (int | None): The number of worker processes, None or 1 to check the trays in the
+            current process.
+
+    Returns:
+    -------
+        ValidationReport: The consolidated report.
+
+    """
+    workers = max_workers or 1
+    with span('validation.trays', trays=len(trays), workers=workers):
+        if workers == 1 or len(trays) < 2:
+            results = [check_tray(tray) for tray in trays]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            layouts = [tray_layout(tray) for tray in trays]
+            chunksize = max(1, len(trays) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(check_tray_layout, layouts, chunksize=chunksize))
+    report = ValidationReport()
+    for tray, messages in zip(trays, results, strict=True):
+        report.issues.extend(ValidationIssue([tray.name], message) for message in messages)
+    with span('validation.cross', trays=len(trays)):
+        report.issues.extend(check_trays(trays))
+    return report
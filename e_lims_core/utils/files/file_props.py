@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
-import re
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
 
 from e_lims_core.utils.files.timestamp import TimeStamp
+from e_lims_core.utils.validators.policy import validate
+from e_lims_core.utils.validators.registry import VALIDATORS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+T = TypeVar('T')
+
+_check_name = VALIDATORS['file_name']
+_DIRECTORIES: set[Path] = set()
 
 
 class FileSuffix(Enum):
@@ -14,11 +25,86 @@ class FileSuffix(Enum):
 
     CSV = '.csv'
     XLSX = '.xlsx'
+    JSONL = '.jsonl'
+
+
+def ensure_directory(path: Path, *, cached: bool = True) -> None:
+    """Create a directory and its parents, if they do not exist.
+
+    The directories created or found are cached per absolute path, so the following calls do not
+    reach the filesystem. A directory removed afterwards is created again when a file is written
+    in it, see `call_with_directory`.
+
+    Args:
+    ----
+    path : Path
+        The directory path.
+    cached : bool, optional
+        Whether a directory already created or found is trusted to still exist. Defaults to True.
+
+    """
+    directory = path.absolute()
+    if cached and directory in _DIRECTORIES:
+        return
+    path.mkdir(mode=0o777, parents=True, exist_ok=True)
+    _DIRECTORIES.add(directory)
+
+
+def call_with_directory(path: Path, function: Callable[[Path], T]) -> T:
+    """Call a function writing a file, creating the directory of the file again if it was removed.
+
+    Args:
+    ----
+    path : Path
+        The file path.
+    function : Callable[[Path], T]
+        The function opening or writing the file.
+
+    Returns:
+    -------
+    T
+        The result of the function.
+
+    """
+    try:
+        return function(path)
+    except FileNotFoundError:
+        ensure_directory(path.parent, cached=False)
+        return function(path)
+
+
+@dataclass
+class FilePlan:
+    """FilePlan class representing the output paths planned for many files.
+
+    Attributes
+    ----------
+        targets (dict[str, Path]): The file path, per name.
+        collisions (dict[Path, list[str]]): The names sharing a file path, per file path.
+
+    """
+
+    targets: dict[str, Path] = field(default_factory=dict)
+    collisions: dict[Path, list[str]] = field(default_factory=dict)
+
+    def raise_for_collisions(self) -> None:
+        """Raise an error listing every collision found.
+
+        Raises
+        ------
+            ValueError: If at least two names share a file path.
+
+        """
+        if self.collisions:
+            msg = '\n'.join(f'{", ".join(names)}: collide as {path}' for path, names in self.collisions.items())
+            raise ValueError(msg)
 
 
 class FileProps:
     """Represents the properties of a file.
 
+    The name is checked according to the current `ValidationPolicy`.
+
     Attributes
     ----------
         path (Path): The directory path where the file is or will be stored.
@@ -50,16 +136,16 @@ class FileProps:
         Notes:
         -----
         If the directory specified by `path` does not exist, it will be created with
-        permissions `0o777`.
+        permissions `0o777`, see `ensure_directory`.
 
         """
         self.path = path
         self.name = name
         self.suffix = suffix
         self.timestamp = timestamp
+        self._file_path: tuple[tuple[object, ...], Path] | None = None
 
-        if not self.path.exists():
-            self.path.mkdir(mode=0o777, parents=True, exist_ok=True)
+        ensure_directory(self.path)
 
     @property
     def name(self) -> str:
@@ -87,21 +173,77 @@ class FileProps:
             If the name does not match the validation pattern.
 
         """
-        pattern = r'^(?=(?:[^a-zA-Z]*[a-zA-Z]){6})[a-zA-Z0-9_-]+$'
-        if not bool(re.match(pattern, name)):
-            msg = f'Invalid name: {name}, authorized characters are ' f'minimum 6 alphabetic, numeric, and _-'
-            raise ValueError(msg)
+        validate(_check_name, name)
         self._name = name
 
     def file_path(self) -> Path:
         """Generate the full file path, including the name, timestamp (if available), and suffix.
 
+        The path is cached until the path, name, suffix or timestamp changes.
+
         Returns
         -------
         Path
             The full file path, with the name, timestamp (if available), and suffix.
 
         """
-        if self.timestamp:
-            return self.path / f'{self.name}_{self.timestamp.stamp}{self.suffix.value}'.lower()
-        return self.path / f'{self.name}{self.suffix.value}'.lower()
+        stamp = self.timestamp.stamp if self.timestamp else None
+        key = (self.path, self._name, self.suffix, stamp)
+        if self._file_path is None or self._file_path[0] != key:
+            self._file_path = (key, self.path / self._file_name(self._name, self.suffix, stamp))
+        return self._file_path[1]
+
+    def plan(self, names: Iterable[str], suffix: FileSuffix | None = None) -> FilePlan:
+        """Plan the paths of many files sharing the path and timestamp, in one pass.
+
+        The names are checked according to the current `ValidationPolicy` and the directory is
+        created once. Since the file names are lowercased, names differing only in case collide.
+
+        Args:
+        ----
+        names : Iterable[str]
+            The names of the files.
+        suffix : FileSuffix, optional
+            The suffix of the files. Defaults to the suffix of the file properties.
+
+        Returns:
+        -------
+        FilePlan
+            The file path per name and the collisions.
+
+        """
+        suffix = suffix or self.suffix
+        stamp = self.timestamp.stamp if self.timestamp else None
+        plan = FilePlan()
+        paths: dict[Path, list[str]] = {}
+        for name in names:
+            validate(_check_name, name)
+            path = self.path / self._file_name(name, suffix, stamp)
+            plan.targets[name] = path
+            paths.setdefault(path, []).append(name)
+        plan.collisions = {path: names for path, names in paths.items() if len(names) > 1}
+        ensure_directory(self.path)
+        return plan
+
+    @staticmethod
+    def _file_name(name: str, suffix: FileSuffix, stamp: str | None) -> str:
+        """Build a file name.
+
+        Args:
+        ----
+        name : str
+            The name of the file.
+        suffix : FileSuffix
+            The suffix of the file.
+        stamp : str, optional
+            The timestamp of the file.
+
+        Returns:
+        -------
+        str
+            The lowercased file name.
+
+        """
+        if stamp is not None:
+            return f'{name}_{stamp}{suffix.value}'.lower()
+        return f'{name}{suffix.value}'.lower()
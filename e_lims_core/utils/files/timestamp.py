@@ -2,7 +2,38 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import tzinfo
+
+
+@lru_cache(maxsize=64)
+def _format_date(year: int, month: int, day: int) -> str:
+    """Format a date as a string in 'YYYY_MM_DD' format, cached for the consecutive stamps.
+
+    Returns
+    -------
+        str: The date as a string in 'YYYY_MM_DD' format.
+
+    """
+    return f'{year}_{month:02}_{day:02}'
+
+
+@lru_cache(maxsize=4096)
+def _format_time(hour: int, minute: int, second: int) -> str:
+    """Format a time as a string in 'HHMMSS' format, cached for the consecutive stamps.
+
+    Returns
+    -------
+        str: The time as a string in 'HHMMSS' format.
+
+    """
+    return f'{hour:02}{minute:02}{second:02}'
 
 
 class TimeStamp:
@@ -18,19 +49,26 @@ class TimeStamp:
         minute (int): The minute component extracted from `raw_time`.
         second (int): The second component extracted from `raw_time`.
         microsecond (int): The microsecond component extracted from `raw_time`.
+        precise (bool): True to add the microseconds to the stamp.
+        sequence (int | None): An optional sequence number added to the stamp, to tell apart
+            the stamps of the same time.
 
     """
 
-    def __init__(self, raw_time: datetime) -> None:
+    def __init__(self, raw_time: datetime, *, precise: bool = False, sequence: int | None = None) -> None:
         """Initialize TimeStamp with a datetime object and extract date and time components.
 
         Args:
         ----
             raw_time (datetime): The original datetime to be stored and
             processed.
+            precise (bool): True to add the microseconds to the stamp.
+            sequence (int | None): An optional sequence number added to the stamp.
 
         """
         self.raw_time = raw_time
+        self.precise = precise
+        self.sequence = sequence
 
     @property
     def raw_time(self) -> datetime:
@@ -65,7 +103,7 @@ class TimeStamp:
             str: The date as a string in 'YYYY_MM_DD' format.
 
         """
-        return f'{self.year}_{self.month:02}_{self.day:02}'
+        return _format_date(self.year, self.month, self.day)
 
     @property
     def time(self) -> str:
@@ -76,18 +114,26 @@ class TimeStamp:
             str: The time as a string in 'HHMMSS' format.
 
         """
-        return f'{self.hour:02}{self.minute:02}{self.second:02}'
+        return _format_time(self.hour, self.minute, self.second)
 
     @property
     def stamp(self) -> str:
         """Gets the timestamp as a string in 'YYYY_MM_DD_HHMMSS' format.
 
+        The microseconds are added when precise, as 'YYYY_MM_DD_HHMMSS_FFFFFF', then the
+        sequence number, if any, as '_N'.
+
         Returns
         -------
             str: The timestamp as a string in 'YYYY_MM_DD_HHMMSS' format.
 
         """
-        return f'{self.date}_{self.time}'
+        stamp = f'{self.date}_{self.time}'
+        if self.precise:
+            stamp = f'{stamp}_{self.microsecond:06}'
+        if self.sequence is not None:
+            stamp = f'{stamp}_{self.sequence}'
+        return stamp
 
     def __repr__(self) -> str:
         """Get the string representation of the timestamp.
@@ -98,3 +144,66 @@ class TimeStamp:
 
         """
         return self.stamp
+
+
+class Clock:
+    """Represents a clock handing out unique timestamps, safe to share between threads.
+
+    A timestamp requested within the same second as the previous one, or the same microsecond
+    when precise, gets the time of the previous one and the next sequence number, so the
+    stamps never repeat even if the system time goes backwards. The first stamp of each time
+    has no sequence number and reads like a plain `TimeStamp`.
+
+    Attributes
+    ----------
+        tz (tzinfo | None): The timezone of the timestamps.
+        precise (bool): True to hand out timestamps with microseconds.
+
+    """
+
+    def __init__(
+        self,
+        tz: tzinfo | None = timezone.utc,
+        *,
+        precise: bool = False,
+        now: Callable[[tzinfo | None], datetime] = datetime.now,
+    ) -> None:
+        """Initialize the Clock object.
+
+        Args:
+        ----
+            tz (tzinfo | None): The timezone of the timestamps, UTC by default.
+            precise (bool): True to hand out timestamps with microseconds.
+            now (Callable[[tzinfo | None], datetime]): The source of the current time.
+
+        """
+        self.tz = tz
+        self.precise = precise
+        self._now = now
+        self._lock = threading.Lock()
+        self._last: datetime | None = None
+        self._sequence = 0
+
+    def timestamp(self) -> TimeStamp:
+        """Get a timestamp whose stamp was never handed out by this clock.
+
+        Returns
+        -------
+            TimeStamp: The timestamp.
+
+        """
+        raw_time = self._now(self.tz)
+        if not self.precise:
+            raw_time = raw_time.replace(microsecond=0)
+        with self._lock:
+            if self._last is not None and raw_time <= self._last:
+                raw_time = self._last
+                self._sequence += 1
+            else:
+                self._last = raw_time
+                self._sequence = 0
+            sequence = self._sequence
+        return TimeStamp(raw_time, precise=self.precise, sequence=sequence or None)
+
+
+CLOCK = Clock()
@@ -0,0 +1,314 @@
+"""Module used to instrument the hot paths with timing spans.
+
+Spans are only created when at least one hook is registered, otherwise `span` returns a
+shared disabled span and the instrumentation costs a single check.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+    from types import TracebackType
+    from typing import Self
+
+    SpanHook = Callable[['Span'], None]
+
+
+class _Hooks:
+    """Registry of the span hooks, replaced as a whole so it can be read without lock."""
+
+    def __init__(self) -> None:
+        self.hooks: tuple[SpanHook, ...] = ()
+        self.lock = threading.Lock()
+
+
+_HOOKS = _Hooks()
+
+
+def add_hook(hook: SpanHook) -> None:
+    """Register a hook called with every finished span.
+
+    Args:
+    ----
+        hook (SpanHook): The callable receiving the finished span.
+
+    """
+    with _HOOKS.lock:
+        _HOOKS.hooks = (*_HOOKS.hooks, hook)
+
+
+def remove_hook(hook: SpanHook) -> None:
+    """Unregister a hook.
+
+    Args:
+    ----
+        hook (SpanHook): The hook to unregister.
+
+    """
+    with _HOOKS.lock:
+        _HOOKS.hooks = tuple(registered for registered in _HOOKS.hooks if registered != hook)
+
+
+def is_enabled() -> bool:
+    """Check if at least one hook is registered.
+
+    Returns
+    -------
+        bool: True if the spans are recorded, False otherwise.
+
+    """
+    return bool(_HOOKS.hooks)
+
+
+class Span:
+    """Represents a timed phase of a hot path.
+
+    Attributes
+    ----------
+        name (str): The name of the phase.
+        attributes (dict[str, object]): The attributes describing the phase.
+        start (float): The start of the phase, from `time.perf_counter`.
+        duration (float): The duration of the phase, in seconds.
+        bytes_written (int): The number of bytes written during the phase.
+
+    """
+
+    enabled = True
+
+    def __init__(self, name: str, attributes: dict[str, object]) -> None:
+        """Initialize the Span object."""
+        self.name = name
+        self.attributes = attributes
+        self.start = 0.0
+        self.duration = 0.0
+        self.bytes_written = 0
+
+    def __enter__(self) -> Self:
+        """Start timing the phase.
+
+        Returns
+        -------
+            Self: The span itself.
+
+        """
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop timing the phase and call the hooks."""
+        self.duration = time.perf_counter() - self.start
+        for hook in _HOOKS.hooks:
+            hook(self)
+
+    def record_bytes(self, count: int) -> None:
+        """Record bytes written during the phase.
+
+        Args:
+        ----
+            count (int): The number of bytes written.
+
+        """
+        self.bytes_written += count
+
+    def record_file(self, path: Path) -> None:
+        """Record the size of a file written during the phase.
+
+        Args:
+        ----
+            path (Path): The file written.
+
+        """
+        self.bytes_written += path.stat().st_size
+
+
+class _DisabledSpan(Span):
+    """Span doing nothing, returned while no hook is registered."""
+
+    enabled = False
+
+    def __init__(self) -> None:
+        """Initialize the _DisabledSpan object."""
+        super().__init__('', {})
+
+    def __enter__(self) -> Self:
+        """Return the span itself without timing."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Do nothing, no hook is called."""
+
+    def record_bytes(self, count: int) -> None:
+        """Ignore the bytes written."""
+
+    def record_file(self, path: Path) -> None:
+        """Ignore the file written, without reading its size."""
+
+
+DISABLED_SPAN = _DisabledSpan()
+
+
+def span(name: str, **attributes: object) -> Span:
+    """Create a span timing a phase, to use as a context manager.
+
+    Args:
+    ----
+        name (str): The name of the phase.
+        **attributes (object): The attributes describing the phase.
+
+    Returns:
+    -------
+        Span: The span, the shared disabled span while no hook is registered.
+
+    """
+    if not _HOOKS.hooks:
+        return DISABLED_SPAN
+    return Span(name, attributes)
+
+
+@dataclass
+class PhaseStats:
+    """PhaseStats class representing the aggregated spans of a phase.
+
+    Attributes
+    ----------
+        count (int): The number of spans.
+        total (float): The total duration, in seconds.
+        minimum (float): The shortest duration, in seconds.
+        maximum (float): The longest duration, in seconds.
+        bytes_written (int): The total number of bytes written.
+
+    """
+
+    count: int = 0
+    total: float = 0.0
+    minimum: float = float('inf')
+    maximum: float = 0.0
+    bytes_written: int = 0
+
+    @property
+    def mean(self) -> float:
+        """Get the mean duration.
+
+        Returns
+        -------
+            float: The mean duration, in seconds.
+
+        """
+        return self.total / self.count if self.count else 0.0
+
+
+class Collector:
+    """Represents a hook aggregating the spans per phase.
+
+    Use it as a context manager to register it for the duration of a block.
+
+    Attributes
+    ----------
+        phases (dict[str, PhaseStats]): The aggregated spans per phase name.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the Collector object."""
+        self.phases: dict[str, PhaseStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        """Aggregate a finished span.
+
+        Args:
+        ----
+            span (Span): The finished span.
+
+        """
+        with self._lock:
+            stats = self.phases.setdefault(span.name, PhaseStats())
+            stats.count += 1
+            stats.total += span.duration
+            stats.minimum = min(stats.minimum, span.duration)
+            stats.maximum = max(stats.maximum, span.duration)
+            stats.bytes_written += span.bytes_written
+
+    def __enter__(self) -> Self:
+        """Register the collector as a hook.
+
+        Returns
+        -------
+            Self: The collector itself.
+
+        """
+        add_hook(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Unregister the collector."""
+        remove_hook(self)
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """Get the aggregated spans, ready to be forwarded to a metrics system.
+
+        Returns
+        -------
+            dict[str, dict[str, float]]: The count, durations and bytes written per phase.
+
+        """
+        with self._lock:
+            return {
+                name: {
+                    'count': stats.count,
+                    'total': stats.total,
+                    'mean': stats.mean,
+                    'minimum': stats.minimum,
+                    'maximum': stats.maximum,
+                    'bytes_written': stats.bytes_written,
+                }
+                for name, stats in self.phases.items()
+            }
+
+
+@contextmanager
+def profile(path: Path | None = None) -> Iterator[cProfile.Profile]:
+    """Capture a cProfile profile of a block.
+
+    Args:
+    ----
+        path (Path | None): The file the statistics are dumped to, readable with `pstats`.
+
+    Returns:
+    -------
+        Iterator[cProfile.Profile]: The profiler, enabled for the duration of the block.
+
+    """
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if path is not None:
+            profiler.dump_stats(path)
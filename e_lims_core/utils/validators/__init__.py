@@ -0,0 +1 @@
+"""Validators module."""
@@ -0,0 +1,142 @@
+"""Module used to choose how the attribute checks of devices, trays and file properties run.
+
+The policy is held in a context variable, so it applies to the current thread or task only:
+
+* strict: every assignment is checked immediately, the default.
+* deferred: the checks are collected and run in one batch, each distinct value once, when
+  the `validation_policy` block exits.
+* trusted: the checks are skipped, for data written by this package.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    Check = Callable[[Any], None]
+
+
+class ValidationPolicy(Enum):
+    """ValidationPolicy class representing how the attribute checks run.
+
+    Enum values:
+        * STRICT: Check every assignment immediately
+        * DEFERRED: Collect the checks and run them at the end of the block
+        * TRUSTED: Skip the checks
+
+    """
+
+    STRICT = 'strict'
+    DEFERRED = 'deferred'
+    TRUSTED = 'trusted'
+
+
+_POLICY: ContextVar[ValidationPolicy] = ContextVar('validation_policy', default=ValidationPolicy.STRICT)
+_PENDING: ContextVar[dict[Check, dict[Any, None]] | None] = ContextVar('validation_pending', default=None)
+
+
+def current_policy() -> ValidationPolicy:
+    """Get the policy of the current context.
+
+    Returns
+    -------
+        ValidationPolicy: The policy.
+
+    """
+    return _POLICY.get()
+
+
+def validate(check: Check, value: object) -> None:
+    """Check a value according to the policy of the current context.
+
+    Args:
+    ----
+        check (Check): The callable raising a ValueError if the value is invalid.
+        value (object): The value to check, hashable.
+
+    Raises:
+    ------
+        ValueError: If the policy is strict and the value is invalid.
+
+    """
+    policy = _POLICY.get()
+    if policy is ValidationPolicy.STRICT:
+        check(value)
+    elif policy is ValidationPolicy.DEFERRED:
+        pending = _PENDING.get()
+        if pending is not None:
+            pending.setdefault(check, {})[value] = None
+
+
+def run_checks(pending: dict[Check, dict[Any, None]]) -> list[str]:
+    """Run the collected checks and gather the failures.
+
+    Args:
+    ----
+        pending (dict[Check, dict[Any, None]]): The distinct values to check, per check.
+
+    Returns:
+    -------
+        list[str]: The messages of the failed checks.
+
+    """
+    failures = (_run_check(check, value) for check, values in pending.items() for value in values)
+    return [message for message in failures if message is not None]
+
+
+def _run_check(check: Check, value: object) -> str | None:
+    """Check a value.
+
+    Args:
+    ----
+        check (Check): The callable raising a ValueError if the value is invalid.
+        value (object): The value to check.
+
+    Returns:
+    -------
+        str | None: The message of the failure, None if the value is valid.
+
+    """
+    try:
+        check(value)
+    except ValueError as error:
+        return str(error)
+    return None
+
+
+@contextmanager
+def validation_policy(policy: ValidationPolicy | str) -> Iterator[None]:
+    """Apply a policy to the assignments made in the block.
+
+    Args:
+    ----
+        policy (ValidationPolicy | str): The policy, or its value.
+
+    Yields:
+    ------
+        None
+
+    Raises:
+    ------
+        ValueError: If the policy is deferred and at least one collected value is invalid,
+            listing every failure. The checks are dropped if the block raised.
+
+    """
+    policy = ValidationPolicy(policy)
+    pending: dict[Check, dict[Any, None]] | None = {} if policy is ValidationPolicy.DEFERRED else None
+    policy_token = _POLICY.set(policy)
+    pending_token = _PENDING.set(pending)
+    try:
+        yield
+    finally:
+        _PENDING.reset(pending_token)
+        _POLICY.reset(policy_token)
+    if pending:
+        messages = run_checks(pending)
+        if messages:
+            raise ValueError('\n'.join(messages))
@@ -0,0 +1,251 @@
+"""Module used to share the attribute validators of devices, trays and file properties.
+
+Each validator compiles its pattern once and remembers the outcome for the most recently
+checked values in a bounded LRU cache, so a value repeated across thousands of devices is
+validated with a single lookup.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+CACHE_SIZE = 4096
+
+PRODUCT_PATTERN = r'^[a-zA-Z0-9_-]+$'
+DIE_PATTERN = r'^[A-Z](0|[1-9][0-9]*)$'
+PACKAGE_PATTERN = r'^[R](0|[1-9][0-9]*)$'
+SERIAL_PATTERN = r'^[a-zA-Z0-9]+$'
+FILE_NAME_PATTERN = r'^(?=(?:[^a-zA-Z]*[a-zA-Z]){6})[a-zA-Z0-9_-]+$'
+
+
+class Validator:
+    """Represents a named check of an attribute value.
+
+    Attributes
+    ----------
+        name (str): The name of the validator.
+        message (str): The error message, formatted with the invalid `value`.
+
+    """
+
+    def __init__(self, name: str, predicate: Callable[[Any], bool], message: str, maxsize: int = CACHE_SIZE) -> None:
+        """Initialize the Validator object.
+
+        Args:
+        ----
+            name (str): The name of the validator.
+            predicate (Callable[[Any], bool]): The callable returning True if a value is valid.
+            message (str): The error message, formatted with the invalid `value`.
+            maxsize (int): The number of values whose outcome is remembered, 0 to disable the cache.
+
+        """
+        self.name = name
+        self.message = message
+        self._predicate: Callable[[Any], bool] = predicate
+        if maxsize:
+            self._predicate = lru_cache(maxsize=maxsize)(predicate)
+
+    @classmethod
+    def from_pattern(cls, name: str, pattern: str, message: str, maxsize: int = CACHE_SIZE) -> Validator:
+        """Create a validator matching a regular expression, compiled once.
+
+        Args:
+        ----
+            name (str): The name of the validator.
+            pattern (str): The regular expression the values must match.
+            message (str): The error message, formatted with the invalid `value`.
+            maxsize (int): The number of values whose outcome is remembered, 0 to disable the cache.
+
+        Returns:
+        -------
+            Validator: The validator.
+
+        """
+        match = re.compile(pattern).match
+        return cls(name, lambda value: match(value) is not None, message, maxsize)
+
+    def is_valid(self, value: object) -> bool:
+        """Check a value.
+
+        Args:
+        ----
+            value (object): The value to check, hashable.
+
+        Returns:
+        -------
+            bool: True if the value is valid, False otherwise.
+
+        """
+        return self._predicate(value)
+
+    def __call__(self, value: object) -> None:
+        """Validate a value.
+
+        Args:
+        ----
+            value (object): The value to validate, hashable.
+
+        Raises:
+        ------
+            ValueError: If the value is invalid.
+
+        """
+        if not self._predicate(value):
+            raise ValueError(self.message.format(value=value))
+
+    def cache_info(self) -> tuple[int, int]:
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+            tuple[int, int]: The number of values found in the cache and checked, (0, 0) without cache.
+
+        """
+        cache_info = getattr(self._predicate, 'cache_info', None)
+        if cache_info is None:
+            return 0, 0
+        info = cache_info()
+        return info.hits, info.misses
+
+    def cache_clear(self) -> None:
+        """Forget the outcome of the values already checked."""
+        cache_clear = getattr(self._predicate, 'cache_clear', None)
+        if cache_clear is not None:
+            cache_clear()
+
+
+class ValidatorRegistry:
+    """Represents the validators, by name."""
+
+    def __init__(self) -> None:
+        """Initialize the ValidatorRegistry object."""
+        self._validators: dict[str, Validator] = {}
+
+    def register(self, validator: Validator) -> Validator:
+        """Register a validator.
+
+        Args:
+        ----
+            validator (Validator): The validator.
+
+        Returns:
+        -------
+            Validator: The validator.
+
+        Raises:
+        ------
+            ValueError: If a validator with the same name is already registered.
+
+        """
+        if validator.name in self._validators:
+            msg = f'Validator {validator.name} already registered.'
+            raise ValueError(msg)
+        self._validators[validator.name] = validator
+        return validator
+
+    def __getitem__(self, name: str) -> Validator:
+        """Get a validator.
+
+        Args:
+        ----
+            name (str): The name of the validator.
+
+        Returns:
+        -------
+            Validator: The validator.
+
+        Raises:
+        ------
+            ValueError: If no validator is registered with the name.
+
+        """
+        try:
+            return self._validators[name]
+        except KeyError:
+            msg = f'Unknown validator: {name}'
+            raise ValueError(msg) from None
+
+    def __iter__(self) -> Iterator[Validator]:
+        """Iterate over the validators.
+
+        Returns
+        -------
+            Iterator[Validator]: The validators, in registration order.
+
+        """
+        return iter(self._validators.values())
+
+    def cache_clear(self) -> None:
+        """Forget the outcome of the values already checked by every validator."""
+        for validator in self:
+            validator.cache_clear()
+
+
+VALIDATORS = ValidatorRegistry()
+VALIDATORS.register(
+    Validator.from_pattern(
+        'product',
+        PRODUCT_PATTERN,
+        'Invalid product: {value}, authorized characters are alphabetic, numeric, and _-',
+    )
+)
+VALIDATORS.register(
+    Validator.from_pattern(
+        'die',
+        DIE_PATTERN,
+        'Invalid die: {value}, authorized one alphabetic follow by integer',
+    )
+)
+VALIDATORS.register(
+    Validator.from_pattern(
+        'package',
+        PACKAGE_PATTERN,
+        'Invalid package: {value}, authorized R follow by one integer',
+    )
+)
+# Serial numbers are unique per device, remembering them would only cost memory.
+VALIDATORS.register(
+    Validator.from_pattern(
+        'serial',
+        SERIAL_PATTERN,
+        'Invalid serial: {value}, authorized characters are alphabetic and numeric',
+        maxsize=0,
+    )
+)
+VALIDATORS.register(
+    Validator.from_pattern(
+        'file_name',
+        FILE_NAME_PATTERN,
+        'Invalid name: {value}, authorized characters are minimum 6 alphabetic, numeric, and _-',
+    )
+)
+# Comparing a number is cheaper than looking it up.
+VALIDATORS.register(
+    Validator(
+        'tray_number',
+        lambda value: value > 0,
+        'The tray number must be greater than 0.',
+        maxsize=0,
+    )
+)
+VALIDATORS.register(
+    Validator(
+        'max_column',
+        lambda value: value >= 1,
+        'The maximum number of columns must be greater than 0.',
+        maxsize=0,
+    )
+)
+VALIDATORS.register(
+    Validator(
+        'max_row',
+        lambda value: value >= 1,
+        'The maximum number of rows must be greater than 0.',
+        maxsize=0,
+    )
+)
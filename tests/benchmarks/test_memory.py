@@ -0,0 +1,46 @@
+"""Tests memory budgets."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from benchmarks.memory import (
+    bytes_per_device,
+    bytes_per_tray,
+    bytes_per_tray_frame,
+    export_excel_peak,
+    measure,
+)
+
+DEVICE_BUDGET = 512
+FULL_TRAY_BUDGET = 200_000
+TRAY_FRAME_BUDGET = 64_000
+EXPORT_EXCEL_PEAK_PER_TRAY_BUDGET = 300_000
+
+
+def test_measure() -> None:
+    """Test the measure function reports the memory retained by the result."""
+    result, usage = measure(lambda: bytearray(1_000_000))
+    assert len(result) == 1_000_000
+    assert usage.current >= 1_000_000
+    assert usage.peak >= usage.current
+
+
+def test_device_budget() -> None:
+    """Test the memory per device stays within budget."""
+    assert bytes_per_device(1_000) < DEVICE_BUDGET
+
+
+def test_tray_budget() -> None:
+    """Test the memory per full 31x14 tray stays within budget."""
+    assert bytes_per_tray(10) < FULL_TRAY_BUDGET
+
+
+def test_tray_frame_budget() -> None:
+    """Test the memory per get_tray DataFrame of a full tray stays within budget."""
+    assert bytes_per_tray_frame(10) < TRAY_FRAME_BUDGET
+
+
+def test_export_excel_peak_budget(tmp_path: Path) -> None:
+    """Test the peak memory of an Excel export stays within budget."""
+    assert export_excel_peak(tmp_path, 5) < 5 * EXPORT_EXCEL_PEAK_PER_TRAY_BUDGET
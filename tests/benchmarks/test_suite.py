@@ -0,0 +1,67 @@
+"""Tests benchmark suite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.factories import make_tray
+from benchmarks.suite import BENCHMARKS, Result, Scale, compare_results, load_results, run_benchmarks, save_results
+
+
+@pytest.mark.parametrize('fill', [0.0, 0.5, 1.0])
+def test_make_tray_passes_checks(fill: float) -> None:
+    """Test the trays built by the factories are valid at every fill ratio."""
+    tray = make_tray(1, fill)
+    assert len(tray.devices) == round(tray.tray_size * fill)
+    tray.check_tray_size()
+    tray.check_device_name()
+    tray.check_device_position()
+    tray.check_device_position_in_tray()
+
+
+def test_run_benchmarks(tmp_path: Path) -> None:
+    """Test every benchmark runs at the smallest scale."""
+    results = run_benchmarks([Scale(trays=1, fill=0.1)], tmp_path, repeat=1)
+    assert [result.name for result in results] == list(BENCHMARKS)
+    assert all(result.best <= result.median for result in results)
+
+
+def test_run_benchmarks_unknown(tmp_path: Path) -> None:
+    """Test an unknown benchmark is rejected."""
+    with pytest.raises(ValueError, match='Unknown benchmark'):
+        run_benchmarks([Scale(trays=1, fill=0.0)], tmp_path, names=['unknown'])
+
+
+def test_save_and_load_results(tmp_path: Path) -> None:
+    """Test the results round trip through JSON."""
+    results = [Result('tray.get_tray', 10, 1.0, 5, 0.1, 0.2)]
+    save_results(results, tmp_path / 'results.json')
+    assert load_results(tmp_path / 'results.json') == results
+
+
+def test_compare_results() -> None:
+    """Test the comparison flags the slowdowns above the threshold."""
+    baseline = [Result('a', 1, 1.0, 5, 1.0, 1.0), Result('b', 1, 1.0, 5, 1.0, 1.0), Result('c', 1, 1.0, 5, 1.0, 1.0)]
+    current = [Result('a', 1, 1.0, 5, 1.0, 1.05), Result('b', 1, 1.0, 5, 1.0, 1.5), Result('d', 1, 1.0, 5, 1.0, 9.0)]
+    comparisons = compare_results(baseline, current, threshold=0.1)
+    assert [(comparison.current.name, comparison.is_regression) for comparison in comparisons] == [
+        ('a', False),
+        ('b', True),
+    ]
+
+
+def test_main(tmp_path: Path) -> None:
+    """Test the run and compare commands."""
+    output = tmp_path / 'results.json'
+    arguments = ['run', '--trays', '1', '--fill', '0.5', '--repeat', '1', '--benchmark', 'tray.get_tray']
+    assert main([*arguments, '--output', str(output)]) == 0
+    assert [result.name for result in load_results(output)] == ['tray.get_tray']
+    assert main(['compare', str(output), str(output)]) == 0
+
+
+def test_main_memory() -> None:
+    """Test the memory command."""
+    assert main(['memory', '--devices', '10', '--trays', '1']) == 0
@@ -0,0 +1,90 @@
+"""Fixture shared by the tests."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Protocol
+
+import pytest
+
+from e_lims_core.utils.dut.device import Corner, Device, Position
+from e_lims_core.utils.dut.tray import Tray
+
+
+class DeviceFactory(Protocol):
+    """Callable creating a device on the first row."""
+
+    def __call__(
+        self,
+        number: int = 1,
+        serial: str = 'SN1',
+        column: int = 0,
+        *,
+        corner: Corner = Corner.SS,
+        product: str = 'ProductX',
+        die: str = 'A0',
+    ) -> Device:
+        """Create a device."""
+
+
+class TrayFactory(Protocol):
+    """Callable creating a tray holding one device per serial on the first row, or the given devices."""
+
+    def __call__(
+        self,
+        number: int = 1,
+        serials: Sequence[str] = ('SN1',),
+        *,
+        corner: Corner = Corner.SS,
+        product: str = 'ProductX',
+        devices: list[Device] | None = None,
+    ) -> Tray:
+        """Create a tray."""
+
+
+@pytest.fixture()
+def fx_make_device() -> DeviceFactory:
+    """Fixture for creating devices on the first row."""
+
+    def make_device(
+        number: int = 1,
+        serial: str = 'SN1',
+        column: int = 0,
+        *,
+        corner: Corner = Corner.SS,
+        product: str = 'ProductX',
+        die: str = 'A0',
+    ) -> Device:
+        return Device(
+            number=number,
+            product=product,
+            die=die,
+            package='R0',
+            serial=serial,
+            corner=corner,
+            position=Position(column=column, row=0),
+        )
+
+    return make_device
+
+
+@pytest.fixture()
+def fx_make_tray(fx_make_device: DeviceFactory) -> TrayFactory:
+    """Fixture for creating trays holding one device per serial on the first row, or the given devices."""
+
+    def make_tray(
+        number: int = 1,
+        serials: Sequence[str] = ('SN1',),
+        *,
+        corner: Corner = Corner.SS,
+        product: str = 'ProductX',
+        devices: list[Device] | None = None,
+    ) -> Tray:
+        if devices is None:
+            devices = [
+                fx_make_device(index + 1, serial, index, corner=corner, product=product)
+                for index, serial in enumerate(serials)
+            ]
+        return Tray(name='tray', number=number, product=product, devices=devices)
+
+    return make_tray
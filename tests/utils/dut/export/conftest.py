@@ -71,6 +71,20 @@ def fx_xlsx_file_props(tmp_path: pathlib.Path) -> FileProps:
     return FileProps(path=path, name='testfile', suffix=FileSuffix.XLSX)
 
 
+@pytest.fixture()
+def fx_jsonl_file_props(tmp_path: pathlib.Path) -> FileProps:
+    """Fixture for creating FileProps object.
+
+    Returns
+    -------
+        FileProps: FileProps object.
+
+    """
+    path: pathlib.Path = tmp_path / 'test_dir'
+    path.mkdir(parents=True, exist_ok=True)
+    return FileProps(path=path, name='testfile', suffix=FileSuffix.JSONL)
+
+
 @pytest.fixture()
 def fx_tray(fx_devices: list[Device]) -> Tray:
     """Fixture for creating Tray object.
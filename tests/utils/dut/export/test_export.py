@@ -0,0 +1,96 @@
+"""Module for testing the streaming export protocol and the export registry."""
+
+from __future__ import annotations
+
+import gzip
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+
+from e_lims_core.utils.dut.export.export import EXPORTS, StreamingExport, get_export, register_export
+from e_lims_core.utils.dut.export.export2csv import Export2Csv
+from e_lims_core.utils.dut.export.export2xlsx import Export2Excel
+from e_lims_core.utils.dut.tray import Tray
+from e_lims_core.utils.dut.trays import Trays
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from e_lims_core.utils.dut.device import Device
+    from tests.conftest import TrayFactory
+
+
+class Export2Names(StreamingExport):
+    """Export writing the device names of a tray, one chunk per device."""
+
+    suffix = FileSuffix.CSV
+    phase = 'export2names'
+
+    def iter_chunks(self, tray: Tray) -> Iterator[bytes]:
+        """Produce the device names of a tray."""
+        return (f'{device.name}\n'.encode() for device in tray.devices)
+
+
+def test_streaming_export(fx_devices: list[Device], fx_csv_file_props: FileProps, fx_make_tray: TrayFactory) -> None:
+    """Test the chunks are gathered in buffered writes, one file per tray."""
+    trays = [fx_make_tray(number, devices=fx_devices) for number in range(1, 3)]
+    Export2Names(trays, fx_csv_file_props, buffer_size=1).export()
+    for tray in trays:
+        assert (fx_csv_file_props.path / f'{tray.name}.csv').read_text() == 'SS1\nSS2\n'
+
+
+@pytest.mark.parametrize('max_workers', [None, 4])
+def test_export2csv_compress(
+    fx_devices: list[Device], fx_csv_file_props: FileProps, max_workers: int | None, fx_make_tray: TrayFactory
+) -> None:
+    """Test the compressed files, written in turn or in parallel, hold the plain files."""
+    trays = [fx_make_tray(number, devices=fx_devices) for number in range(1, 4)]
+    Export2Csv(trays, fx_csv_file_props).export()
+    Export2Csv(trays, fx_csv_file_props, compress=True, max_workers=max_workers).export()
+    for tray in trays:
+        plain = (fx_csv_file_props.path / f'{tray.name}.csv').read_bytes()
+        assert gzip.decompress((fx_csv_file_props.path / f'{tray.name}.csv.gz').read_bytes()) == plain
+
+
+def test_export_removed_directory(
+    fx_devices: list[Device], fx_csv_file_props: FileProps, fx_make_tray: TrayFactory
+) -> None:
+    """Test the exports create the directory again if it was removed after a first export."""
+    trays = [fx_make_tray(devices=fx_devices)]
+    Export2Csv(trays, fx_csv_file_props).export()
+    shutil.rmtree(fx_csv_file_props.path)
+    Export2Csv(trays, FileProps(fx_csv_file_props.path, 'testfile', FileSuffix.CSV)).export()
+    assert (fx_csv_file_props.path / f'{trays[0].name}.csv').exists()
+    shutil.rmtree(fx_csv_file_props.path)
+    Export2Excel(trays, FileProps(fx_csv_file_props.path, 'testfile', FileSuffix.XLSX)).export()
+    assert (fx_csv_file_props.path / 'testfile.xlsx').exists()
+
+
+def test_get_export() -> None:
+    """Test the built-in exports are imported on first use."""
+    assert get_export(FileSuffix.CSV) is Export2Csv
+    assert get_export(FileSuffix.XLSX) is Export2Excel
+
+
+def test_register_export(fx_devices: list[Device], fx_csv_file_props: FileProps, fx_make_tray: TrayFactory) -> None:
+    """Test Trays.export dispatches to the export registered for a suffix."""
+    trays = Trays([fx_make_tray(devices=fx_devices)], fx_csv_file_props)
+    previous = EXPORTS[FileSuffix.CSV]
+    register_export(FileSuffix.CSV, Export2Names)
+    try:
+        trays.export('.csv', buffer_size=1)
+    finally:
+        register_export(FileSuffix.CSV, previous)
+    assert (fx_csv_file_props.path / f'{trays.trays[0].name}.csv').read_text() == 'SS1\nSS2\n'
+
+
+def test_get_export_unknown() -> None:
+    """Test a suffix without export is rejected."""
+    previous = EXPORTS.pop(FileSuffix.XLSX)
+    try:
+        with pytest.raises(ValueError, match='No export registered for suffix .xlsx'):
+            get_export(FileSuffix.XLSX)
+    finally:
+        register_export(FileSuffix.XLSX, previous)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from e_lims_core.utils.dut.device import Device, Position
 from e_lims_core.utils.dut.export.export2csv import Export2Csv
 from e_lims_core.utils.dut.tray import Tray
 from e_lims_core.utils.files.file_props import FileProps
@@ -49,3 +50,21 @@ def test_export2csv_export(fx_tray: Tray, fx_csv_file_props: FileProps) -> None:
     export = Export2Csv(trays=[fx_tray], file_props=fx_csv_file_props)
     export.export()
     assert (fx_csv_file_props.path / f'{fx_tray.name}.csv').exists()
+
+
+def test_export2csv_export_sparse(fx_devices: list[Device], fx_csv_file_props: FileProps) -> None:
+    """Test the sparse export writes the same files as the dense export.
+
+    Args:
+    ----
+        fx_devices (list[Device]): Fixture for creating a list of devices.
+        fx_csv_file_props (FileProps): Fixture for creating a FileProps object.
+
+    """
+    fx_devices[1].position = Position(column=2, row=3)
+    tray = Tray(name='tray', number=1, product='ProductX', devices=fx_devices, max_column=4, max_row=5)
+    file_path = fx_csv_file_props.path / f'{tray.name}.csv'
+    Export2Csv(trays=[tray], file_props=fx_csv_file_props).export()
+    dense = file_path.read_text()
+    Export2Csv(trays=[tray], file_props=fx_csv_file_props, sparse=True).export()
+    assert file_path.read_text() == dense
@@ -0,0 +1,88 @@
+"""Module for testing the export to JSON Lines functionality."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from e_lims_core.utils.dut.export import export2jsonl
+from e_lims_core.utils.dut.export.export2jsonl import Export2Jsonl, json_line
+from e_lims_core.utils.dut.trays import Trays
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from e_lims_core.utils.dut.device import Device
+    from tests.conftest import TrayFactory
+
+RECORD = {
+    'tray': 'tray_productx_1',
+    'tray_number': 1,
+    'row': 0,
+    'column': 0,
+    'name': 'SS1',
+    'product': 'ProductX',
+    'die': 'A0',
+    'package': 'R0',
+    'serial': 'SN123456',
+    'corner': 'SS',
+}
+
+
+@pytest.fixture()
+def _fx_json_fallback(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Fixture hiding orjson, so the records are encoded with json."""
+    json_line.cache_clear()
+    monkeypatch.setattr(export2jsonl, 'find_spec', lambda _name: None)
+    yield
+    json_line.cache_clear()
+
+
+def read_records(text: str) -> list[dict[str, object]]:
+    """Decode the records of a JSON Lines file."""
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_export2jsonl_export(
+    fx_devices: list[Device], fx_jsonl_file_props: FileProps, fx_make_tray: TrayFactory
+) -> None:
+    """Test every device of every tray is written as a record to a single file."""
+    Export2Jsonl([fx_make_tray(number, devices=fx_devices) for number in (1, 2)], fx_jsonl_file_props).export()
+    records = read_records((fx_jsonl_file_props.path / f'{fx_jsonl_file_props.name}.jsonl').read_text())
+    assert len(records) == 2 * len(fx_devices)
+    assert records[0] == RECORD
+    assert records[-1]['tray'] == 'tray_productx_2'
+
+
+@pytest.mark.usefixtures('_fx_json_fallback')
+def test_export2jsonl_json_fallback(
+    fx_devices: list[Device], fx_jsonl_file_props: FileProps, fx_make_tray: TrayFactory
+) -> None:
+    """Test the records encoded with json are the records encoded with orjson."""
+    Export2Jsonl([fx_make_tray(number, devices=fx_devices) for number in (1, 2)], fx_jsonl_file_props).export()
+    text = (fx_jsonl_file_props.path / f'{fx_jsonl_file_props.name}.jsonl').read_text()
+    assert text.splitlines()[0] == json.dumps(RECORD, separators=(',', ':'))
+
+
+def test_trays_export_jsonl_compress(
+    fx_devices: list[Device], fx_jsonl_file_props: FileProps, fx_make_tray: TrayFactory
+) -> None:
+    """Test the compressed export holds the plain export."""
+    trays = Trays([fx_make_tray(number, devices=fx_devices) for number in (1, 2)], fx_jsonl_file_props)
+    trays.export_jsonl()
+    trays.export_jsonl(compress=True)
+    path = fx_jsonl_file_props.path / f'{fx_jsonl_file_props.name}.jsonl'
+    assert gzip.decompress(path.with_name(f'{path.name}.gz').read_bytes()) == path.read_bytes()
+
+
+def test_export2jsonl_sets_suffix(
+    fx_devices: list[Device], fx_csv_file_props: FileProps, fx_make_tray: TrayFactory
+) -> None:
+    """Test the export writes a JSON Lines file whatever the suffix of the file properties."""
+    Export2Jsonl([fx_make_tray(devices=fx_devices)], fx_csv_file_props).export()
+    assert fx_csv_file_props.suffix is FileSuffix.JSONL
+    assert (fx_csv_file_props.path / f'{fx_csv_file_props.name}.jsonl').exists()
@@ -4,10 +4,12 @@ import math
 
 from openpyxl import Workbook
 
+from e_lims_core.utils.dut.device import Position
 from e_lims_core.utils.dut.export.tray2xlsx import (
     COL_INDEX_BOTTOM,
     COL_INDEX_MIDDLE,
     COL_INDEX_TOP,
+    CORNER_FILLS,
     HEADER,
     ROW_INDEX_LEFT,
     ROW_INDEX_MIDDLE,
@@ -277,3 +279,51 @@ def test_create_and_format_data(fx_tray: Tray, fx_workbook: Workbook) -> None:
             assert cell.font == font
             assert cell.alignment == alignment
             assert cell.border == border
+
+
+def test_create_and_format_sparse_data(fx_tray: Tray, fx_workbook: Workbook) -> None:
+    """Test the create_and_format_sparse_data method of the Tray2Excel object.
+
+    Args:
+    ----
+        fx_tray (Tray): Fixture for creating a tray.
+        fx_workbook (Workbook): Fixture for creating a workbook.
+
+    """
+    fx_tray.max_column, fx_tray.max_row = 4, 4
+    fx_tray.devices[1].position = Position(column=1, row=1)
+    tray2excel = Tray2Excel(fx_tray, fx_workbook, sparse=True)
+    tray2excel.generate()
+    cells = {
+        (row, col): tray2excel.worksheet.cell(
+            row=tray2excel.DATA_ROW_START + row, column=tray2excel.DATA_COL_START + col
+        )
+        for row in range(4)
+        for col in range(4)
+    }
+    written = {position: cell for position, cell in cells.items() if cell.has_style}
+    border = {(row, col) for row in range(4) for col in range(4) if row in {0, 3} or col in {0, 3}}
+    assert set(written) == border | {(1, 1)}
+    assert written[0, 0].value == 'SS1'
+    assert written[1, 1].value == 'SS2'
+    assert written[0, 1].value is None
+    assert written[1, 1].border == SQUARE_MIDDLE
+    assert written[3, 3].border == SQUARE_CORNER_BOTTOM_RIGHT
+
+
+def test_create_corner_formatting(fx_tray: Tray, fx_workbook: Workbook) -> None:
+    """Test the create_corner_formatting method of the Tray2Excel object.
+
+    Args:
+    ----
+        fx_tray (Tray): Fixture for creating a tray.
+        fx_workbook (Workbook): Fixture for creating a workbook.
+
+    """
+    tray2excel = Tray2Excel(fx_tray, fx_workbook, corner_colors=True)
+    tray2excel.generate()
+    (formatting,) = tray2excel.worksheet.conditional_formatting
+    assert str(formatting.sqref) == 'B3:B4'
+    assert [rule.formula for rule in formatting.rules] == [[f'LEFT(B3,2)="{corner.value}"'] for corner in CORNER_FILLS]
+    assert [rule.dxf.fill for rule in formatting.rules] == list(CORNER_FILLS.values())
+    assert all(not cell.fill.fill_type for cells in tray2excel.worksheet.iter_rows() for cell in cells)
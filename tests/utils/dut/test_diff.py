@@ -0,0 +1,45 @@
+"""Tests diff."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from e_lims_core.utils.dut.device import Corner, Position
+from e_lims_core.utils.dut.diff import DeviceChange, DeviceMove, diff_devices
+
+if TYPE_CHECKING:
+    from tests.conftest import DeviceFactory
+
+
+def test_diff_devices(fx_make_device: DeviceFactory) -> None:
+    """Test the added, removed, moved and changed devices are found."""
+    before = [
+        fx_make_device(1, 'SN1', 0),
+        fx_make_device(2, 'SN2', 1),
+        fx_make_device(3, 'SN3', 2),
+        fx_make_device(4, 'SN4', 3),
+    ]
+    after = [
+        fx_make_device(1, 'SN1', 0),
+        fx_make_device(2, 'SN2', 4),
+        fx_make_device(3, 'SN9', 2),
+        fx_make_device(7, 'SN4', 3, corner=Corner.FF),
+        fx_make_device(5, 'SN5', 5),
+    ]
+    result = diff_devices(before, after)
+    assert result.added == [after[4]]
+    assert result.removed == []
+    assert result.moved == [DeviceMove(after[1], Position(column=1, row=0), Position(column=4, row=0))]
+    assert result.changed == [
+        DeviceChange(before[2], after[2], ['serial']),
+        DeviceChange(before[3], after[3], ['name', 'corner']),
+    ]
+    assert not result.is_empty
+
+
+def test_diff_devices_removed(fx_make_device: DeviceFactory) -> None:
+    """Test the devices only found in the previous layout are removed."""
+    before = [fx_make_device(1, 'SN1', 0), fx_make_device(2, 'SN2', 1)]
+    result = diff_devices(before, [fx_make_device(1, 'SN1', 0)])
+    assert result.removed == [before[1]]
+    assert diff_devices(before, before).is_empty
@@ -0,0 +1,59 @@
+"""Tests frames."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from e_lims_core.utils.dut.device import Corner, Device
+from e_lims_core.utils.dut.frames import CORNERS, LOCATION_HEADINGS, devices_frame, string_dtype, trays_frame
+from e_lims_core.utils.dut.tray import Tray
+
+if TYPE_CHECKING:
+    from tests.conftest import DeviceFactory
+
+LAYOUT = [(1, Corner.SS), (2, Corner.FF), (3, Corner.SS)]
+
+
+def test_devices_frame(fx_make_device: DeviceFactory) -> None:
+    """Test the devices frame holds categorical and string columns."""
+    devices = [fx_make_device(number, f'SN{number}', number, corner=corner) for number, corner in LAYOUT]
+    frame = devices_frame(devices)
+    assert list(frame.columns) == Device.headings()
+    assert frame.to_numpy().tolist() == [device.values() for device in devices]
+    for column in ('product', 'die', 'package', 'corner'):
+        assert isinstance(frame[column].dtype, pd.CategoricalDtype)
+    assert list(frame['corner'].cat.categories) == CORNERS
+    assert frame['name'].dtype == string_dtype()
+    assert frame['serial'].dtype == string_dtype()
+
+
+def test_devices_frame_empty() -> None:
+    """Test the devices frame of no device keeps the columns."""
+    frame = devices_frame([])
+    assert list(frame.columns) == Device.headings()
+    assert frame.empty
+
+
+def test_trays_frame(fx_make_device: DeviceFactory) -> None:
+    """Test the trays frame locates every device."""
+    trays = [
+        Tray(
+            name=name,
+            number=number,
+            product='ProductX',
+            devices=[fx_make_device(index, f'SN{index}', index, corner=corner) for index, corner in LAYOUT],
+            max_column=4,
+            max_row=1,
+        )
+        for name, number in [('first', 1), ('second', 2), ('first', 3)]
+    ]
+    frame = trays_frame(trays)
+    assert list(frame.columns) == LOCATION_HEADINGS + Device.headings()
+    assert frame['tray'].tolist() == ['first_productx_1'] * 3 + ['second_productx_2'] * 3 + ['first_productx_3'] * 3
+    assert list(frame['tray'].cat.categories) == ['first_productx_1', 'second_productx_2', 'first_productx_3']
+    assert frame['tray_number'].tolist() == [1] * 3 + [2] * 3 + [3] * 3
+    assert frame['row'].tolist() == [0] * 9
+    assert frame['column'].tolist() == [1, 2, 3] * 3
+    assert trays_frame([]).empty
@@ -0,0 +1,54 @@
+"""Tests import time."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_TIME_BUDGET_US = 200_000
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl', 'pydantic')
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and get the cumulative import time per module.
+
+    Args:
+    ----
+        module (str): The module to import.
+
+    Returns:
+    -------
+        dict[str, int]: The cumulative import time in microseconds per imported module.
+
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],  # noqa: S603
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.removeprefix('import time:').split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    'module',
+    [
+        'e_lims_core.utils.dut.device',
+        'e_lims_core.utils.dut.tray',
+        'e_lims_core.utils.dut.trays',
+        'e_lims_core.utils.dut.export.export2xlsx',
+    ],
+)
+def test_import_time(module: str) -> None:
+    """Test importing the module does not load the heavy libraries and stays within budget."""
+    times = import_times(module)
+    assert [name for name in times if name.split('.')[0] in HEAVY_MODULES] == []
+    assert times[module] < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,55 @@
+"""Tests journal."""
+
+from __future__ import annotations
+
+import pytest
+
+from e_lims_core.utils.dut.device import Device, Position
+from e_lims_core.utils.dut.journal import Journal
+from e_lims_core.utils.dut.tray import Tray, TrayChange
+
+
+def test_journal(fx_tray: Tray, fx_device: Device) -> None:
+    """Test the journal numbers the changes and returns those after a sequence number."""
+    journal = Journal()
+    assert journal.sequence == 0
+    assert journal.changes_since(0) == []
+    journal.record(fx_tray, TrayChange.ADDED, fx_device, {})
+    journal.record(fx_tray, TrayChange.MOVED, fx_device, {'position': Position(column=0, row=0)})
+    journal.record(fx_tray, TrayChange.REMOVED, fx_device, {})
+    assert journal.sequence == 3
+    assert [entry.sequence for entry in journal.changes_since(0)] == [1, 2, 3]
+    assert [entry.change for entry in journal.changes_since(1)] == [TrayChange.MOVED, TrayChange.REMOVED]
+    assert journal.changes_since(3) == []
+    assert journal.changes_since(1)[0].tray == fx_tray.name
+    assert journal.changes_since(1)[0].previous == {'position': Position(column=0, row=0)}
+
+
+def test_journal_truncate(fx_tray: Tray, fx_device: Device) -> None:
+    """Test the journal drops the processed changes and keeps the sequence numbers."""
+    journal = Journal()
+    for _ in range(3):
+        journal.record(fx_tray, TrayChange.UPDATED, fx_device, {'serial': 'SN1'})
+    journal.truncate(2)
+    assert [entry.sequence for entry in journal.entries] == [3]
+    assert [entry.sequence for entry in journal.changes_since(2)] == [3]
+    with pytest.raises(ValueError, match='Changes after sequence 1 were dropped'):
+        journal.changes_since(1)
+    journal.truncate(3)
+    assert journal.entries == []
+    assert journal.changes_since(3) == []
+    journal.record(fx_tray, TrayChange.ADDED, fx_device, {})
+    assert journal.sequence == 4
+
+
+def test_journal_max_entries(fx_tray: Tray, fx_device: Device) -> None:
+    """Test the journal keeps at least the last changes up to its maximum number of entries."""
+    with pytest.raises(ValueError, match='Invalid maximum number of journal entries'):
+        Journal(max_entries=0)
+    journal = Journal(max_entries=2)
+    for _ in range(5):
+        journal.record(fx_tray, TrayChange.ADDED, fx_device, {})
+    assert [entry.sequence for entry in journal.entries] == [3, 4, 5]
+    assert len(journal.changes_since(2)) == 3
+    with pytest.raises(ValueError, match='journal starts at sequence 3'):
+        journal.changes_since(0)
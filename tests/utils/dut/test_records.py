@@ -0,0 +1,83 @@
+"""Tests records."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from e_lims_core.utils.dut.device import Corner, Position
+from e_lims_core.utils.dut.records import load_devices, load_trays
+
+DEVICE_RECORD = {
+    'number': 1,
+    'product': 'ProductX',
+    'die': 'A0',
+    'package': 'R0',
+    'serial': 'SN123456',
+    'corner': 'SS',
+    'position': {'column': 0, 'row': 1},
+}
+
+
+def test_load_devices_from_records() -> None:
+    """Test the load_devices function with a list of records."""
+    (device,) = load_devices([DEVICE_RECORD])
+    assert device.name == 'SS1'
+    assert device.values() == ['SS1', 'ProductX', 'A0', 'R0', 'SN123456', 'SS']
+    assert device.corner is Corner.SS
+    assert device.position == Position(column=0, row=1)
+
+
+def test_load_devices_from_json() -> None:
+    """Test the load_devices function with a JSON document."""
+    devices = load_devices(json.dumps([DEVICE_RECORD, {**DEVICE_RECORD, 'number': 2}]))
+    assert [device.name for device in devices] == ['SS1', 'SS2']
+
+
+def test_load_devices_collects_all_errors() -> None:
+    """Test the load_devices function reports every invalid field at once."""
+    records = [DEVICE_RECORD, {**DEVICE_RECORD, 'die': 'a0', 'package': 'P0'}, {**DEVICE_RECORD, 'serial': 'SN-1'}]
+    with pytest.raises(ValidationError) as error:
+        load_devices(records)
+    assert [location for *_, location in (entry['loc'] for entry in error.value.errors())] == [
+        'die',
+        'package',
+        'serial',
+    ]
+
+
+def test_load_trays() -> None:
+    """Test the load_trays function."""
+    (tray,) = load_trays(
+        [
+            {
+                'name': 'tray',
+                'number': 1,
+                'product': 'ProductX',
+                'devices': [DEVICE_RECORD],
+                'max_column': 1,
+                'max_row': 2,
+            }
+        ]
+    )
+    assert tray.name == 'tray_productx_1'
+    assert (tray.number, tray.product, tray.max_column, tray.max_row) == (1, 'ProductX', 1, 2)
+    assert [device.name for device in tray.devices] == ['SS1']
+
+
+@pytest.mark.parametrize(
+    'invalid_tray',
+    [
+        {'number': 0},
+        {'product': 'ProductX!'},
+        {'max_column': 0},
+        {'max_row': 0},
+    ],
+)
+def test_load_trays_invalid(invalid_tray: dict[str, object]) -> None:
+    """Test the load_trays function rejects the trays the Tray setters reject."""
+    record = {'name': 'tray', 'number': 1, 'product': 'ProductX', 'devices': [], **invalid_tray}
+    with pytest.raises(ValidationError):
+        load_trays([record])
@@ -0,0 +1,113 @@
+"""Tests TrayRepository."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from e_lims_core.utils.dut.device import Corner, Device, Position
+from e_lims_core.utils.dut.repository import TrayRepository
+from e_lims_core.utils.dut.tray import Tray
+
+
+@pytest.fixture()
+def fx_repository_trays() -> list[Tray]:
+    """Fixture for creating trays to store in the repository."""
+    return [
+        Tray(
+            name='tray',
+            number=number,
+            product='ProductX',
+            devices=[
+                Device(
+                    number=index + 1,
+                    product='ProductX',
+                    die='A0',
+                    package='R0',
+                    serial=f'SN{number}{index}',
+                    corner=corner,
+                    position=Position(column=index, row=0),
+                )
+                for index, corner in enumerate([Corner.SS, Corner.FF, Corner.FF])
+            ],
+            max_column=3,
+            max_row=1,
+        )
+        for number in (1, 2)
+    ]
+
+
+@pytest.fixture()
+def fx_repository(fx_repository_trays: list[Tray]) -> TrayRepository:
+    """Fixture for creating a populated in-memory repository."""
+    repository = TrayRepository()
+    repository.add_trays(fx_repository_trays)
+    return repository
+
+
+def test_repository_locate(fx_repository: TrayRepository) -> None:
+    """Test the locate method of the TrayRepository class."""
+    assert fx_repository.locate('SN21') == [('tray_productx_2', Position(column=1, row=0))]
+    assert fx_repository.locate('Unknown') == []
+
+
+@pytest.mark.parametrize(
+    ('product', 'corner', 'expected_count'),
+    [
+        (None, None, 6),
+        ('ProductX', None, 6),
+        ('ProductX', Corner.FF, 4),
+        (None, Corner.SS, 2),
+        ('ProductY', None, 0),
+    ],
+)
+def test_repository_count(
+    fx_repository: TrayRepository, product: str | None, corner: Corner | None, expected_count: int
+) -> None:
+    """Test the count method of the TrayRepository class."""
+    assert fx_repository.count(product=product, corner=corner) == expected_count
+
+
+def test_repository_get_tray(fx_repository: TrayRepository, fx_repository_trays: list[Tray]) -> None:
+    """Test the get_tray method of the TrayRepository class."""
+    expected = fx_repository_trays[1]
+    tray = fx_repository.get_tray(expected.name)
+    assert tray is not None
+    assert tray.name == expected.name
+    assert tray.number == expected.number
+    assert (tray.max_column, tray.max_row) == (expected.max_column, expected.max_row)
+    assert [device.values() for device in tray.devices] == [device.values() for device in expected.devices]
+    assert [device.position for device in tray.devices] == [device.position for device in expected.devices]
+    assert fx_repository.get_tray('unknown') is None
+
+
+def test_repository_remove_tray(fx_repository: TrayRepository) -> None:
+    """Test the remove_tray method of the TrayRepository class."""
+    fx_repository.remove_tray('tray_productx_1')
+    assert [tray.name for tray in fx_repository.get_trays()] == ['tray_productx_2']
+    assert fx_repository.count() == 3
+
+
+def test_repository_persistence(tmp_path: Path, fx_repository_trays: list[Tray]) -> None:
+    """Test the repository is persisted to a database file."""
+    path = tmp_path / 'trays.db'
+    with TrayRepository(path) as repository:
+        repository.add_trays(fx_repository_trays)
+    with TrayRepository(path) as repository:
+        assert len(repository.get_trays(product='ProductX')) == 2
+        assert repository.count(corner=Corner.FF) == 4
+
+
+def test_repository_get_trays_single_devices_query(fx_repository: TrayRepository) -> None:
+    """Test the devices of all trays are loaded with a single query."""
+    statements: list[str] = []
+    fx_repository.connection.set_trace_callback(statements.append)
+    trays = fx_repository.get_trays(product='ProductX')
+    fx_repository.connection.set_trace_callback(None)
+    assert len(statements) == 2
+    assert [tray.name for tray in trays] == ['tray_productx_1', 'tray_productx_2']
+    assert [[device.serial for device in tray.devices] for tray in trays] == [
+        ['SN10', 'SN11', 'SN12'],
+        ['SN20', 'SN21', 'SN22'],
+    ]
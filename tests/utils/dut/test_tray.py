@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
 import re
+from typing import TYPE_CHECKING
 
 import pandas as pd
 import pytest
 
-from e_lims_core.utils.dut.device import Device, Position
-from e_lims_core.utils.dut.tray import Tray
+from e_lims_core.utils.dut.device import Corner, Device, Position
+from e_lims_core.utils.dut.tray import Tray, TrayChange
 from tests.utils.dut.conftest import INVALID_DEVICES, VALID_DEVICES_1
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
 
 def test_tray_initialization(fx_tray: Tray) -> None:
     """Test the initialization of the Tray class."""
@@ -253,3 +259,236 @@ def test_found_device_per_position(devices: list[Device], position: Position, ex
     )
     device = tray.found_device_per_position(position)
     assert device == expected_device
+
+
+def test_tray_add_and_remove_device(fx_device: Device) -> None:
+    """Test the add_device and remove_device methods notify the listeners."""
+    tray = Tray(name='tray', number=1, product='ProductX', devices=[], max_column=3, max_row=3)
+    changes = []
+
+    def listener(tray: Tray, change: TrayChange, device: Device, previous: Mapping[str, object]) -> None:
+        changes.append((tray, change, device))
+        assert previous == {}
+
+    tray.subscribe(listener)
+    tray.add_device(fx_device)
+    tray.remove_device(fx_device)
+    assert tray.devices == []
+    assert changes == [(tray, TrayChange.ADDED, fx_device), (tray, TrayChange.REMOVED, fx_device)]
+    with pytest.raises(ValueError, match='not found in tray'):
+        tray.remove_device(fx_device)
+    tray.unsubscribe(listener)
+    tray.devices = [fx_device]
+    assert len(changes) == 2
+
+
+def test_tray_move_and_update_device(fx_device: Device) -> None:
+    """Test the move_device and update_device methods notify the listeners and the journal."""
+    tray = Tray(name='tray', number=1, product='ProductX', devices=[fx_device], max_column=3, max_row=3)
+    with pytest.raises(ValueError, match='Journal not enabled'):
+        tray.changes_since(0)
+    journal = tray.enable_journal()
+    assert tray.enable_journal() is journal
+    changes = []
+
+    def listener(
+        tray: Tray,  # noqa: ARG001
+        change: TrayChange,
+        device: Device,  # noqa: ARG001
+        previous: Mapping[str, object],
+    ) -> None:
+        changes.append((change, dict(previous)))
+
+    tray.subscribe(listener)
+    tray.move_device(fx_device, Position(column=2, row=0))
+    tray.update_device(fx_device, corner=Corner.FF, serial='SN654321')
+    assert changes == [
+        (TrayChange.MOVED, {'position': Position(column=1, row=2)}),
+        (TrayChange.UPDATED, {'corner': Corner.SS, 'serial': 'SN123456', 'name': 'SS1'}),
+    ]
+    assert fx_device.position == Position(column=2, row=0)
+    assert (fx_device.name, fx_device.serial) == ('FF1', 'SN654321')
+    assert [(entry.sequence, entry.change) for entry in tray.changes_since(0)] == [
+        (1, TrayChange.MOVED),
+        (2, TrayChange.UPDATED),
+    ]
+    assert [entry.change for entry in tray.changes_since(1)] == [TrayChange.UPDATED]
+    with pytest.raises(ValueError, match=re.escape('Attribute cannot be updated (position).')):
+        tray.update_device(fx_device, position=Position(column=0, row=0))
+    with pytest.raises(ValueError, match='Invalid serial'):
+        tray.update_device(fx_device, corner=Corner.SS, serial='bad!')
+    assert (fx_device.name, fx_device.corner, fx_device.serial) == ('FF1', Corner.FF, 'SN654321')
+    assert len(changes) == 2
+    tray.remove_device(fx_device)
+    with pytest.raises(ValueError, match='not found in tray'):
+        tray.move_device(fx_device, Position(column=0, row=0))
+    assert journal.sequence == 3
+
+
+def test_tray_snapshot(fx_device: Device) -> None:
+    """Test the snapshot keeps the devices of the tray when it was taken."""
+    other = Device(
+        number=2,
+        product='ProductX',
+        die='A0',
+        package='R0',
+        serial='SN123457',
+        corner=Corner.SS,
+        position=Position(column=0, row=0),
+    )
+    tray = Tray(name='tray', number=1, product='ProductX', devices=[fx_device, other], max_column=3, max_row=3)
+    snapshot = tray.snapshot()
+    assert snapshot.is_snapshot
+    assert not tray.is_snapshot
+    assert snapshot.devices == tray.devices
+    assert snapshot.snapshot() is snapshot
+    tray.move_device(fx_device, Position(column=2, row=2))
+    tray.update_device(fx_device, serial='SN999999')
+    second = tray.snapshot()
+    tray.remove_device(other)
+    assert [device.name for device in tray.devices] == ['SS1']
+    assert [device.name for device in snapshot.devices] == ['SS1', 'SS2']
+    assert snapshot.devices[0] is not fx_device
+    assert snapshot.devices[0].position == Position(column=1, row=2)
+    assert snapshot.devices[0].serial == 'SN123456'
+    assert snapshot.devices[1] is other
+    assert second.devices == [fx_device, other]
+    assert second.devices[0].serial == 'SN999999'
+    with pytest.raises(ValueError, match='is a read-only snapshot'):
+        snapshot.add_device(other)
+
+
+def test_tray_snapshot_devices_read_only(fx_device: Device) -> None:
+    """Test the devices of a snapshot cannot be changed in place."""
+    tray = Tray(name='tray', number=1, product='ProductX', devices=[fx_device], max_column=3, max_row=3)
+    snapshot = tray.snapshot()
+    devices = snapshot.devices
+    changes: list[Callable[[], object]] = [
+        lambda: devices.append(fx_device),
+        lambda: devices.extend([fx_device]),
+        lambda: devices.pop(),
+        lambda: devices.clear(),
+        lambda: devices.__setitem__(0, fx_device),
+        lambda: devices.__delitem__(0),
+    ]
+    for change in changes:
+        with pytest.raises(ValueError, match='Devices of a read-only snapshot cannot be changed'):
+            change()
+    assert tray.devices == [fx_device]
+    assert copy.copy(devices) == devices
+    copied = snapshot.devices.copy()
+    copied.append(fx_device)
+    assert len(snapshot.devices) == 1
+    tray.move_device(fx_device, Position(column=0, row=0))
+    assert snapshot.devices[0] is not fx_device
+    assert snapshot.devices[0].position == Position(column=1, row=2)
+    assert pickle.loads(pickle.dumps(snapshot)).devices[0].position == Position(column=1, row=2)  # noqa: S301
+
+
+def test_tray_snapshot_devices_changed_directly(fx_device: Device) -> None:
+    """Test changing the devices list of the tray after a snapshot does not change the snapshot."""
+    tray = Tray(name='tray', number=1, product='ProductX', devices=[fx_device], max_column=3, max_row=3)
+    snapshot = tray.snapshot()
+    tray.devices.append(copy.copy(fx_device))
+    tray.devices.pop(0)
+    assert len(tray.devices) == 1
+    assert tray.devices[0] is not fx_device
+    assert snapshot.devices == [fx_device]
+    assert snapshot.devices[0] is fx_device
+
+
+def test_tray_snapshots_kept(fx_device: Device) -> None:
+    """Test every snapshot still alive keeps the devices of the tray when it was taken."""
+    other = Device(
+        number=2,
+        product='ProductX',
+        die='A0',
+        package='R0',
+        serial='SN123457',
+        corner=Corner.SS,
+        position=Position(column=0, row=0),
+    )
+    tray = Tray(name='tray', number=1, product='ProductX', devices=[fx_device, other], max_column=3, max_row=3)
+    first = tray.snapshot()
+    tray.move_device(fx_device, Position(column=2, row=2))
+    second = tray.snapshot()
+    tray.move_device(other, Position(column=1, row=2))
+    tray.update_device(fx_device, die='B1')
+    assert [device.position for device in first.devices] == [Position(column=1, row=2), Position(column=0, row=0)]
+    assert [device.position for device in second.devices] == [Position(column=2, row=2), Position(column=0, row=0)]
+    assert [device.die for device in first.devices] == ['A0', 'A0']
+    assert [device.die for device in second.devices] == ['A0', 'A0']
+    assert first.devices[1] is second.devices[1]
+    assert [device.position for device in tray.devices] == [Position(column=2, row=2), Position(column=1, row=2)]
+
+
+def test_tray_read_during_change(fx_device: Device) -> None:
+    """Test a listener reading the tray during a change sees the changed devices."""
+    tray = Tray(name='tray', number=1, product='ProductX', devices=[], max_column=3, max_row=3)
+    counts = []
+
+    def listener(
+        tray: Tray,
+        change: TrayChange,  # noqa: ARG001
+        device: Device,  # noqa: ARG001
+        previous: Mapping[str, object],  # noqa: ARG001
+    ) -> None:
+        counts.append(tray.read(len))
+
+    tray.subscribe(listener)
+    tray.add_device(fx_device)
+    assert counts == [1]
+    assert tray.get_tray().iloc[2, 1] == fx_device.name
+
+
+def test_get_tray_grid() -> None:
+    """Test the get_tray method places the devices, ignoring those out of the tray."""
+    devices = [
+        Device(
+            number=number,
+            product='ProductX',
+            die='A0',
+            package='R0',
+            serial='SN123456',
+            corner=Corner.SS,
+            position=position,
+        )
+        for number, position in enumerate(
+            [
+                Position(column=2, row=1),
+                Position(column=0, row=0),
+                Position(column=2, row=1),
+                Position(column=3, row=0),
+            ],
+            start=1,
+        )
+    ]
+    tray = Tray(name='tray', number=1, product='ProductX', devices=devices, max_column=3, max_row=2)
+    rows, columns, names = tray.get_grid_coordinates()
+    assert rows.tolist() == [0, 1]
+    assert columns.tolist() == [0, 2]
+    assert names.tolist() == ['SS2', 'SS1']
+    tray_df = tray.get_tray()
+    assert tray_df.shape == (2, 3)
+    assert tray_df.columns.equals(pd.Index([0, 1, 2]))
+    assert tray_df.to_numpy().tolist() == [['SS2', '', ''], ['', '', 'SS1']]
+
+
+def test_tray_diff(fx_tray: Tray) -> None:
+    """Test the diff method of the Tray class."""
+    device = fx_tray.devices[0]
+    moved = Device(
+        number=device.number,
+        product=device.product,
+        die=device.die,
+        package=device.package,
+        serial=device.serial,
+        corner=device.corner,
+        position=Position(column=0, row=1),
+    )
+    other = Tray(name='tray', number=1, product='ProductX', devices=[moved], max_column=1, max_row=2)
+    result = fx_tray.diff(other)
+    assert [move.device for move in result.moved] == [moved]
+    assert result.removed == fx_tray.devices[1:]
+    assert result.added == []
+    assert fx_tray.diff(fx_tray).is_empty
@@ -1,16 +1,456 @@
 """Tests Trays."""
 
+from __future__ import annotations
+
+import copy
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from e_lims_core.utils.dut.device import Corner, Device, Position
+from e_lims_core.utils.dut.tray import Tray, TrayChange
 from e_lims_core.utils.dut.trays import Trays
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix
 
 
 def test_trays_export_csv(fx_trays: Trays) -> None:
     """Test the export_csv method of the Trays class."""
+    # The trays of the fixture share their name, a single one is kept, see test_trays_export_csv_collisions.
+    fx_trays.remove_tray(fx_trays.trays[0])
     fx_trays.export_csv()
     for tray in fx_trays.trays:
         with fx_trays.file_props.path / f'{tray.name}.csv' as f:
             assert f.read_text() == ',0\n0,SS1\n1,SS2\n'
 
 
+def test_trays_export_csv_collisions(fx_trays: Trays) -> None:
+    """Test the export_csv method refuses to write several trays to the same file."""
+    with pytest.raises(ValueError, match='tray_productx_1, tray_productx_1: collide as'):
+        fx_trays.export_csv()
+    assert not (fx_trays.file_props.path / 'tray_productx_1.csv').exists()
+
+
+def test_trays_export_csv_keeps_file_props(fx_trays: Trays) -> None:
+    """Test the export_csv method does not rename the file properties."""
+    fx_trays.remove_tray(fx_trays.trays[0])
+    fx_trays.export_csv()
+    assert fx_trays.file_props.name == 'test_trays'
+
+
+def test_trays_plan_files(fx_trays: Trays) -> None:
+    """Test the plan_files method plans one file per tray and reports the shared names."""
+    plan = fx_trays.plan_files(FileSuffix.XLSX)
+    name = fx_trays.trays[0].name
+    assert plan.targets == {name: fx_trays.file_props.path / f'{name}.xlsx'}
+    assert plan.collisions == {fx_trays.file_props.path / f'{name}.xlsx': [name, name]}
+
+
 def test_trays_export_excel(fx_trays: Trays) -> None:
     """Test the export_excel method of the Trays class."""
     fx_trays.export_excel()
+
+
+@pytest.fixture()
+def fx_query_trays(tmp_path: Path) -> Trays:
+    """Fixture for creating trays with mixed corners and dies."""
+    trays = [
+        Tray(
+            name='tray',
+            number=number,
+            product=product,
+            devices=[
+                Device(
+                    number=index + 1,
+                    product=product,
+                    die=die,
+                    package='R0',
+                    serial=f'SN{number}{index}',
+                    corner=corner,
+                    position=Position(column=index, row=0),
+                )
+                for index, (corner, die) in enumerate([(Corner.SS, 'A0'), (Corner.FF, 'B3'), (Corner.FF, 'A0')])
+            ],
+            max_column=3,
+            max_row=1,
+        )
+        for number, product in [(1, 'ProductX'), (2, 'ProductY')]
+    ]
+    return Trays(trays, FileProps(path=tmp_path, name='test_trays', suffix=FileSuffix.CSV))
+
+
+def test_trays_query(fx_query_trays: Trays) -> None:
+    """Test the query method of the Trays class."""
+    assert [device.serial for device in fx_query_trays.query(corner=Corner.FF, die='B3')] == ['SN11', 'SN21']
+    assert [device.serial for device in fx_query_trays.query(corner=Corner.FF, product='ProductY')] == [
+        'SN21',
+        'SN22',
+    ]
+    assert fx_query_trays.query(die='Z9') == []
+    assert len(fx_query_trays.query()) == 6
+
+
+def test_trays_query_invalidated_on_change(fx_query_trays: Trays) -> None:
+    """Test the query indexes follow the changes of the trays."""
+    tray = fx_query_trays.trays[0]
+    assert len(fx_query_trays.query(die='B3')) == 2
+    tray.remove_device(tray.devices[1])
+    assert [device.serial for device in fx_query_trays.query(die='B3')] == ['SN21']
+    fx_query_trays.remove_tray(fx_query_trays.trays[1])
+    assert fx_query_trays.query(die='B3') == []
+    tray.add_device(
+        Device(
+            number=4,
+            product='ProductX',
+            die='B3',
+            package='R1',
+            serial='SN13',
+            corner=Corner.TT,
+            position=Position(column=1, row=0),
+        )
+    )
+    assert [device.serial for device in fx_query_trays.query(die='B3', package='R1')] == ['SN13']
+
+
+def test_trays_query_updated_incrementally(fx_query_trays: Trays) -> None:
+    """Test the query indexes follow the changes of the trays in tray order, as rebuilt ones."""
+    first, second = fx_query_trays.trays
+    assert len(fx_query_trays.query()) == 6
+    first.add_device(
+        Device(
+            number=4,
+            product='ProductX',
+            die='B3',
+            package='R0',
+            serial='SN13',
+            corner=Corner.FF,
+            position=Position(column=0, row=0),
+        )
+    )
+    first.update_device(first.devices[0], die='B3', corner=Corner.FF)
+    second.update_device(second.devices[1], die='A0')
+    first.move_device(first.devices[1], Position(column=1, row=0))
+    assert [device.serial for device in fx_query_trays.query(corner=Corner.FF, die='B3')] == ['SN10', 'SN11', 'SN13']
+    assert [device.serial for device in fx_query_trays.query(die='A0')] == ['SN12', 'SN20', 'SN21', 'SN22']
+    fx_query_trays.invalidate()
+    assert [device.serial for device in fx_query_trays.query(die='A0')] == ['SN12', 'SN20', 'SN21', 'SN22']
+    assert [device.serial for device in fx_query_trays.query(corner=Corner.FF)] == [
+        'SN10',
+        'SN11',
+        'SN12',
+        'SN13',
+        'SN21',
+        'SN22',
+    ]
+
+
+def test_trays_query_detects_direct_changes(fx_query_trays: Trays) -> None:
+    """Test the query indexes are rebuilt after devices or trays are added or removed directly."""
+    first, second = fx_query_trays.trays
+    assert len(fx_query_trays.query(corner=Corner.FF)) == 4
+    first.devices.append(
+        Device(
+            number=4,
+            product='ProductX',
+            die='B3',
+            package='R0',
+            serial='SN13',
+            corner=Corner.FF,
+            position=Position(column=0, row=0),
+        )
+    )
+    assert [device.serial for device in fx_query_trays.query(die='B3')] == ['SN11', 'SN13', 'SN21']
+    second.devices.pop()
+    assert [device.serial for device in fx_query_trays.query(corner=Corner.FF)] == ['SN11', 'SN12', 'SN13', 'SN21']
+    fx_query_trays.trays.remove(first)
+    assert [device.serial for device in fx_query_trays.query()] == ['SN20', 'SN21']
+
+
+def test_trays_locate(fx_query_trays: Trays) -> None:
+    """Test the locate method of the Trays class."""
+    first, second = fx_query_trays.trays
+    assert fx_query_trays.locate('SN21') == [(second, Position(column=1, row=0))]
+    assert fx_query_trays.locate('Unknown') == []
+    device = Device(
+        number=4,
+        product='ProductX',
+        die='A0',
+        package='R0',
+        serial='SN21',
+        corner=Corner.TT,
+        position=Position(column=2, row=0),
+    )
+    first.add_device(device)
+    assert fx_query_trays.locate('SN21') == [(second, Position(column=1, row=0)), (first, Position(column=2, row=0))]
+    fx_query_trays.remove_tray(second)
+    assert fx_query_trays.locate('SN21') == [(first, Position(column=2, row=0))]
+    first.remove_device(device)
+    assert fx_query_trays.locate('SN21') == []
+
+
+def test_trays_locate_detects_direct_changes(fx_query_trays: Trays) -> None:
+    """Test the serial and name indexes are rebuilt after devices or trays are added or removed directly."""
+    first, second = fx_query_trays.trays
+    assert fx_query_trays.locate('SN13') == []
+    device = Device(
+        number=4,
+        product='ProductX',
+        die='A0',
+        package='R0',
+        serial='SN13',
+        corner=Corner.TT,
+        position=Position(column=2, row=0),
+    )
+    first.devices.append(device)
+    assert fx_query_trays.locate('SN13') == [(first, Position(column=2, row=0))]
+    assert fx_query_trays.found_devices_per_name('TT4') == [(first, device)]
+    second.devices.clear()
+    assert fx_query_trays.locate('SN21') == []
+    fx_query_trays.trays.remove(first)
+    assert fx_query_trays.found_devices_per_name('TT4') == []
+
+
+def test_trays_found_devices_per_name(fx_query_trays: Trays) -> None:
+    """Test the found_devices_per_name method of the Trays class."""
+    first, second = fx_query_trays.trays
+    assert fx_query_trays.found_devices_per_name('FF2') == [(first, first.devices[1]), (second, second.devices[1])]
+    assert fx_query_trays.found_devices_per_name('TT9') == []
+
+
+def test_trays_validate(fx_query_trays: Trays) -> None:
+    """Test the validate method of the Trays class."""
+    report = fx_query_trays.validate(max_workers=1)
+    assert [issue.message for issue in report.issues] == [
+        'Device name SS1 found in multiple trays.',
+        'Device name FF2 found in multiple trays.',
+        'Device name FF3 found in multiple trays.',
+    ]
+
+
+def test_trays_get_devices(fx_query_trays: Trays) -> None:
+    """Test the get_devices method of the Trays class."""
+    devices = fx_query_trays.get_devices()
+    assert devices['serial'].tolist() == ['SN10', 'SN11', 'SN12', 'SN20', 'SN21', 'SN22']
+    assert devices['tray_number'].tolist() == [1, 1, 1, 2, 2, 2]
+    assert devices['column'].tolist() == [0, 1, 2, 0, 1, 2]
+    assert list(devices['product'].cat.categories) == ['ProductX', 'ProductY']
+
+
+def test_trays_get_devices_view(fx_query_trays: Trays) -> None:
+    """Test the get_devices_view method of the Trays class."""
+    view = fx_query_trays.get_devices_view()
+    assert fx_query_trays.get_devices_view() is view
+    assert list(view.index.names) == ['tray', 'row', 'column']
+    assert view.loc[('tray_producty_2', 0, 1), 'serial'] == 'SN21'
+    first, _ = fx_query_trays.trays
+    first.remove_device(first.devices[0])
+    view = fx_query_trays.get_devices_view()
+    assert len(view) == 5
+    assert ('tray_productx_1', 0, 0) not in view.index
+
+
+@pytest.mark.parametrize(
+    ('group_by', 'expected_trays'),
+    [
+        (None, [['SS1', 'FF2', 'SS3', 'FF4'], ['SS5']]),
+        ('corner', [['SS1', 'SS3', 'SS5'], ['FF2', 'FF4']]),
+    ],
+)
+def test_trays_pack(tmp_path: Path, group_by: str | None, expected_trays: list[list[str]]) -> None:
+    """Test the pack method of the Trays class."""
+    devices = [
+        Device(
+            number=number,
+            product='ProductX',
+            die='A0',
+            package='R0',
+            serial=f'SN{number}',
+            corner=Corner.SS if number % 2 else Corner.FF,
+            position=Position(column=0, row=0),
+        )
+        for number in range(1, 6)
+    ]
+    file_props = FileProps(path=tmp_path, name='test_trays', suffix=FileSuffix.CSV)
+    trays = Trays.pack(devices, 'ProductX', file_props, max_column=2, max_row=2, group_by=group_by)
+    assert [[device.name for device in tray.devices] for tray in trays.trays] == expected_trays
+    assert [tray.number for tray in trays.trays] == [1, 2]
+    for tray in trays.trays:
+        tray.check_tray_size()
+        tray.check_device_position()
+        tray.check_device_position_in_tray()
+        assert [device.position for device in tray.devices] == [
+            Position(column=0, row=0),
+            Position(column=1, row=0),
+            Position(column=0, row=1),
+            Position(column=1, row=1),
+        ][: len(tray.devices)]
+
+
+def test_trays_pack_invalid(tmp_path: Path) -> None:
+    """Test the pack method of the Trays class rejects invalid inputs."""
+    device = Device(
+        number=1,
+        product='ProductX',
+        die='A0',
+        package='R0',
+        serial='SN1',
+        corner=Corner.SS,
+        position=Position(column=0, row=0),
+    )
+    file_props = FileProps(path=tmp_path, name='test_trays', suffix=FileSuffix.CSV)
+    with pytest.raises(ValueError, match='cannot be packed with product ProductY'):
+        Trays.pack([device], 'ProductY', file_props)
+    with pytest.raises(ValueError, match='Unknown group attribute: serial'):
+        Trays.pack([device], 'ProductX', file_props, group_by='serial')
+
+
+def test_trays_diff(fx_query_trays: Trays, tmp_path: Path) -> None:
+    """Test the diff method of the Trays class."""
+    first, second = fx_query_trays.trays
+    moved = Device(
+        number=3,
+        product='ProductX',
+        die='A0',
+        package='R0',
+        serial='SN12',
+        corner=Corner.FF,
+        position=Position(column=0, row=0),
+    )
+    first_after = Tray(name='tray', number=1, product='ProductX', devices=[moved], max_column=3, max_row=1)
+    other = Trays([first_after], FileProps(path=tmp_path, name='test_trays', suffix=FileSuffix.CSV))
+    diffs = fx_query_trays.diff(other)
+    assert list(diffs) == [first.name, second.name]
+    assert diffs[first.name].removed == first.devices[:2]
+    assert [move.device for move in diffs[first.name].moved] == [moved]
+    assert diffs[second.name].removed == second.devices
+    assert fx_query_trays.diff(fx_query_trays) == {}
+
+
+def test_trays_changes_since(fx_query_trays: Trays) -> None:
+    """Test the changes_since method of the Trays class."""
+    first, second = fx_query_trays.trays
+    assert fx_query_trays.journal is None
+    with pytest.raises(ValueError, match='Journal not enabled'):
+        fx_query_trays.changes_since(0)
+    journal = fx_query_trays.enable_journal()
+    assert fx_query_trays.enable_journal() is journal
+    assert fx_query_trays.changes_since(0) == []
+    first.move_device(first.devices[0], Position(column=0, row=1))
+    first.update_device(first.devices[1], serial='SN99')
+    assert fx_query_trays.locate('SN99') == [(first, Position(column=1, row=0))]
+    assert [entry.previous for entry in fx_query_trays.changes_since(0)] == [
+        {'position': Position(column=0, row=0)},
+        {'serial': 'SN11', 'name': 'FF2'},
+    ]
+    fx_query_trays.remove_tray(second)
+    changes = fx_query_trays.changes_since(2)
+    assert [(entry.tray, entry.change, entry.previous) for entry in changes] == [
+        (second.name, TrayChange.REMOVED, {})
+    ] * 3
+    assert [entry.sequence for entry in changes] == [3, 4, 5]
+    assert journal.sequence == 5
+
+
+def test_trays_snapshot(fx_query_trays: Trays) -> None:
+    """Test the snapshot method of the Trays class."""
+    snapshot = fx_query_trays.snapshot()
+    first, _ = fx_query_trays.trays
+    first.update_device(first.devices[0], serial='SN99')
+    assert all(tray.is_snapshot for tray in snapshot.trays)
+    assert snapshot.file_props is not fx_query_trays.file_props
+    assert snapshot.locate('SN10') == [(snapshot.trays[0], Position(column=0, row=0))]
+    assert snapshot.locate('SN99') == []
+    assert list(snapshot.diff(fx_query_trays)) == [first.name]
+
+
+def test_trays_get_devices_keeps_snapshots(fx_query_trays: Trays) -> None:
+    """Test reading the devices of the trays does not stop protecting the snapshots taken before."""
+    snapshot = fx_query_trays.snapshot()
+    first, _ = fx_query_trays.trays
+    first.move_device(first.devices[0], Position(column=5, row=5))
+    fx_query_trays.get_devices()
+    first.move_device(first.devices[1], Position(column=6, row=6))
+    assert [device.position for device in snapshot.trays[0].devices] == [
+        Position(column=0, row=0),
+        Position(column=1, row=0),
+        Position(column=2, row=0),
+    ]
+
+
+def test_trays_concurrent_changes(tmp_path: Path) -> None:
+    """Test the trays stay consistent when many threads change them while others read them."""
+    trays = Trays(
+        [
+            Tray(name='tray', number=number, product='ProductX', devices=[], max_column=10, max_row=10)
+            for number in (1, 2)
+        ],
+        FileProps(path=tmp_path, name='test_trays', suffix=FileSuffix.CSV),
+    )
+    trays.enable_journal()
+    trays.locate('SN0')
+
+    def station(worker: int) -> None:
+        tray = trays.trays[worker % 2]
+        for index in range(25):
+            device = Device(
+                number=worker * 25 + index + 1,
+                product='ProductX',
+                die='A0',
+                package='R0',
+                serial=f'SN{worker}T{index}',
+                corner=Corner.SS,
+                position=Position(column=index % 10, row=worker),
+            )
+            tray.add_device(device)
+            tray.move_device(device, Position(column=index % 10, row=worker + 4))
+            tray.get_tray()
+            trays.locate(device.serial)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(station, range(4)))
+    assert sum(len(tray.devices) for tray in trays.trays) == 100
+    assert [entry.sequence for entry in trays.changes_since(0)] == list(range(1, 201))
+    assert all(len(trays.locate(f'SN{worker}T{index}')) == 1 for worker in range(4) for index in range(25))
+    assert len(trays.get_devices_view()) == 100
+
+
+def test_trays_change_while_locked(fx_query_trays: Trays) -> None:
+    """Test a change of a tray does not wait for a reader holding the lock of the trays, it is applied later."""
+    first, _ = fx_query_trays.trays
+    assert len(fx_query_trays.query(corner=Corner.FF)) == 4
+    with fx_query_trays._lock:  # noqa: SLF001
+        writer = threading.Thread(target=first.update_device, args=(first.devices[0],), kwargs={'corner': Corner.FF})
+        writer.start()
+        writer.join(timeout=5)
+        assert not writer.is_alive()
+    assert [device.serial for device in fx_query_trays.query(corner=Corner.FF)] == [
+        'SN10',
+        'SN11',
+        'SN12',
+        'SN21',
+        'SN22',
+    ]
+    assert fx_query_trays.found_devices_per_name('FF1') == [(first, first.devices[0])]
+
+
+def test_trays_copy(fx_query_trays: Trays) -> None:
+    """Test the copied and unpickled trays follow the changes of their own trays."""
+    for other in (copy.deepcopy(fx_query_trays), pickle.loads(pickle.dumps(fx_query_trays))):  # noqa: S301
+        first, _ = other.trays
+        first.update_device(first.devices[0], serial='SN99')
+        assert other.locate('SN99') == [(first, Position(column=0, row=0))]
+        assert fx_query_trays.locate('SN99') == []
+
+
+def test_trays_copy_query(fx_query_trays: Trays) -> None:
+    """Test the copied and unpickled trays query their own devices after changes."""
+    assert len(fx_query_trays.query(corner=Corner.FF)) == 4
+    for other in (copy.deepcopy(fx_query_trays), pickle.loads(pickle.dumps(fx_query_trays))):  # noqa: S301
+        first, second = other.trays
+        first.remove_device(first.devices[1])
+        second.update_device(second.devices[1], corner=Corner.SS)
+        assert [device.serial for device in other.query(corner=Corner.FF)] == ['SN12', 'SN22']
+        assert [device.serial for device in other.query(corner=Corner.SS)] == ['SN10', 'SN20', 'SN21']
+    assert len(fx_query_trays.query(corner=Corner.FF)) == 4
@@ -0,0 +1,90 @@
+"""Tests validation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from e_lims_core.utils.dut.device import Corner
+from e_lims_core.utils.dut.tray import Tray, tray_layout
+from e_lims_core.utils.dut.validation import (
+    ValidationIssue,
+    ValidationReport,
+    check_tray,
+    check_tray_layout,
+    check_trays,
+    validate_trays,
+)
+from tests.utils.dut.conftest import INVALID_DEVICES
+
+if TYPE_CHECKING:
+    from tests.conftest import TrayFactory
+
+
+def test_check_tray(fx_make_tray: TrayFactory) -> None:
+    """Test the check_tray function collects every failed check."""
+    assert check_tray(fx_make_tray(1, ['SN1', 'SN2'])) == []
+    tray = Tray(name='tray', number=1, product='ProductX', devices=INVALID_DEVICES, max_column=1, max_row=2)
+    messages = check_tray(tray)
+    assert len(messages) == 4
+    assert messages[0].startswith('Multiple identical name found')
+
+
+def test_check_tray_layout(fx_make_tray: TrayFactory) -> None:
+    """Test the check_tray_layout function finds the failures of check_tray on the compact layout."""
+    tray = Tray(name='tray', number=1, product='ProductX', devices=INVALID_DEVICES, max_column=1, max_row=2)
+    layout = tray_layout(tray)
+    assert layout[:2] == (1, 2)
+    assert layout[2][0] == ('SS1', 'ProductX', 1, 1)
+    assert len(check_tray_layout(layout)) == len(check_tray(tray))
+    assert check_tray_layout(tray_layout(fx_make_tray(1, ['SN1', 'SN2']))) == []
+
+
+def test_check_trays(fx_make_tray: TrayFactory) -> None:
+    """Test the check_trays function detects the cross-tray issues."""
+    first = fx_make_tray(1, ['SN1', 'SN2'])
+    second = fx_make_tray(1, ['SN2'], corner=Corner.FF)
+    issues = check_trays([first, second])
+    assert issues == [
+        ValidationIssue(['tray_productx_1', 'tray_productx_1'], 'Serial SN2 found in multiple trays.'),
+        ValidationIssue(['tray_productx_1', 'tray_productx_1'], 'Tray number 1 reused for product ProductX.'),
+        ValidationIssue(['tray_productx_1', 'tray_productx_1'], 'Tray names collide as sheet name tray_productx_1.'),
+    ]
+
+
+def test_check_trays_device_name_and_sheet_name(fx_make_tray: TrayFactory) -> None:
+    """Test the check_trays function detects duplicated device names and long tray names."""
+    first = fx_make_tray(1, ['SN1'])
+    second = fx_make_tray(2, ['SN2'])
+    first.name = f'{"x" * 31}_1'
+    second.name = f'{"X" * 31}_2'
+    messages = [issue.message for issue in check_trays([first, second])]
+    assert messages == [
+        'Device name SS1 found in multiple trays.',
+        f'Tray names collide as sheet name {"x" * 31}.',
+    ]
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_validate_trays(max_workers: int, fx_make_tray: TrayFactory) -> None:
+    """Test the validate_trays function consolidates the per-tray and cross-tray issues."""
+    invalid = Tray(name='tray', number=3, product='ProductX', devices=INVALID_DEVICES, max_column=1, max_row=2)
+    report = validate_trays(
+        [fx_make_tray(1, ['SN1']), fx_make_tray(2, ['SN2'], corner=Corner.FF), invalid], max_workers
+    )
+    assert not report.is_valid
+    assert [issue.trays for issue in report.issues[:4]] == [['tray_productx_3']] * 4
+    assert report.issues[4] == ValidationIssue(
+        ['tray_productx_1', 'tray_productx_3'], 'Device name SS1 found in multiple trays.'
+    )
+    with pytest.raises(ValueError, match='tray_productx_3: Multiple identical name found'):
+        report.raise_for_issues()
+
+
+def test_validation_report_valid(fx_make_tray: TrayFactory) -> None:
+    """Test a report without issue is valid."""
+    report = validate_trays([fx_make_tray(1, ['SN1']), fx_make_tray(2, ['SN2'], corner=Corner.FF)])
+    assert report == ValidationReport()
+    assert report.is_valid
+    report.raise_for_issues()
@@ -7,7 +7,7 @@ import pathlib
 
 import pytest
 
-from e_lims_core.utils.files.file_props import FileProps, FileSuffix
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix, call_with_directory, ensure_directory
 from e_lims_core.utils.files.timestamp import TimeStamp
 
 
@@ -86,3 +86,64 @@ def test_fileprops_check_name_invalid_characters(mock_path: pathlib.Path, invali
         match=f'Invalid name: {invalid_name}, authorized characters are minmum 6 alphabetic, numeric, and _-',
     ):
         file_props.name = invalid_name
+
+
+def test_fileprops_file_path_cached(mock_path: pathlib.Path) -> None:
+    """Test the file path is cached until an attribute changes."""
+    file_props = FileProps(path=mock_path, name='testfile', suffix=FileSuffix.CSV)
+    assert file_props.file_path() is file_props.file_path()
+    file_props.name = 'otherfile'
+    assert file_props.file_path() == mock_path / 'otherfile.csv'
+    file_props.suffix = FileSuffix.XLSX
+    assert file_props.file_path() == mock_path / 'otherfile.xlsx'
+
+
+def test_fileprops_plan(mock_path: pathlib.Path) -> None:
+    """Test the paths of many files are planned with the shared path, suffix and timestamp."""
+    timestamp = TimeStamp(raw_time=datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc))
+    file_props = FileProps(path=mock_path, name='testfile', suffix=FileSuffix.CSV, timestamp=timestamp)
+    plan = file_props.plan(['trayone', 'TrayTwo'], FileSuffix.XLSX)
+    assert plan.targets == {
+        'trayone': mock_path / 'trayone_2024_01_02_030405.xlsx',
+        'TrayTwo': mock_path / 'traytwo_2024_01_02_030405.xlsx',
+    }
+    assert plan.collisions == {}
+    plan.raise_for_collisions()
+    assert file_props.name == 'testfile'
+
+
+def test_fileprops_plan_collisions(mock_path: pathlib.Path) -> None:
+    """Test the names differing only in case are reported as colliding."""
+    file_props = FileProps(path=mock_path, name='testfile', suffix=FileSuffix.CSV)
+    plan = file_props.plan(['trayone', 'TRAYONE', 'traytwo'])
+    assert plan.collisions == {mock_path / 'trayone.csv': ['trayone', 'TRAYONE']}
+    with pytest.raises(ValueError, match='trayone, TRAYONE: collide as'):
+        plan.raise_for_collisions()
+
+
+def test_fileprops_plan_invalid_name(mock_path: pathlib.Path) -> None:
+    """Test the planned names are validated."""
+    file_props = FileProps(path=mock_path, name='testfile', suffix=FileSuffix.CSV)
+    with pytest.raises(ValueError, match='Invalid name: tray'):
+        file_props.plan(['trayone', 'tray'])
+
+
+def test_ensure_directory_cached(mock_path: pathlib.Path) -> None:
+    """Test a directory is only created once, unless the cache is bypassed."""
+    new_path = mock_path / 'new_dir'
+    ensure_directory(new_path)
+    new_path.rmdir()
+    ensure_directory(new_path)
+    assert not new_path.exists()
+    ensure_directory(new_path, cached=False)
+    assert new_path.exists()
+
+
+def test_call_with_directory(mock_path: pathlib.Path) -> None:
+    """Test a file is written after its directory was removed, the directory is created again."""
+    new_path = mock_path / 'new_dir'
+    file_props = FileProps(path=new_path, name='testfile', suffix=FileSuffix.CSV)
+    new_path.rmdir()
+    FileProps(path=new_path, name='testfile', suffix=FileSuffix.CSV)
+    assert call_with_directory(file_props.file_path(), lambda path: path.write_text('data')) == len('data')
+    assert file_props.file_path().read_text() == 'data'
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
 
 import pytest
 
-from e_lims_core.utils.files.timestamp import TimeStamp
+from e_lims_core.utils.files.timestamp import CLOCK, Clock, TimeStamp
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import tzinfo
 
 
 @pytest.fixture()
@@ -70,3 +76,41 @@ def test_timestamp_repr(mock_timestamp: datetime) -> None:
     """Test the repr method of the TimeStamp class."""
     timestamp = TimeStamp(mock_timestamp)
     assert repr(timestamp) == '2023_10_05_143045'
+
+
+def test_timestamp_precise_stamp(mock_timestamp: datetime) -> None:
+    """Test the stamp of a precise timestamp with a sequence number."""
+    assert TimeStamp(mock_timestamp, precise=True).stamp == '2023_10_05_143045_123456'
+    assert TimeStamp(mock_timestamp, sequence=2).stamp == '2023_10_05_143045_2'
+    assert TimeStamp(mock_timestamp, precise=True, sequence=2).stamp == '2023_10_05_143045_123456_2'
+
+
+def fixed_times(*times: datetime) -> Callable[[tzinfo | None], datetime]:
+    """Create a source of time returning the given times in turn."""
+    iterator = iter(times)
+    return lambda _tz: next(iterator)
+
+
+def test_clock_sequence(mock_timestamp: datetime) -> None:
+    """Test the clock adds a sequence number to the stamps of the same second, even going backwards."""
+    later = mock_timestamp + timedelta(seconds=1)
+    clock = Clock(now=fixed_times(mock_timestamp, mock_timestamp, later - timedelta(seconds=2), later))
+    assert [clock.timestamp().stamp for _ in range(4)] == [
+        '2023_10_05_143045',
+        '2023_10_05_143045_1',
+        '2023_10_05_143045_2',
+        '2023_10_05_143046',
+    ]
+
+
+def test_clock_precise(mock_timestamp: datetime) -> None:
+    """Test a precise clock only adds a sequence number to the stamps of the same microsecond."""
+    clock = Clock(precise=True, now=fixed_times(mock_timestamp, mock_timestamp + timedelta(microseconds=1)))
+    assert [clock.timestamp().stamp for _ in range(2)] == ['2023_10_05_143045_123456', '2023_10_05_143045_123457']
+
+
+def test_clock_concurrent() -> None:
+    """Test the stamps handed out to concurrent threads are unique."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        stamps = list(executor.map(lambda _: CLOCK.timestamp().stamp, range(1000)))
+    assert len(set(stamps)) == len(stamps)
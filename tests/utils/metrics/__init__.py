@@ -0,0 +1 @@
+"""Tests metrics module."""
@@ -0,0 +1,99 @@
+"""Tests instrumentation."""
+
+from __future__ import annotations
+
+import pstats
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from e_lims_core.utils.dut.export.export2csv import Export2Csv
+from e_lims_core.utils.dut.export.export2xlsx import Export2Excel
+from e_lims_core.utils.dut.validation import validate_trays
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix
+from e_lims_core.utils.metrics.instrumentation import (
+    DISABLED_SPAN,
+    Collector,
+    Span,
+    add_hook,
+    is_enabled,
+    profile,
+    remove_hook,
+    span,
+)
+
+if TYPE_CHECKING:
+    from tests.conftest import TrayFactory
+
+
+def test_span_disabled_without_hook() -> None:
+    """Test the shared disabled span is returned while no hook is registered."""
+    assert not is_enabled()
+    with span('phase', tray='tray') as current:
+        current.record_bytes(10)
+    assert current is DISABLED_SPAN
+    assert not current.enabled
+    assert current.bytes_written == 0
+
+
+def test_span_calls_hooks() -> None:
+    """Test a finished span is passed to the registered hooks."""
+    spans: list[Span] = []
+    add_hook(spans.append)
+    try:
+        assert is_enabled()
+        with span('phase', tray='tray') as current:
+            current.record_bytes(10)
+    finally:
+        remove_hook(spans.append)
+    assert not is_enabled()
+    assert spans == [current]
+    assert current.name == 'phase'
+    assert current.attributes == {'tray': 'tray'}
+    assert current.duration >= 0
+    assert current.bytes_written == 10
+
+
+def test_collector_aggregates_spans() -> None:
+    """Test the collector aggregates the counts, durations and bytes per phase."""
+    with Collector() as collector:
+        for count in (1, 2):
+            with span('phase') as current:
+                current.record_bytes(count)
+    report = collector.report()
+    assert report['phase']['count'] == 2
+    assert report['phase']['bytes_written'] == 3
+    assert report['phase']['minimum'] <= report['phase']['mean'] <= report['phase']['maximum']
+    assert not is_enabled()
+
+
+def test_collector_export_phases(tmp_path: Path, fx_make_tray: TrayFactory) -> None:
+    """Test the exports and the validation report their phases."""
+    tray = fx_make_tray()
+    with Collector() as collector:
+        Export2Csv([tray], FileProps(path=tmp_path, name='testfile', suffix=FileSuffix.CSV)).export()
+        Export2Excel([tray], FileProps(path=tmp_path, name='testfile', suffix=FileSuffix.XLSX)).export()
+        validate_trays([tray])
+    phases = collector.report()
+    assert set(phases) == {
+        'tray.get_tray',
+        'export2csv.generate',
+        'export2csv.write',
+        'export2xlsx.generate',
+        'export2xlsx.save',
+        'tray2xlsx.title',
+        'tray2xlsx.columns',
+        'tray2xlsx.rows',
+        'tray2xlsx.data',
+        'validation.trays',
+        'validation.cross',
+    }
+    assert phases['export2csv.write']['bytes_written'] == (tmp_path / f'{tray.name}.csv').stat().st_size
+    assert phases['export2xlsx.save']['bytes_written'] == (tmp_path / 'testfile.xlsx').stat().st_size
+
+
+def test_profile(tmp_path: Path, fx_make_tray: TrayFactory) -> None:
+    """Test the profile capture dumps readable statistics."""
+    path = tmp_path / 'profile.prof'
+    with profile(path):
+        fx_make_tray().get_tray()
+    assert pstats.Stats(str(path)).get_stats_profile().func_profiles
@@ -0,0 +1 @@
+"""Tests validators module."""
@@ -0,0 +1,106 @@
+"""Tests validation policy."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from e_lims_core.utils.dut.tray import Tray
+from e_lims_core.utils.files.file_props import FileProps, FileSuffix
+from e_lims_core.utils.validators.policy import ValidationPolicy, current_policy, validate, validation_policy
+
+if TYPE_CHECKING:
+    from tests.conftest import DeviceFactory
+
+
+def test_default_policy_is_strict(fx_make_device: DeviceFactory) -> None:
+    """Test the checks run immediately outside any block."""
+    assert current_policy() is ValidationPolicy.STRICT
+    with pytest.raises(ValueError, match='Invalid product'):
+        fx_make_device(product='Product!')
+
+
+def test_policy_from_value() -> None:
+    """Test the policy can be given by its value and is restored on exit."""
+    with validation_policy('trusted'):
+        assert current_policy() is ValidationPolicy.TRUSTED
+        with validation_policy(ValidationPolicy.STRICT):
+            assert current_policy() is ValidationPolicy.STRICT
+        assert current_policy() is ValidationPolicy.TRUSTED
+    assert current_policy() is ValidationPolicy.STRICT
+
+
+def test_policy_unknown() -> None:
+    """Test an unknown policy is rejected."""
+    with pytest.raises(ValueError, match='lenient'), validation_policy('lenient'):
+        pass
+
+
+def test_trusted_skips_checks(tmp_path: Path, fx_make_device: DeviceFactory) -> None:
+    """Test the trusted policy skips the checks of devices, trays and file properties."""
+    with validation_policy(ValidationPolicy.TRUSTED):
+        device = fx_make_device(product='Product!')
+        tray = Tray('tray', 0, 'Product!', [device], max_column=0)
+        file_props = FileProps(tmp_path, 'abc', FileSuffix.CSV)
+    assert device.product == 'Product!'
+    assert tray.number == 0
+    assert file_props.name == 'abc'
+
+
+def test_deferred_valid(fx_make_device: DeviceFactory) -> None:
+    """Test the deferred policy accepts valid values."""
+    with validation_policy(ValidationPolicy.DEFERRED):
+        devices = [fx_make_device(serial=f'SN{index}') for index in range(10)]
+        Tray('tray', 1, 'ProductX', devices)
+    assert devices[-1].serial == 'SN9'
+
+
+def test_deferred_reports_every_failure(tmp_path: Path, fx_make_device: DeviceFactory) -> None:
+    """Test the deferred policy raises once, at the end of the block, with every distinct failure."""
+    with pytest.raises(ValueError, match='Invalid product: Product!') as error:  # noqa: PT012
+        with validation_policy(ValidationPolicy.DEFERRED):
+            fx_make_device(product='Product!')
+            fx_make_device(product='Product!', die='a0')
+            Tray('tray', 0, 'ProductX', [])
+            FileProps(tmp_path, 'abc', FileSuffix.CSV)
+        pytest.fail('The block should raise on exit.')
+    messages = str(error.value).splitlines()
+    assert len(messages) == 4
+    assert any(message.startswith('Invalid die: a0') for message in messages)
+    assert 'The tray number must be greater than 0.' in messages
+    assert any(message.startswith('Invalid name: abc') for message in messages)
+
+
+def test_deferred_dropped_on_error(fx_make_device: DeviceFactory) -> None:
+    """Test the collected checks are dropped when the block raises."""
+
+    def load() -> None:
+        with validation_policy(ValidationPolicy.DEFERRED):
+            fx_make_device(product='Product!')
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        load()
+
+
+def test_deferred_checks_each_value_once() -> None:
+    """Test the deferred policy runs a check once per distinct value."""
+    calls: list[str] = []
+    with validation_policy(ValidationPolicy.DEFERRED):
+        for value in ['a', 'b', 'a', 'a']:
+            validate(calls.append, value)
+        assert calls == []
+    assert calls == ['a', 'b']
+
+
+def test_policy_is_per_thread() -> None:
+    """Test a policy set in a thread does not leak to the other threads."""
+    policies = []
+    with validation_policy(ValidationPolicy.TRUSTED):
+        thread = threading.Thread(target=lambda: policies.append(current_policy()))
+        thread.start()
+        thread.join()
+    assert policies == [ValidationPolicy.STRICT]
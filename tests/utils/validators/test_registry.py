@@ -0,0 +1,87 @@
+"""Tests validator registry."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from e_lims_core.utils.dut.device import Corner, Device, Position
+from e_lims_core.utils.dut.tray import Tray
+from e_lims_core.utils.validators.registry import VALIDATORS, Validator, ValidatorRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def counting(calls: list[Any]) -> Callable[[Any], bool]:
+    """Create a predicate accepting every value and recording the checked ones."""
+
+    def predicate(value: Any) -> bool:  # noqa: ANN401
+        calls.append(value)
+        return True
+
+    return predicate
+
+
+def test_validator_from_pattern() -> None:
+    """Test a pattern validator accepts the matching values and rejects the others."""
+    validator = Validator.from_pattern('code', r'^[A-Z]+$', 'Invalid code: {value}')
+    assert validator.is_valid('ABC')
+    assert not validator.is_valid('abc')
+    validator('ABC')
+    with pytest.raises(ValueError, match='Invalid code: abc'):
+        validator('abc')
+
+
+def test_validator_cache() -> None:
+    """Test a repeated value is checked once until the cache is cleared."""
+    calls: list[str] = []
+    validator = Validator('code', counting(calls), 'Invalid code: {value}', maxsize=2)
+    for value in ['a', 'a', 'b', 'a']:
+        validator(value)
+    assert calls == ['a', 'b']
+    assert validator.cache_info() == (2, 2)
+    validator.cache_clear()
+    validator('a')
+    assert calls == ['a', 'b', 'a']
+
+
+def test_validator_cache_bounded() -> None:
+    """Test the least recently used value is forgotten when the cache is full."""
+    calls: list[str] = []
+    validator = Validator('code', counting(calls), 'Invalid code: {value}', maxsize=2)
+    for value in ['a', 'b', 'c', 'a']:
+        validator(value)
+    assert calls == ['a', 'b', 'c', 'a']
+
+
+def test_validator_uncached() -> None:
+    """Test a validator without cache checks every value."""
+    calls: list[int] = []
+    validator = Validator('size', counting(calls), 'Invalid size: {value}', maxsize=0)
+    validator(1)
+    validator(1)
+    assert validator.cache_info() == (0, 0)
+    assert calls == [1, 1]
+
+
+def test_registry() -> None:
+    """Test the validators are registered once and looked up by name."""
+    registry = ValidatorRegistry()
+    validator = registry.register(Validator.from_pattern('code', r'^[A-Z]+$', 'Invalid code: {value}'))
+    assert registry['code'] is validator
+    assert list(registry) == [validator]
+    with pytest.raises(ValueError, match='Validator code already registered.'):
+        registry.register(Validator.from_pattern('code', r'^[a-z]+$', 'Invalid code: {value}'))
+    with pytest.raises(ValueError, match='Unknown validator: name'):
+        registry['name']
+
+
+def test_product_validator_shared() -> None:
+    """Test the devices and the trays share the product validator and its cache."""
+    VALIDATORS.cache_clear()
+    product = VALIDATORS['product']
+    device = Device(1, 'ProductX', 'A0', 'R0', 'SN1', Corner.SS, Position(column=1, row=1))
+    Tray('tray', 1, device.product, [device])
+    assert product.cache_info() == (1, 1)